@@ -3,9 +3,11 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
+import collections
 import enum
 import functools
 import logging
+import threading
 import urllib.parse
 
 import cachecontrol
@@ -27,6 +29,112 @@ class SessionAdapter(enum.Enum):
     NONE = None
     RETRY = 'retry'
     CACHE = 'cache'
+    RETRY_AND_CACHE = 'retry_and_cache'
+
+
+class GithubSessionPool:
+    def __init__(self):
+        '''
+        pool of sessions for github-api-clients. Sessions (and thus connection-pools and, for
+        caching session-adapters, http-caches) are shared between all api-clients created for
+        the same github-host, credentials (username), session-adapter, and tls-validation.
+
+        For each session, issued requests are counted (see `stats`).
+        '''
+        self._lock = threading.Lock()
+        self._sessions: dict[tuple, github3.session.GitHubSession] = {}
+        self._counters: dict[tuple, collections.Counter] = {}
+
+    def _create_session(
+        self,
+        hostname: str,
+        username: str,
+        session_adapter: SessionAdapter,
+        counter: collections.Counter,
+    ) -> github3.session.GitHubSession:
+        session = github3.session.GitHubSession()
+
+        if session_adapter is SessionAdapter.NONE or not session_adapter:
+            pass
+        elif session_adapter is SessionAdapter.RETRY:
+            session = http_requests.mount_default_adapter(
+                session=session,
+                flags=http_requests.AdapterFlag.RETRY,
+                max_pool_size=16, # increase with care, might cause github api "secondary-rate-limit"
+            )
+        elif session_adapter is SessionAdapter.CACHE:
+            session = cachecontrol.CacheControl(
+                session,
+                cache_etags=True,
+            )
+        elif session_adapter is SessionAdapter.RETRY_AND_CACHE:
+            session = http_requests.mount_default_adapter(
+                session=session,
+                flags=http_requests.AdapterFlag.CACHE | http_requests.AdapterFlag.RETRY,
+                max_pool_size=16,
+            )
+        else:
+            raise NotImplementedError
+
+        def count_request(response, *args, **kwargs):
+            with self._lock:
+                counter['requests'] += 1
+                if getattr(response, 'from_cache', False):
+                    counter['cache_hits'] += 1
+                if response.status_code >= 400:
+                    counter['errors'] += 1
+
+        session.hooks['response'].append(count_request)
+        # learn remaining quota passively (used for choosing credentials)
+        session.hooks['response'].append(
+            model.github.rate_limit_tracker.response_hook(
+                hostname=hostname,
+                username=username,
+            )
+        )
+
+        return session
+
+    def session(
+        self,
+        hostname: str,
+        username: str,
+        session_adapter: SessionAdapter=SessionAdapter.RETRY,
+        verify_ssl: bool=True,
+    ) -> github3.session.GitHubSession:
+        session_adapter = SessionAdapter(session_adapter)
+        key = (hostname.lower(), username, session_adapter, verify_ssl)
+
+        with self._lock:
+            if (session := self._sessions.get(key)):
+                self._counters[key]['reused'] += 1
+                return session
+
+            counter = self._counters[key] = collections.Counter()
+
+        session = self._create_session(
+            hostname=hostname,
+            username=username,
+            session_adapter=session_adapter,
+            counter=counter,
+        )
+
+        with self._lock:
+            # another thread might have created a session concurrently
+            return self._sessions.setdefault(key, session)
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            return {
+                f'{hostname}/{username} ({session_adapter.value})': {
+                    counter: counters[counter]
+                    for counter in ('requests', 'errors', 'cache_hits', 'reused')
+                }
+                for (hostname, username, session_adapter, _), counters in self._counters.items()
+            }
+
+
+session_pool = GithubSessionPool()
 
 
 def github_api_ctor(
@@ -35,6 +143,7 @@ def github_api_ctor(
     verify_ssl: bool=True,
     session_adapter: SessionAdapter=SessionAdapter.RETRY,
     cfg_factory: model.ConfigFactory=None,
+    session_pool: GithubSessionPool=session_pool,
 ):
     '''returns the appropriate github3.GitHub constructor for the given github URL
 
@@ -42,6 +151,7 @@ def github_api_ctor(
     returned with the url argument preset, thus disburdening users to differentiate
     between github.com and non-github.com cases.
 
+    Sessions are retrieved from the given session-pool (and thus shared).
     '''
     github_url = github_cfg.http_url()
 
@@ -51,24 +161,12 @@ def github_api_ctor(
     else:
         raise ValueError('failed to parse url: ' + str(github_url))
 
-    session = github3.session.GitHubSession()
-    session_adapter = SessionAdapter(session_adapter)
-
-    if session_adapter is SessionAdapter.NONE or not session_adapter:
-        pass
-    elif session_adapter is SessionAdapter.RETRY:
-        session = http_requests.mount_default_adapter(
-            session=session,
-            flags=http_requests.AdapterFlag.RETRY,
-            max_pool_size=16, # increase with care, might cause github api "secondary-rate-limit"
-        )
-    elif session_adapter is SessionAdapter.CACHE:
-        session = cachecontrol.CacheControl(
-            session,
-            cache_etags=True,
-        )
-    else:
-        raise NotImplementedError
+    session = session_pool.session(
+        hostname=hostname,
+        username=github_username,
+        session_adapter=session_adapter,
+        verify_ssl=verify_ssl,
+    )
 
     if hostname.lower() == 'github.com':
         return functools.partial(
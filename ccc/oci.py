@@ -5,6 +5,7 @@ import logging
 import requests
 
 import oci.auth as oa
+import oci.cache
 import oci.client as oc
 import oci.model
 import model.container_registry
@@ -104,7 +105,14 @@ def oci_client(
     http_connection_pool_size:int=16,
     tag_preprocessing_callback: collections.abc.Callable[[str], str]=None,
     tag_postprocessing_callback: collections.abc.Callable[[str], str]=None,
+    blob_cache_dir: str=None,
+    manifest_cache_tag_ttl_seconds: int=None,
+    token_cache_file: str=None,
 ) -> oc.Client:
+    '''
+    @param token_cache_file: if passed, auth-tokens are in addition stored in this file (and may
+                             thus be shared w/ other processes)
+    '''
     def base_api_lookup(image_reference):
         registry_cfg = model.container_registry.find_config(
             image_reference=image_reference,
@@ -134,4 +142,11 @@ def oci_client(
         session=session,
         tag_preprocessing_callback=tag_preprocessing_callback,
         tag_postprocessing_callback=tag_postprocessing_callback,
+        blob_cache=oci.cache.BlobCache(cache_dir=blob_cache_dir) if blob_cache_dir else None,
+        manifest_cache=oci.cache.ManifestCache(
+            tag_ttl_seconds=manifest_cache_tag_ttl_seconds,
+        ) if manifest_cache_tag_ttl_seconds is not None else None,
+        token_cache=oc.OauthTokenCache(
+            store=oci.cache.FileTokenStore(path=token_cache_file),
+        ) if token_cache_file else None,
     )
@@ -1,6 +1,8 @@
 import collections.abc
+import concurrent.futures
 import dataclasses
 import enum
+import threading
 
 import cnudie.retrieve
 import ocm
@@ -100,15 +102,131 @@ class Filter:
         return isinstance(node, SourceNode)
 
 
+def _iter_references(
+    component: ocm.Component,
+) -> collections.abc.Generator[tuple[ocm.ComponentIdentity, NodeReferenceType], None, None]:
+    for cref in component.componentReferences:
+        yield ocm.ComponentIdentity(
+            name=cref.componentName,
+            version=cref.version,
+        ), NodeReferenceType.COMPONENT_REFERENCE
+
+    if not (extra_crefs_label := component.find_label(
+        name=ocm.gardener.ExtraComponentReferencesLabel.name,
+    )):
+        return
+
+    for extra_cref in extra_crefs_label.value:
+        yield ocm.ComponentIdentity(
+            name=extra_cref['component_reference']['name'],
+            version=extra_cref['component_reference']['version'],
+        ), NodeReferenceType.EXTRA_COMPONENT_REFS_LABEL
+
+
+class _PrefetchingResolver:
+    '''
+    resolves component-references using the given lookup, thereby prefetching referenced
+    component descriptors concurrently: once a component descriptor was retrieved, lookups for
+    all of its references are scheduled right away (from the worker thread, so prefetching
+    progresses through the component-graph independently of the consumer).
+
+    Each component-id is looked-up at most once. Errors raised by lookups are re-raised upon
+    `resolve` (i.e. at the point where sequential resolution would have raised them).
+    '''
+    def __init__(
+        self,
+        lookup: cnudie.retrieve.ComponentDescriptorLookupById,
+        executor: concurrent.futures.Executor,
+        ocm_repo: ocm.OcmRepository | str=None,
+        component_filter: collections.abc.Callable[[ocm.Component], bool]=None,
+        reftype_filter: collections.abc.Callable[[NodeReferenceType], bool]=None,
+        skip: collections.abc.Callable[[ocm.ComponentIdentity], bool]=None,
+    ):
+        self.lookup = lookup
+        self.executor = executor
+        self.ocm_repo = ocm_repo
+        self.component_filter = component_filter
+        self.reftype_filter = reftype_filter
+        self.skip = skip
+
+        self._futures = {} # {component-id: future}
+        self._lock = threading.Lock()
+
+    def _lookup(
+        self,
+        component_id: ocm.ComponentIdentity,
+        recursion_depth: int,
+    ) -> ocm.ComponentDescriptor:
+        if self.ocm_repo:
+            component_descriptor = self.lookup(component_id, self.ocm_repo)
+        else:
+            component_descriptor = self.lookup(component_id)
+
+        component = component_descriptor.component
+        if recursion_depth != 0 and not (self.component_filter and self.component_filter(component)):
+            self.prefetch(
+                component=component,
+                recursion_depth=recursion_depth - 1 if recursion_depth > 0 else recursion_depth,
+            )
+
+        return component_descriptor
+
+    def _submit(
+        self,
+        component_id: ocm.ComponentIdentity,
+        recursion_depth: int,
+    ) -> concurrent.futures.Future | None:
+        with self._lock:
+            if (future := self._futures.get(component_id)):
+                return future
+
+            try:
+                future = self.executor.submit(self._lookup, component_id, recursion_depth)
+            except RuntimeError:
+                return None # executor was shut down (iteration was aborted)
+
+            self._futures[component_id] = future
+            return future
+
+    def prefetch(
+        self,
+        component: ocm.Component,
+        recursion_depth: int,
+    ):
+        '''
+        schedules lookups for the components referenced by the given component; `recursion_depth`
+        is the remaining recursion-depth for the referenced components
+        '''
+        for cref_id, reftype in _iter_references(component):
+            if self.reftype_filter and self.reftype_filter(reftype):
+                continue
+            if self.skip and self.skip(cref_id):
+                continue
+
+            self._submit(component_id=cref_id, recursion_depth=recursion_depth)
+
+    def resolve(
+        self,
+        component_id: ocm.ComponentIdentity,
+        recursion_depth: int,
+    ) -> ocm.ComponentDescriptor:
+        return self._submit(
+            component_id=component_id,
+            recursion_depth=recursion_depth,
+        ).result()
+
+
 def iter(
     component: ocm.Component,
     lookup: cnudie.retrieve.ComponentDescriptorLookupById=None,
     recursion_depth: int=-1,
     prune_unique: bool=True,
+    prune_subtrees: bool=False,
     node_filter: collections.abc.Callable[[Node], bool]=None,
     ocm_repo: ocm.OcmRepository | str=None,
     component_filter: collections.abc.Callable[[ocm.Component], bool]=None,
     reftype_filter: collections.abc.Callable[[NodeReferenceType], bool]=None,
+    prefetch_workers: int=0,
 ) -> collections.abc.Generator[Node, None, None]:
     '''
     returns a generator yielding the transitive closure of nodes accessible from the given component.
@@ -123,6 +241,11 @@ def iter(
                             dependencies; -1 will resolve w/o recursion limit, 0 will not resolve
                             component dependencies
     @param prune_unique: if true, redundant component-versions will only be traversed once
+    @param prune_subtrees: if true (and prune_unique is true), subtrees of redundant
+                           component-versions are skipped entirely (i.e. neither the
+                           component-version, nor its artefacts, nor referenced components are
+                           emitted more than once). Otherwise, artefact-nodes are emitted for each
+                           path (each component-version is looked-up only once, though)
     @param node_filter:  use to filter emitted nodes (see Filter for predefined filters)
     @param ocm_repo:     optional OCM Repository to be used to override in the lookup
     @param component_filter: use to exclude components (and their references) from the iterator;
@@ -130,15 +253,59 @@ def iter(
     @param reftype_filter: use to exclude components (and their references) from the iterator if
                            they are of a certain reference type; thereby `True` means the component
                            should be filtered out
+    @param prefetch_workers: if set to a positive value, referenced component descriptors are
+                             looked-up concurrently (using a thread-pool of the given size), ahead
+                             of iteration. The order of emitted nodes (and their paths) is not
+                             affected. Note that `lookup`, `component_filter` and `reftype_filter`
+                             will be called from worker threads, and thus must be thread-safe
     '''
     if isinstance(component, ocm.ComponentDescriptor):
         component = component.component
 
-    seen_component_ids = set()
+    # {component-id: remaining recursion-depth the component was traversed with}
+    seen_component_ids = {}
+    emitted_component_ids = set()
+    # {component-id: component-descriptor}; memoised lookup-results
+    component_descriptors = {}
 
     if not lookup and not recursion_depth == 0:
         raise ValueError('lookup is required if recusion is not disabled (recursion_depth==0)')
 
+    def fully_traversed(
+        component_id: ocm.ComponentIdentity,
+        recursion_depth: int,
+    ) -> bool:
+        if not (prune_unique and prune_subtrees):
+            return False
+
+        if (seen_depth := seen_component_ids.get(component_id)) is None:
+            return False
+
+        # a component might have been traversed before w/ a lower remaining recursion-depth; in
+        # this case, referenced components must still be traversed
+        return seen_depth < 0 or 0 <= recursion_depth <= seen_depth
+
+    if prefetch_workers > 0 and recursion_depth != 0:
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=prefetch_workers,
+            thread_name_prefix='cnudie-iter-prefetch',
+        )
+        resolver = _PrefetchingResolver(
+            lookup=lookup,
+            executor=executor,
+            ocm_repo=ocm_repo,
+            component_filter=component_filter,
+            reftype_filter=reftype_filter,
+            # component-ids might be re-visited w/ higher remaining recursion-depth; those are
+            # resolved upon demand
+            skip=lambda component_id: (
+                prune_unique and prune_subtrees and component_id in seen_component_ids
+            ),
+        )
+    else:
+        executor = None
+        resolver = None
+
     # need to nest actual iterator to keep global state of seen component-IDs
     def inner_iter(
         component: ocm.Component,
@@ -155,85 +322,95 @@ def iter(
 
         path = (*path, NodePathEntry(component, reftype))
 
-        yield ComponentNode(
-            path=path,
-        )
+        component_id = component.identity()
+        already_seen = prune_unique and prune_subtrees and component_id in seen_component_ids
+        seen_component_ids[component_id] = recursion_depth
 
-        for resource in component.resources:
-            yield ResourceNode(
+        if not already_seen:
+            yield ComponentNode(
                 path=path,
-                resource=resource,
             )
 
-        for source in component.sources:
-            yield SourceNode(
-                path=path,
-                source=source,
-            )
+            for resource in component.resources:
+                yield ResourceNode(
+                    path=path,
+                    resource=resource,
+                )
+
+            for source in component.sources:
+                yield SourceNode(
+                    path=path,
+                    source=source,
+                )
 
         if recursion_depth == 0:
             return # stop resolving referenced components
         elif recursion_depth > 0:
             recursion_depth -= 1
 
-        for cref in component.componentReferences:
-            cref_id = ocm.ComponentIdentity(
-                name=cref.componentName,
-                version=cref.version,
+        if resolver:
+            resolver.prefetch(
+                component=component,
+                recursion_depth=recursion_depth,
             )
 
-            if ocm_repo:
+        def resolve_and_iter(
+            cref_id: ocm.ComponentIdentity,
+            reftype: NodeReferenceType,
+        ):
+            if reftype_filter and reftype_filter(reftype):
+                return
+
+            if fully_traversed(component_id=cref_id, recursion_depth=recursion_depth):
+                return # prune subtree (no need to lookup)
+
+            if resolver:
+                referenced_component_descriptor = resolver.resolve(
+                    component_id=cref_id,
+                    recursion_depth=recursion_depth,
+                )
+            elif cref_id in component_descriptors:
+                referenced_component_descriptor = component_descriptors[cref_id]
+            elif ocm_repo:
                 referenced_component_descriptor = lookup(cref_id, ocm_repo)
             else:
                 referenced_component_descriptor = lookup(cref_id)
+            component_descriptors[cref_id] = referenced_component_descriptor
 
             yield from inner_iter(
                 component=referenced_component_descriptor.component,
                 lookup=lookup,
                 recursion_depth=recursion_depth,
                 path=path,
+                reftype=reftype,
             )
 
-        if not (extra_crefs_label := component.find_label(
-            name=ocm.gardener.ExtraComponentReferencesLabel.name,
-        )):
-            return
-
-        for extra_cref in extra_crefs_label.value:
-            extra_cref_id = ocm.ComponentIdentity(
-                name=extra_cref['component_reference']['name'],
-                version=extra_cref['component_reference']['version'],
-            )
-
-            if ocm_repo:
-                referenced_component_descriptor = lookup(extra_cref_id, ocm_repo)
-            else:
-                referenced_component_descriptor = lookup(extra_cref_id)
-
-            yield from inner_iter(
-                component=referenced_component_descriptor.component,
-                lookup=lookup,
-                recursion_depth=recursion_depth,
-                path=path,
-                reftype=NodeReferenceType.EXTRA_COMPONENT_REFS_LABEL,
+        for cref_id, reftype in _iter_references(component):
+            yield from resolve_and_iter(
+                cref_id=cref_id,
+                reftype=reftype,
             )
 
-    for node in inner_iter(
-        component=component,
-        lookup=lookup,
-        recursion_depth=recursion_depth,
-        path=(),
-    ):
-        if node_filter and not node_filter(node):
-            continue
-
-        if prune_unique and isinstance(node, ComponentNode):
-            if node.component.identity() in seen_component_ids:
+    try:
+        for node in inner_iter(
+            component=component,
+            lookup=lookup,
+            recursion_depth=recursion_depth,
+            path=(),
+        ):
+            if node_filter and not node_filter(node):
                 continue
-            else:
-                seen_component_ids.add(node.component_id)
 
-        yield node
+            if prune_unique and isinstance(node, ComponentNode):
+                if node.component_id in emitted_component_ids:
+                    continue
+                else:
+                    emitted_component_ids.add(node.component_id)
+
+            yield node
+    finally:
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
 
 
 def iter_resources(
@@ -241,8 +418,10 @@ def iter_resources(
     lookup: cnudie.retrieve.ComponentDescriptorLookupById=None,
     recursion_depth: int=-1,
     prune_unique: bool=True,
+    prune_subtrees: bool=False,
     component_filter: collections.abc.Callable[[ocm.Component], bool]=None,
     reftype_filter: collections.abc.Callable[[NodeReferenceType], bool]=None,
+    prefetch_workers: int=0,
 ) -> collections.abc.Generator[ResourceNode, None, None]:
     '''
     curried version of `iter` w/ node-filter preset to yield only resource-nodes
@@ -252,7 +431,9 @@ def iter_resources(
         lookup=lookup,
         recursion_depth=recursion_depth,
         prune_unique=prune_unique,
+        prune_subtrees=prune_subtrees,
         node_filter=Filter.resources,
         component_filter=component_filter,
         reftype_filter=reftype_filter,
+        prefetch_workers=prefetch_workers,
     )
@@ -11,6 +11,7 @@ async def iter(
     lookup: cnudie.retrieve_async.ComponentDescriptorLookupById=None,
     recursion_depth: int=-1,
     prune_unique: bool=True,
+    prune_subtrees: bool=False,
     node_filter: collections.abc.Callable[[cnudie.iter.Node], bool]=None,
     ocm_repo: ocm.OcmRepository | str=None,
     component_filter: collections.abc.Callable[[ocm.Component], bool]=None,
@@ -29,6 +30,11 @@ async def iter(
                             dependencies; -1 will resolve w/o recursion limit, 0 will not resolve
                             component dependencies
     @param prune_unique: if true, redundant component-versions will only be traversed once
+    @param prune_subtrees: if true (and prune_unique is true), subtrees of redundant
+                           component-versions are skipped entirely (i.e. neither the
+                           component-version, nor its artefacts, nor referenced components are
+                           emitted more than once). Otherwise, artefact-nodes are emitted for each
+                           path (each component-version is looked-up only once, though)
     @param node_filter:  use to filter emitted nodes (see Filter for predefined filters)
     @param ocm_repo:     optional OCM Repository to be used to override in the lookup
     @param component_filter: use to exclude components (and their references) from the iterator;
@@ -40,11 +46,29 @@ async def iter(
     if isinstance(component, ocm.ComponentDescriptor):
         component = component.component
 
-    seen_component_ids = set()
+    # {component-id: remaining recursion-depth the component was traversed with}
+    seen_component_ids = {}
+    emitted_component_ids = set()
+    # {component-id: component-descriptor}; memoised lookup-results
+    component_descriptors = {}
 
     if not lookup and not recursion_depth == 0:
         raise ValueError('lookup is required if recusion is not disabled (recursion_depth==0)')
 
+    def fully_traversed(
+        component_id: ocm.ComponentIdentity,
+        recursion_depth: int,
+    ) -> bool:
+        if not (prune_unique and prune_subtrees):
+            return False
+
+        if (seen_depth := seen_component_ids.get(component_id)) is None:
+            return False
+
+        # a component might have been traversed before w/ a lower remaining recursion-depth; in
+        # this case, referenced components must still be traversed
+        return seen_depth < 0 or 0 <= recursion_depth <= seen_depth
+
     # need to nest actual iterator to keep global state of seen component-IDs
     async def inner_iter(
         component: ocm.Component,
@@ -61,43 +85,68 @@ async def iter(
 
         path = (*path, cnudie.iter.NodePathEntry(component, reftype))
 
-        yield cnudie.iter.ComponentNode(
-            path=path,
-        )
+        component_id = component.identity()
+        already_seen = prune_unique and prune_subtrees and component_id in seen_component_ids
+        seen_component_ids[component_id] = recursion_depth
 
-        for resource in component.resources:
-            yield cnudie.iter.ResourceNode(
+        if not already_seen:
+            yield cnudie.iter.ComponentNode(
                 path=path,
-                resource=resource,
             )
 
-        for source in component.sources:
-            yield cnudie.iter.SourceNode(
-                path=path,
-                source=source,
-            )
+            for resource in component.resources:
+                yield cnudie.iter.ResourceNode(
+                    path=path,
+                    resource=resource,
+                )
+
+            for source in component.sources:
+                yield cnudie.iter.SourceNode(
+                    path=path,
+                    source=source,
+                )
 
         if recursion_depth == 0:
             return # stop resolving referenced components
         elif recursion_depth > 0:
             recursion_depth -= 1
 
-        for cref in component.componentReferences:
-            cref_id = ocm.ComponentIdentity(
-                name=cref.componentName,
-                version=cref.version,
-            )
+        async def resolve_and_iter(
+            cref_id: ocm.ComponentIdentity,
+            reftype: cnudie.iter.NodeReferenceType,
+        ):
+            if reftype_filter and reftype_filter(reftype):
+                return
 
-            if ocm_repo:
+            if fully_traversed(component_id=cref_id, recursion_depth=recursion_depth):
+                return # prune subtree (no need to lookup)
+
+            if cref_id in component_descriptors:
+                referenced_component_descriptor = component_descriptors[cref_id]
+            elif ocm_repo:
                 referenced_component_descriptor = await lookup(cref_id, ocm_repo)
             else:
                 referenced_component_descriptor = await lookup(cref_id)
+            component_descriptors[cref_id] = referenced_component_descriptor
 
             async for node in inner_iter(
                 component=referenced_component_descriptor.component,
                 lookup=lookup,
                 recursion_depth=recursion_depth,
                 path=path,
+                reftype=reftype,
+            ):
+                yield node
+
+        for cref in component.componentReferences:
+            cref_id = ocm.ComponentIdentity(
+                name=cref.componentName,
+                version=cref.version,
+            )
+
+            async for node in resolve_and_iter(
+                cref_id=cref_id,
+                reftype=cnudie.iter.NodeReferenceType.COMPONENT_REFERENCE,
             ):
                 yield node
 
@@ -112,16 +161,8 @@ async def iter(
                 version=extra_cref['component_reference']['version'],
             )
 
-            if ocm_repo:
-                referenced_component_descriptor = await lookup(extra_cref_id, ocm_repo)
-            else:
-                referenced_component_descriptor = await lookup(extra_cref_id)
-
-            async for node in inner_iter(
-                component=referenced_component_descriptor.component,
-                lookup=lookup,
-                recursion_depth=recursion_depth,
-                path=path,
+            async for node in resolve_and_iter(
+                cref_id=extra_cref_id,
                 reftype=cnudie.iter.NodeReferenceType.EXTRA_COMPONENT_REFS_LABEL,
             ):
                 yield node
@@ -136,10 +177,10 @@ async def iter(
             continue
 
         if prune_unique and isinstance(node, cnudie.iter.ComponentNode):
-            if node.component.identity() in seen_component_ids:
+            if node.component_id in emitted_component_ids:
                 continue
             else:
-                seen_component_ids.add(node.component_id)
+                emitted_component_ids.add(node.component_id)
 
         yield node
 
@@ -149,6 +190,7 @@ def iter_resources(
     lookup: cnudie.retrieve_async.ComponentDescriptorLookupById=None,
     recursion_depth: int=-1,
     prune_unique: bool=True,
+    prune_subtrees: bool=False,
     component_filter: collections.abc.Callable[[ocm.Component], bool]=None,
     reftype_filter: collections.abc.Callable[[cnudie.iter.NodeReferenceType], bool]=None,
 ) -> collections.abc.AsyncGenerator[cnudie.iter.ResourceNode, None, None]:
@@ -160,6 +202,7 @@ def iter_resources(
         lookup=lookup,
         recursion_depth=recursion_depth,
         prune_unique=prune_unique,
+        prune_subtrees=prune_subtrees,
         node_filter=cnudie.iter.Filter.resources,
         component_filter=component_filter,
         reftype_filter=reftype_filter,
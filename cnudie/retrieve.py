@@ -6,8 +6,12 @@ import json
 import logging
 import os
 import shutil
+import sqlite3
 import tarfile
 import tempfile
+import threading
+import time
+import zlib
 
 import requests
 import yaml
@@ -267,6 +271,326 @@ def file_system_cache_component_descriptor_lookup(
     return lookup
 
 
+class _ComponentDescriptorDb:
+    '''
+    stores component descriptors (as compressed JSON) in a SQLite database, keyed by
+    (ocm-repository, component-name, component-version). Least-recently accessed entries are
+    evicted if the total size of stored descriptors exceeds `max_size_octets`.
+
+    The total size is maintained (using triggers) in the `metadata` table, so it need not be
+    calculated upon each write (it is only calculated from all entries upon creation of said
+    table, or if explicitly re-synced using `resync_size`).
+    '''
+    def __init__(
+        self,
+        path: str,
+        max_size_octets: int,
+    ):
+        self.path = path
+        self.max_size_octets = max_size_octets
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path,
+            timeout=30, # db might be locked by concurrent processes
+            check_same_thread=False, # access is serialised using _lock
+            isolation_level=None, # autocommit
+        )
+        with self._lock:
+            self._connection.executescript('''
+                PRAGMA journal_mode=WAL;
+                CREATE TABLE IF NOT EXISTS component_descriptors (
+                    ocm_repo TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    version TEXT NOT NULL,
+                    descriptor BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_access REAL NOT NULL,
+                    PRIMARY KEY (ocm_repo, name, version)
+                );
+                CREATE INDEX IF NOT EXISTS last_access_idx
+                    ON component_descriptors (last_access);
+                CREATE TABLE IF NOT EXISTS imported_dirs (
+                    path TEXT PRIMARY KEY
+                );
+
+                BEGIN IMMEDIATE;
+                CREATE TABLE IF NOT EXISTS metadata (
+                    key TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
+                );
+                CREATE TRIGGER IF NOT EXISTS size_on_insert
+                    AFTER INSERT ON component_descriptors
+                BEGIN
+                    UPDATE metadata SET value = value + NEW.size WHERE key = 'size_octets';
+                END;
+                CREATE TRIGGER IF NOT EXISTS size_on_delete
+                    AFTER DELETE ON component_descriptors
+                BEGIN
+                    UPDATE metadata SET value = value - OLD.size WHERE key = 'size_octets';
+                END;
+                CREATE TRIGGER IF NOT EXISTS size_on_update
+                    AFTER UPDATE OF size ON component_descriptors
+                BEGIN
+                    UPDATE metadata SET value = value - OLD.size + NEW.size
+                    WHERE key = 'size_octets';
+                END;
+                INSERT OR IGNORE INTO metadata (key, value)
+                    SELECT 'size_octets', COALESCE(SUM(size), 0) FROM component_descriptors;
+                COMMIT;
+            ''')
+            # required for delete-triggers to fire for rows replaced by `INSERT OR REPLACE`
+            self._connection.execute('PRAGMA recursive_triggers=ON')
+
+    @staticmethod
+    def _serialise(component_descriptor: ocm.ComponentDescriptor) -> bytes:
+        return zlib.compress(json.dumps(
+            dataclasses.asdict(component_descriptor),
+            cls=ocm.EnumJSONEncoder,
+            separators=(',', ':'),
+        ).encode('utf-8'))
+
+    @staticmethod
+    def _deserialise(raw: bytes) -> ocm.ComponentDescriptor:
+        return ocm.ComponentDescriptor.from_dict(
+            json.loads(zlib.decompress(raw)),
+        )
+
+    def get(
+        self,
+        ocm_repo: str,
+        component_id: ocm.ComponentIdentity,
+    ) -> ocm.ComponentDescriptor | None:
+        key = (ocm_repo, component_id.name, component_id.version)
+
+        with self._lock:
+            row = self._connection.execute(
+                '''
+                SELECT descriptor FROM component_descriptors
+                WHERE ocm_repo = ? AND name = ? AND version = ?
+                ''',
+                key,
+            ).fetchone()
+            if not row:
+                return None
+
+            self._connection.execute(
+                '''
+                UPDATE component_descriptors SET last_access = ?
+                WHERE ocm_repo = ? AND name = ? AND version = ?
+                ''',
+                (time.time(), *key),
+            )
+
+        return self._deserialise(row[0])
+
+    def put(
+        self,
+        ocm_repo: str,
+        component_descriptor: ocm.ComponentDescriptor,
+        replace: bool=True,
+    ):
+        component = component_descriptor.component
+        raw = self._serialise(component_descriptor)
+
+        with self._lock:
+            self._connection.execute(
+                f'''
+                INSERT OR {'REPLACE' if replace else 'IGNORE'} INTO component_descriptors
+                (ocm_repo, name, version, descriptor, size, last_access)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ''',
+                (ocm_repo, component.name, component.version, raw, len(raw), time.time()),
+            )
+            self._evict_if_required()
+
+    def _size_octets(self) -> int:
+        size_octets, = self._connection.execute(
+            '''
+            SELECT value FROM metadata WHERE key = 'size_octets'
+            ''',
+        ).fetchone()
+        return size_octets
+
+    def resync_size(self) -> int:
+        '''
+        re-calculates the total size of stored descriptors (which is otherwise maintained
+        incrementally), and returns it
+        '''
+        with self._lock:
+            self._connection.execute(
+                '''
+                UPDATE metadata SET value = (
+                    SELECT COALESCE(SUM(size), 0) FROM component_descriptors
+                ) WHERE key = 'size_octets'
+                ''',
+            )
+            return self._size_octets()
+
+    def _evict_if_required(self):
+        size_octets = self._size_octets()
+
+        if size_octets <= self.max_size_octets:
+            return
+
+        # evict some more than strictly required, so we do not need to evict upon each write
+        target_size_octets = int(self.max_size_octets * 0.9)
+        evict_keys = []
+        for ocm_repo, name, version, size in self._connection.execute(
+            '''
+            SELECT ocm_repo, name, version, size FROM component_descriptors
+            ORDER BY last_access
+            ''',
+        ):
+            if size_octets <= target_size_octets:
+                break
+            evict_keys.append((ocm_repo, name, version))
+            size_octets -= size
+
+        self._connection.executemany(
+            '''
+            DELETE FROM component_descriptors
+            WHERE ocm_repo = ? AND name = ? AND version = ?
+            ''',
+            evict_keys,
+        )
+        logger.debug(f'evicted {len(evict_keys)} component descriptors from {self.path=}')
+
+    def import_yaml_cache_dir(
+        self,
+        cache_dir: str,
+    ):
+        '''
+        imports component descriptors from a cache directory as populated by
+        `file_system_cache_component_descriptor_lookup`. Each directory is only imported once;
+        descriptors already present are not overwritten.
+        '''
+        cache_dir = os.path.abspath(cache_dir)
+
+        with self._lock:
+            if self._connection.execute(
+                'SELECT 1 FROM imported_dirs WHERE path = ?',
+                (cache_dir,),
+            ).fetchone():
+                return
+
+        imported_count = 0
+        for dirpath, _, filenames in os.walk(cache_dir):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                if path == self.path or path.startswith(f'{self.path}-'):
+                    continue # sqlite files (db, journal)
+
+                try:
+                    component_descriptor = ocm.ComponentDescriptor.from_dict(
+                        ci.util.parse_yaml_file(path)
+                    )
+                    ocm_repo = component_descriptor.component.current_ocm_repo.oci_ref
+                except Exception as e:
+                    logger.warning(f'failed to import {path=}: {e}')
+                    continue
+
+                self.put(
+                    ocm_repo=ocm_repo,
+                    component_descriptor=component_descriptor,
+                    replace=False,
+                )
+                imported_count += 1
+
+        with self._lock:
+            self._connection.execute(
+                'INSERT OR IGNORE INTO imported_dirs (path) VALUES (?)',
+                (cache_dir,),
+            )
+
+        logger.info(f'imported {imported_count} component descriptors from {cache_dir=}')
+
+
+def indexed_file_system_cache_component_descriptor_lookup(
+    ocm_repository_lookup: OcmRepositoryLookup=None,
+    cache_dir: str=None,
+    max_size_octets: int=1024 * 1024 * 256, # 256 MiB
+    import_yaml_cache_dir: str | None=None,
+) -> ComponentDescriptorLookupById:
+    '''
+    Used to lookup referenced component descriptors in a file-system cache. In contrast to
+    `file_system_cache_component_descriptor_lookup`, component descriptors are stored as
+    compressed JSON in a single SQLite database (indexed by ocm-repository, component-name and
+    -version), which is considerably faster to read than YAML files. In case of a cache miss, the
+    required component descriptor can be added to the cache by using the writeback function.
+
+    @param ocm_repository_lookup:
+        lookup for OCM repositories
+    @param cache_dir:
+        directory used for caching (will be created if absent)
+    @param max_size_octets:
+        max size of (compressed) component descriptors to keep; least recently accessed ones are
+        evicted
+    @param import_yaml_cache_dir:
+        optional cache directory populated by `file_system_cache_component_descriptor_lookup`,
+        the component descriptors of which are imported (once)
+    '''
+    if not cache_dir:
+        raise ValueError(cache_dir)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    db = _ComponentDescriptorDb(
+        path=os.path.join(cache_dir, 'component-descriptors.sqlite3'),
+        max_size_octets=max_size_octets,
+    )
+
+    if import_yaml_cache_dir and os.path.isdir(import_yaml_cache_dir):
+        db.import_yaml_cache_dir(cache_dir=import_yaml_cache_dir)
+
+    def writeback(
+        component_id: ocm.ComponentIdentity,
+        component_descriptor: ocm.ComponentDescriptor,
+    ):
+        if not (ocm_repo := component_descriptor.component.current_ocm_repo):
+            raise ValueError(ocm_repo)
+
+        db.put(
+            ocm_repo=ocm_repo.oci_ref,
+            component_descriptor=component_descriptor,
+        )
+
+    _writeback = WriteBack(writeback)
+
+    def lookup(
+        component_id: cnudie.util.ComponentId,
+        ocm_repository_lookup: OcmRepositoryLookup=ocm_repository_lookup,
+    ):
+        component_id = cnudie.util.to_component_id(component_id)
+        ocm_repos = iter_ocm_repositories(
+            component_id,
+            ocm_repository_lookup,
+        )
+
+        for ocm_repo in ocm_repos:
+            if not ocm_repo:
+                raise ValueError(ocm_repo)
+
+            if isinstance(ocm_repo, str):
+                ocm_repo = ocm.OciOcmRepository(
+                    type=ocm.AccessType.OCI_REGISTRY,
+                    baseUrl=ocm_repo,
+                )
+
+            if not isinstance(ocm_repo, ocm.OciOcmRepository):
+                raise NotImplementedError(ocm_repo)
+
+            if (component_descriptor := db.get(
+                ocm_repo=ocm_repo.oci_ref,
+                component_id=component_id,
+            )):
+                return component_descriptor
+
+        # component descriptor not found in lookup
+        return _writeback
+
+    return lookup
+
+
 def delivery_service_component_descriptor_lookup(
     ocm_repository_lookup: OcmRepositoryLookup,
     delivery_client,
@@ -650,6 +974,7 @@ def create_default_component_descriptor_lookup(
     delivery_client=None,
     default_absent_ok: bool=False,
     fallback_to_service_mapping: bool=True,
+    indexed_cache: bool=False,
 ) -> ComponentDescriptorLookupById:
     '''
     This is a convenience function combining commonly used/recommended lookups, using global
@@ -674,6 +999,10 @@ def create_default_component_descriptor_lookup(
         if set, it is tried to retrieve the requested component descriptor using the OCM repository
         mapping of the delivery-service, in case it could not be retrieved using
         `ocm_repository_lookup`
+    @param indexed_cache:
+        if set, the file-system cache will be backed by an SQLite database (see
+        `indexed_file_system_cache_component_descriptor_lookup`); YAML-files in cache_dir will
+        be imported
     '''
     if not ocm_repository_lookup:
         import ctx
@@ -693,7 +1022,15 @@ def create_default_component_descriptor_lookup(
             # ctx-module is an optional dependency for local dev setups
             pass
 
-    if cache_dir:
+    if cache_dir and indexed_cache:
+        lookups.append(
+            indexed_file_system_cache_component_descriptor_lookup(
+                cache_dir=cache_dir,
+                ocm_repository_lookup=ocm_repository_lookup,
+                import_yaml_cache_dir=cache_dir,
+            )
+        )
+    elif cache_dir:
         lookups.append(
             file_system_cache_component_descriptor_lookup(
                 cache_dir=cache_dir,
@@ -603,12 +603,16 @@ def diff_resources(
             f'unsupported {type(right_component)=}',
         )
 
+    resource_identities = ocm.ArtifactIdentityIndex(
+        peers=left_component.resources + right_component.resources,
+    )
+
     left_resource_identities_to_resource = {
-        r.identity(left_component.resources + right_component.resources): r
+        resource_identities.identity(r): r
         for r in left_component.resources
     }
     right_resource_identities_to_resource = {
-        r.identity(left_component.resources + right_component.resources): r
+        resource_identities.identity(r): r
         for r in right_component.resources
     }
 
@@ -661,12 +665,12 @@ def diff_resources(
             continue
 
         left_identities = {
-            r.identity(left_component.resources + right_component.resources): r
+            resource_identities.identity(r): r
             for r in left_resource_group
         }
         right_identities = {
-            r.identity(left_component.resources + right_component.resources): r
-                            for r in right_resource_group
+            resource_identities.identity(r): r
+            for r in right_resource_group
         }
 
         left_resource_ids = sorted(left_identities.keys())
@@ -177,6 +177,10 @@ class ConcourseApiBase:
         response = self._get(pipelines_url)
         return map(select_attr('name'), response)
 
+    def list_pipelines(self) -> list[Pipeline]:
+        pipelines_url = self.routes.pipelines()
+        return [Pipeline(raw) for raw in self._get(pipelines_url)]
+
     def order_pipelines(self, pipeline_names):
         url = self.routes.order_pipelines()
         self._put(url, json.dumps(pipeline_names))
@@ -218,6 +222,27 @@ class ConcourseApiBase:
 
         return response.headers['X-Concourse-Config-Version']
 
+    def pipeline_config_and_version(
+        self,
+        pipeline_name: str,
+    ) -> tuple[dict | None, str | None]:
+        '''
+        returns the (raw) pipeline-configuration as currently deployed, and its config-version
+        (both None if pipeline does not exist)
+        '''
+        pipeline_cfg_url = self.routes.pipeline_cfg(pipeline_name)
+        response = self.request_builder.get(
+                pipeline_cfg_url,
+                return_type=None,
+                check_http_code=False
+        )
+        if response.status_code == 404:
+            return None, None
+
+        self.request_builder._check_http_code(response, pipeline_cfg_url)
+
+        return response.json()['config'], response.headers['X-Concourse-Config-Version']
+
     @ensure_annotations
     def unpause_pipeline(self, pipeline_name: str):
         unpause_url = self.routes.unpause_pipeline(pipeline_name)
@@ -115,6 +115,12 @@ class Pipeline:
     def is_archived(self) -> bool:
         return self.raw['archived']
 
+    def last_updated(self) -> int | None:
+        '''
+        unix-timestamp of last modification (not returned by all concourse-versions)
+        '''
+        return self.raw.get('last_updated')
+
 
 class Job:
     '''
@@ -27,6 +27,7 @@ from model.base import ModelBase, NamedModelElement
 import ccc.github
 import ci.log
 import concourse.paths
+import concourse.replication_state
 import model.concourse
 import model.secret
 
@@ -78,6 +79,8 @@ class DefinitionEnumerator:
         job_mapping: model.concourse.JobMapping=None,
         target_team: str=None,
         pipeline_definition_committish: str=None,
+        replication_state_key: str=None,
+        unchanged: bool=False,
     ) -> 'DefinitionDescriptor':
         if not target_team:
             target_team = self.job_mapping.team_name() # noqa
@@ -97,6 +100,8 @@ class DefinitionEnumerator:
                 secret_cfg=secret_cfg,
                 job_mapping=job_mapping,
                 pipeline_definition_committish=pipeline_definition_committish,
+                replication_state_key=replication_state_key,
+                unchanged=unchanged,
             )
 
 
@@ -216,26 +221,65 @@ class BranchCfgEntry(NamedModelElement):
 
 
 class GithubDefinitionEnumeratorBase(DefinitionEnumerator):
+    # if set, only branches whose inputs changed since last replication are retrieved + rendered
+    replication_state: concourse.replication_state.ReplicationState = None
+
+    def _branch_cfg_committish(
+        self,
+        repository,
+    ) -> str | None:
+        try:
+            return repository.ref(ref='meta/ci').object.sha
+        except NotFoundError:
+            return None # no branch cfg present
+
     def _branch_cfg_or_none(
         self,
         repository,
+        branch_cfg_committish: str=None,
     ):
+        '''
+        @param branch_cfg_committish: commit of `refs/meta/ci`; if passed, branch.cfg is looked-up
+            from replication-state (and recorded to it)
+        '''
+        if branch_cfg_committish and (raw_branch_cfg := self.replication_state.branch_cfg(
+            repo_key=repository.html_url,
+            committish=branch_cfg_committish,
+        )):
+            return BranchCfg(raw_dict=raw_branch_cfg)
+
         try:
             branch_cfg = repository.file_contents(
                 path='branch.cfg',
-                ref='refs/meta/ci',
+                ref=branch_cfg_committish or 'refs/meta/ci',
             ).decoded.decode('utf-8')
         except NotFoundError:
             return None # no branch cfg present
 
-        return BranchCfg(raw_dict=load_yaml(branch_cfg))
+        raw_branch_cfg = load_yaml(branch_cfg)
+
+        if branch_cfg_committish:
+            self.replication_state.record_branch_cfg(
+                repo_key=repository.html_url,
+                committish=branch_cfg_committish,
+                raw_branch_cfg=raw_branch_cfg,
+            )
+
+        return BranchCfg(raw_dict=raw_branch_cfg)
 
     def _determine_repository_branches(
         self,
         repository,
         branch: str = None,
+        branch_cfg_committish: str = None,
     ):
-        branch_cfg = self._branch_cfg_or_none(repository=repository)
+        if self.replication_state and not branch_cfg_committish:
+            branch_cfg = None # refs/meta/ci does not exist
+        else:
+            branch_cfg = self._branch_cfg_or_none(
+                repository=repository,
+                branch_cfg_committish=branch_cfg_committish,
+            )
 
         if not branch_cfg:
             try:
@@ -284,11 +328,24 @@ class GithubDefinitionEnumeratorBase(DefinitionEnumerator):
         if not target_team:
             target_team = self.job_mapping.team_name() # noqa
 
+        if (replication_state := self.replication_state):
+            branch_cfg_committish = self._branch_cfg_committish(repository=repository)
+            inputs_version = replication_state.inputs_version(
+                self.cfg_set, # noqa
+                target_team,
+                self.job_mapping.raw, # noqa
+                secret_cfg.name() if secret_cfg else None,
+                secret_cfg.raw if secret_cfg else None,
+            )
+        else:
+            branch_cfg_committish = None
+
         try:
             branches_and_cfg_entries = [
                 i for i in self._determine_repository_branches(
                     repository=repository,
                     branch=branch,
+                    branch_cfg_committish=branch_cfg_committish,
                 )
             ]
         except (yaml.scanner.ScannerError, yaml.parser.ParserError) as e:
@@ -305,15 +362,57 @@ class GithubDefinitionEnumeratorBase(DefinitionEnumerator):
             return # nothing else to yield in case parsing the branch cfg failed
 
         for branch_name, cfg_entry in branches_and_cfg_entries:
+            replication_state_key = concourse.replication_state.ReplicationState.key(
+                repo_hostname=repo_hostname,
+                repo_path=repo_path,
+                branch=branch_name,
+            )
             try:
-                definitions = repository.file_contents(
-                    path='.ci/pipeline_definitions',
-                    ref=branch_name
-                )
                 pipeline_definition_committish = repository.ref(
                     ref=f'heads/{branch_name}'
                 ).object.sha
             except NotFoundError:
+                continue # branch does not exist
+
+            if replication_state and (replication_state_entry := replication_state.entry(
+                key=replication_state_key,
+                definition_committish=pipeline_definition_committish,
+                branch_cfg_committish=branch_cfg_committish,
+                inputs_version=inputs_version,
+            )):
+                # inputs did not change since last replication -> no need to retrieve + render
+                yield from self._wrap_into_descriptors(
+                    repo_path=repo_path,
+                    repo_hostname=repo_hostname,
+                    branch=branch_name,
+                    raw_definitions={
+                        name: {} for name in replication_state_entry.pipeline_names
+                    },
+                    target_team=getattr(self, '_target_team', None),
+                    secret_cfg=secret_cfg,
+                    job_mapping=job_mapping,
+                    pipeline_definition_committish=pipeline_definition_committish,
+                    replication_state_key=replication_state_key,
+                    unchanged=True,
+                )
+                continue
+
+            try:
+                definitions = repository.file_contents(
+                    path='.ci/pipeline_definitions',
+                    ref=pipeline_definition_committish,
+                )
+            except NotFoundError:
+                if replication_state:
+                    replication_state.record(
+                        key=replication_state_key,
+                        entry=concourse.replication_state.ReplicationStateEntry(
+                            definition_committish=pipeline_definition_committish,
+                            branch_cfg_committish=branch_cfg_committish,
+                            inputs_version=inputs_version,
+                            pipeline_names=(),
+                        ),
+                    )
                 continue # no pipeline definition for this branch
 
             override_definitions = cfg_entry.override_definitions() if cfg_entry else {}
@@ -341,6 +440,20 @@ class GithubDefinitionEnumeratorBase(DefinitionEnumerator):
             # hacky: only set from GithubRepositoryDefinitionEnumerator
             target_team = getattr(self, '_target_team', None)
 
+            if replication_state:
+                replication_state.record(
+                    key=replication_state_key,
+                    entry=concourse.replication_state.ReplicationStateEntry(
+                        definition_committish=pipeline_definition_committish,
+                        branch_cfg_committish=branch_cfg_committish,
+                        inputs_version=inputs_version,
+                        pipeline_names=tuple(
+                            name for name, definition in definitions.items()
+                            if definition.get('render_pipeline', True)
+                        ),
+                    ),
+                )
+
             yield from self._wrap_into_descriptors(
                 repo_path='/'.join([org_name, repository.name]),
                 repo_hostname=repo_hostname,
@@ -351,6 +464,7 @@ class GithubDefinitionEnumeratorBase(DefinitionEnumerator):
                 secret_cfg=secret_cfg,
                 job_mapping=job_mapping,
                 pipeline_definition_committish=pipeline_definition_committish,
+                replication_state_key=replication_state_key if replication_state else None,
             )
 
 
@@ -425,13 +539,23 @@ class GithubOrganisationDefinitionEnumerator(GithubDefinitionEnumeratorBase):
         job_mapping,
         cfg_set,
         repository_filter: callable=None,
+        replication_state: concourse.replication_state.ReplicationState=None,
+        max_workers: int=16,
     ):
+        '''
+        @param replication_state: if passed, only branches whose inputs (head-commit, branch.cfg,
+            templates, rendering-code, cfgs) changed since last (successful) replication are
+            retrieved and rendered; other branches are yielded as `unchanged` definition-descriptors
+        @param max_workers: amount of threads scanning github-repositories
+        '''
         self.job_mapping = not_none(job_mapping)
         self.cfg_set = not_none(cfg_set)
         self.repository_filter = repository_filter
+        self.replication_state = replication_state
+        self.max_workers = max_workers
 
     def enumerate_definition_descriptors(self):
-        executor = ThreadPoolExecutor(max_workers=16)
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
 
         # scan github repositories
         for github_org_cfg in self.job_mapping.github_organisations():
@@ -488,7 +612,14 @@ class DefinitionDescriptor:
         override_definitions=[{},],
         exception=None,
         pipeline_definition_committish: str=None,
+        replication_state_key: str=None,
+        unchanged: bool=False,
     ):
+        '''
+        @param replication_state_key: key of replication-state entry to commit upon deployment
+        @param unchanged: if True, definition need not be rendered and deployed (pipeline was
+            already deployed w/ same inputs); `pipeline_definition` is empty in this case
+        '''
         try:
             self.pipeline_name = not_empty(pipeline_name)
             self.pipeline_definition = not_none(pipeline_definition)
@@ -499,6 +630,8 @@ class DefinitionDescriptor:
             self.secret_cfg = secret_cfg
             self.job_mapping = job_mapping
             self.pipeline_definition_committish = pipeline_definition_committish
+            self.replication_state_key = replication_state_key
+            self.unchanged = unchanged
         except Exception as e:
             raise ValueError(
                 f'{e=} missing value: {pipeline_name=} {pipeline_definition=} {main_repo=} '
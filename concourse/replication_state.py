@@ -0,0 +1,292 @@
+# SPDX-FileCopyrightText: 2024 SAP SE or an SAP affiliate company and Gardener contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+'''
+persistent state for incremental pipeline-replication
+
+For each replicated (repository, branch), the inputs pipelines were rendered from are recorded
+(head-commit of branch, commit of branch.cfg, version of templates / rendering-code / cc-utils,
+contents of cfg-elements). Upon subsequent
+replications, branches whose inputs did not change need neither be retrieved, nor rendered, nor
+deployed.
+'''
+
+import collections.abc
+import dataclasses
+import functools
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+import concourse.paths
+
+
+logger = logging.getLogger(__name__)
+
+
+@functools.cache
+def render_version() -> str:
+    '''
+    returns a digest of cc-utils' version, and of (mako-)templates and python-sources used for
+    rendering pipelines (i.e. the `concourse` package)
+    '''
+    digest = hashlib.sha256()
+
+    try:
+        with open(concourse.paths.last_released_tag_file, 'rb') as f:
+            digest.update(f.read())
+    except OSError:
+        pass
+
+    for dirpath, dirnames, filenames in os.walk(concourse.paths.own_dir):
+        dirnames[:] = sorted(d for d in dirnames if d != '__pycache__')
+        for filename in sorted(filenames):
+            if not filename.endswith(('.mako', '.py')):
+                continue
+            path = os.path.join(dirpath, filename)
+            digest.update(os.path.relpath(path, concourse.paths.own_dir).encode('utf-8'))
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+
+    return digest.hexdigest()
+
+
+def cfg_set_version(cfg_set) -> str:
+    '''
+    returns a digest of the contents of all cfg-elements referenced by the given cfg-set (which
+    might be rendered into pipelines, e.g. job-mapping, concourse-, github-, or secrets-cfgs)
+    '''
+    cfg_elements = []
+
+    for cfg_type_name, _ in sorted(cfg_set._cfg_mappings()):
+        for cfg_name in sorted(cfg_set._cfg_element_names(cfg_type_name=cfg_type_name)):
+            try:
+                raw = cfg_set._cfg_element(cfg_type_name=cfg_type_name, cfg_name=cfg_name).raw
+            except (KeyError, ValueError):
+                raw = None # referenced, but absent
+            cfg_elements.append((cfg_type_name, cfg_name, raw))
+
+    return hashlib.sha256(
+        json.dumps(cfg_elements, sort_keys=True, default=str).encode('utf-8'),
+    ).hexdigest()
+
+
+@dataclasses.dataclass(frozen=True)
+class ReplicationStateEntry:
+    definition_committish: str # head-commit of branch
+    branch_cfg_committish: str | None # commit of `refs/meta/ci`
+    inputs_version: str # see `ReplicationState.inputs_version`
+    pipeline_names: tuple[str, ...] # as declared in pipeline-definitions
+    recorded: float = dataclasses.field(default_factory=time.time, compare=False)
+
+    @staticmethod
+    def from_dict(raw: dict) -> 'ReplicationStateEntry':
+        return ReplicationStateEntry(
+            definition_committish=raw['definition_committish'],
+            branch_cfg_committish=raw['branch_cfg_committish'],
+            inputs_version=raw['inputs_version'],
+            pipeline_names=tuple(raw['pipeline_names']),
+            recorded=raw['recorded'],
+        )
+
+
+class ReplicationState:
+    def __init__(
+        self,
+        path: str,
+        max_age_seconds: int=24 * 60 * 60,
+    ):
+        '''
+        state of incremental pipeline-replication, persisted (as JSON) at `path`.
+
+        Entries are first recorded as pending (upon enumeration), and are only committed (see
+        `commit`) once all pipelines of the respective branch were successfully deployed.
+        Entries older than `max_age_seconds` are ignored, so that pipelines are regularly
+        re-deployed (e.g. to recover from pipelines that were removed by other means).
+
+        In addition, the contents of `branch.cfg` files are recorded (keyed by commit), so they
+        need not be retrieved again if unchanged.
+
+        :param str path: file to read state from, and to persist state to
+        :param int max_age_seconds: max age of entries to be considered
+        '''
+        self.path = path
+        self.max_age_seconds = max_age_seconds
+
+        self._lock = threading.Lock()
+        self._entries: dict[str, ReplicationStateEntry] = {}
+        self._branch_cfgs: dict[str, tuple[str, dict]] = {} # {repo: (commit, raw_branch_cfg)}
+        self._pending: dict[str, ReplicationStateEntry] = {}
+        self._cfg_set_versions: dict[str, str] = {} # {cfg-set-name: cfg_set_version}
+
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                raw = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f'failed to read replication-state from {self.path=} - ignoring: {e}')
+            return
+
+        try:
+            self._entries = {
+                key: ReplicationStateEntry.from_dict(raw_entry)
+                for key, raw_entry in raw.get('entries', {}).items()
+            }
+            self._branch_cfgs = {
+                repo: tuple(entry)
+                for repo, entry in raw.get('branch_cfgs', {}).items()
+            }
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f'malformed replication-state in {self.path=} - ignoring: {e}')
+            self._entries = {}
+            self._branch_cfgs = {}
+
+    @staticmethod
+    def key(
+        repo_hostname: str,
+        repo_path: str,
+        branch: str,
+    ) -> str:
+        return f'{repo_hostname}/{repo_path}:{branch}'
+
+    def inputs_version(
+        self,
+        cfg_set,
+        *args,
+    ) -> str:
+        '''
+        returns a version of all inputs affecting rendered pipelines (beside pipeline-definitions
+        and branch.cfg), i.e. `render_version`, the contents of the given cfg-set (see
+        `cfg_set_version`; only determined once per cfg-set), and the given (JSON-serialisable) args
+        (e.g. target-team, or contents of cfg-elements not contained in cfg-set)
+        '''
+        with self._lock:
+            if not (cfg_version := self._cfg_set_versions.get(cfg_set.name())):
+                cfg_version = cfg_set_version(cfg_set)
+                self._cfg_set_versions[cfg_set.name()] = cfg_version
+
+        return hashlib.sha256(
+            json.dumps(
+                [render_version(), cfg_set.name(), cfg_version, *args],
+                sort_keys=True,
+                default=str,
+            ).encode('utf-8'),
+        ).hexdigest()
+
+    def entry(
+        self,
+        key: str,
+        definition_committish: str,
+        branch_cfg_committish: str | None,
+        inputs_version: str,
+    ) -> ReplicationStateEntry | None:
+        '''
+        returns the committed entry for the given key, if it is recent, and was recorded for the
+        given inputs
+        '''
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if not entry:
+            return None
+
+        if time.time() - entry.recorded > self.max_age_seconds:
+            return None
+
+        if (
+            entry.definition_committish != definition_committish
+            or entry.branch_cfg_committish != branch_cfg_committish
+            or entry.inputs_version != inputs_version
+        ):
+            return None
+
+        return entry
+
+    def branch_cfg(
+        self,
+        repo_key: str,
+        committish: str,
+    ) -> dict | None:
+        with self._lock:
+            recorded_committish, raw_branch_cfg = self._branch_cfgs.get(repo_key, (None, None))
+
+        if recorded_committish != committish:
+            return None
+
+        return raw_branch_cfg
+
+    def record_branch_cfg(
+        self,
+        repo_key: str,
+        committish: str,
+        raw_branch_cfg: dict,
+    ):
+        with self._lock:
+            self._branch_cfgs[repo_key] = (committish, raw_branch_cfg)
+
+    def record(
+        self,
+        key: str,
+        entry: ReplicationStateEntry,
+    ):
+        '''
+        records the given entry as pending. If no pipelines are to be deployed for it, it is
+        committed immediately.
+        '''
+        with self._lock:
+            if entry.pipeline_names:
+                self._pending[key] = entry
+            else:
+                self._entries[key] = entry
+
+    def commit(
+        self,
+        succeeded_keys: collections.abc.Iterable[str],
+        failed_keys: collections.abc.Iterable[str]=(),
+    ):
+        '''
+        commits pending entries for all keys from `succeeded_keys` that are not contained in
+        `failed_keys`; pending entries for `failed_keys` are discarded (and committed entries are
+        removed, so they are re-deployed next time)
+        '''
+        failed_keys = set(failed_keys)
+
+        with self._lock:
+            for key in set(succeeded_keys) - failed_keys:
+                if (entry := self._pending.pop(key, None)):
+                    self._entries[key] = entry
+
+            for key in failed_keys:
+                self._pending.pop(key, None)
+                self._entries.pop(key, None)
+
+    def save(self):
+        with self._lock:
+            raw = {
+                'entries': {
+                    key: dataclasses.asdict(entry)
+                    for key, entry in self._entries.items()
+                },
+                'branch_cfgs': self._branch_cfgs,
+            }
+
+        state_dir = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(state_dir, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=state_dir, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(raw, f)
+            os.replace(tmp_path, self.path)
+        except:
+            os.unlink(tmp_path)
+            raise
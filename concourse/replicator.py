@@ -1,21 +1,24 @@
+import contextlib
 import dataclasses
 import enum
 import os
+import queue
 import random
 import time
 
 from enum import Enum, IntEnum
-from concurrent.futures import ThreadPoolExecutor
 import functools
+import hashlib
+import json
 import logging
 import textwrap
 import threading
 import traceback
 import typing
 import requests.exceptions
+import yaml
 
 import mako.exceptions
-import mako.template
 
 from ci.util import (
     existing_dir,
@@ -38,6 +41,7 @@ import ccc.concourse
 import ccc.github
 import concourse.client.model
 import concourse.paths
+import concourse.replication_state
 import makoutil
 import model.concourse
 
@@ -60,16 +64,27 @@ def replicate_pipelines(
     expose_pipelines: bool=True,
     unpause_new_pipelines: bool=True,
     remove_pipelines_filter: typing.Callable[[str], bool]=None,
+    replication_state_file: str=None,
 ):
     '''
     @param remove_pipelines_filter: pipeline-names the filter does not match are never removed
+    @param replication_state_file: if passed, replication is done incrementally (only branches
+        whose inputs changed since last replication are rendered and deployed). The state is
+        read from and persisted to this file.
     '''
+    if replication_state_file:
+        replication_state = concourse.replication_state.ReplicationState(
+            path=replication_state_file,
+        )
+    else:
+        replication_state = None
 
     definition_enumerators = [
         GithubOrganisationDefinitionEnumerator(
             job_mapping=job_mapping,
             cfg_set=cfg_set,
             repository_filter=lambda repo: not repo.archived, # exclude archived repositories
+            replication_state=replication_state,
         ),
     ]
 
@@ -102,6 +117,7 @@ def replicate_pipelines(
         definition_renderer=renderer,
         definition_deployer=deployer,
         result_processor=result_processor,
+        replication_state=replication_state,
     )
 
     return replicator.replicate()
@@ -123,14 +139,22 @@ class Renderer:
         template_retriever: TemplateRetriever=TemplateRetriever(),
         template_include_dir=None,
         render_origin: RenderOrigin = RenderOrigin.UNKNOWN,
+        module_directory: str | None=None,
     ):
+        '''
+        :param str module_directory: directory to persist compiled templates in (defaults to
+            the one configured in ctx, if any)
+        '''
         self.template_retriever = template_retriever
         self.render_origin = render_origin
         if template_include_dir:
             template_include_dir = os.path.abspath(template_include_dir)
             self.template_include_dir = os.path.abspath(template_include_dir)
-            from mako.lookup import TemplateLookup
-            self.lookup = TemplateLookup([template_include_dir])
+            self.template_cache = makoutil.template_cache(
+                directories=(template_include_dir,),
+                module_directory=module_directory or makoutil.module_directory(),
+            )
+            self.lookup = self.template_cache.lookup
             self.cfg_set = cfg_set
 
     def render(
@@ -210,8 +234,10 @@ class Renderer:
                 )
             pipeline_metadata['pipeline_name'] = definition_descriptor.effective_pipeline_name()
 
-        with makoutil.template_lock:
-            template = mako.template.Template(template_contents, lookup=self.lookup) # nosec B702
+        template = self.template_cache.template(
+            name=template_name,
+            contents=template_contents,
+        )
 
         try:
             definition_descriptor.pipeline = template.render(
@@ -248,6 +274,7 @@ class DeployStatus(IntEnum):
     FAILED = 2
     SKIPPED = 4
     CREATED = 8
+    UNCHANGED = 16 # deployment was skipped, as deployed definition was already up-to-date
 
 
 @dataclasses.dataclass(frozen=True)
@@ -301,6 +328,83 @@ class FilesystemDeployer(DefinitionDeployer):
             )
 
 
+# attributes concourse omits from returned pipeline-configurations if they are empty, false, or
+# zero (i.e. which are declared as `omitempty`)
+_omitted_if_empty_attributes = frozenset((
+    'attempts',
+    'build_log_retention',
+    'caches',
+    'check_every',
+    'disable_manual_trigger',
+    'get_params',
+    'icon',
+    'inputs',
+    'interruptible',
+    'max_in_flight',
+    'old_name',
+    'outputs',
+    'params',
+    'passed',
+    'privileged',
+    'public',
+    'serial',
+    'serial_groups',
+    'tags',
+    'trigger',
+    'vars',
+    'webhook_token',
+))
+
+# attributes whose values are passed as-is (e.g. as env-vars to tasks, or to resource-types), so
+# any value (including empty / false ones) is significant
+_opaque_attributes = frozenset((
+    'get_params',
+    'params',
+    'source',
+    'vars',
+))
+
+
+def _normalise_pipeline_definition(value):
+    '''
+    drops null-values, and empty values of attributes concourse omits when returning deployed
+    pipeline-configurations. Values of "opaque" attributes (e.g. task-params) are retained as-is.
+    '''
+    if isinstance(value, dict):
+        normalised = {}
+        for k, v in value.items():
+            if v is None:
+                continue
+            if k in _omitted_if_empty_attributes and v in (False, 0, '', [], {}):
+                continue
+            if k in _opaque_attributes:
+                normalised[k] = v
+                continue
+            normalised[k] = _normalise_pipeline_definition(v)
+        return normalised
+    if isinstance(value, list):
+        return [_normalise_pipeline_definition(v) for v in value]
+    return value
+
+
+def pipeline_fingerprint(pipeline_definition: str | dict) -> str:
+    '''
+    returns a fingerprint of the given pipeline-definition (either rendered, i.e. as yaml-str, or
+    as returned from concourse), which is insensitive to formatting, ordering of attributes, and
+    values omitted by concourse (see `_normalise_pipeline_definition`)
+    '''
+    if isinstance(pipeline_definition, str):
+        pipeline_definition = yaml.safe_load(pipeline_definition)
+
+    return hashlib.sha256(
+        json.dumps(
+            _normalise_pipeline_definition(pipeline_definition),
+            sort_keys=True,
+            default=str,
+        ).encode('utf-8'),
+    ).hexdigest()
+
+
 class ConcourseDeployer(DefinitionDeployer):
     def __init__(
         self,
@@ -308,11 +412,59 @@ class ConcourseDeployer(DefinitionDeployer):
         unpause_pipelines: bool,
         unpause_new_pipelines: bool=False,
         expose_pipelines: bool=True,
+        skip_unchanged: bool=True,
     ):
+        '''
+        :param bool skip_unchanged: if True, pipelines whose deployed definition matches the
+            rendered one (see `pipeline_fingerprint`) are not re-deployed
+        '''
         self.cfg_set = cfg_set
         self.unpause_pipelines = unpause_pipelines
         self.unpause_new_pipelines = unpause_new_pipelines
         self.expose_pipelines = expose_pipelines
+        self.skip_unchanged = skip_unchanged
+
+    def _is_unchanged(
+        self,
+        api: concourse.client.api.ConcourseApiBase,
+        pipeline_name: str,
+        pipeline_definition: str,
+    ) -> bool:
+        try:
+            deployed_definition, _ = api.pipeline_config_and_version(pipeline_name)
+        except Exception as e:
+            logger.warning(f'failed to retrieve deployed definition of {pipeline_name=}: {e}')
+            return False
+
+        if not deployed_definition:
+            return False
+
+        return pipeline_fingerprint(deployed_definition) == pipeline_fingerprint(
+            pipeline_definition,
+        )
+
+    def _deploy_unchanged(
+        self,
+        api: concourse.client.api.ConcourseApiBase,
+        definition_descriptor: DefinitionDescriptor,
+    ) -> DeployResult:
+        pipeline_name = definition_descriptor.pipeline_name
+        logger.info(f'Definition of {pipeline_name=} is unchanged - will not deploy')
+
+        if self.unpause_pipelines or self.expose_pipelines:
+            pipeline = api.get_pipeline(pipeline_name)
+
+            if self.unpause_pipelines and pipeline.is_paused():
+                logger.info(f'Unpausing pipeline {pipeline_name}')
+                api.unpause_pipeline(pipeline_name=pipeline_name)
+
+            if self.expose_pipelines and not pipeline.is_public():
+                api.expose_pipeline(pipeline_name=pipeline_name)
+
+        return DeployResult(
+            definition_descriptor=definition_descriptor,
+            deploy_status=DeployStatus.SUCCEEDED | DeployStatus.UNCHANGED,
+        )
 
     def deploy(
         self,
@@ -328,6 +480,16 @@ class ConcourseDeployer(DefinitionDeployer):
                 team_name=definition_descriptor.concourse_target_team,
             )
 
+            if self.skip_unchanged and self._is_unchanged(
+                api=api,
+                pipeline_name=pipeline_name,
+                pipeline_definition=pipeline_definition,
+            ):
+                return self._deploy_unchanged(
+                    api=api,
+                    definition_descriptor=definition_descriptor,
+                )
+
             try:
                 response = api.set_pipeline(
                     name=pipeline_name,
@@ -475,7 +637,14 @@ class ReplicationResultProcessor:
                 pipeline_names.sort()
                 concourse_api.order_pipelines(pipeline_names)
 
-        logger.info('Successfully replicated {d} pipeline(s)'.format(d=len(results) - failed_count))
+        unchanged_count = len([
+            r for r in results
+            if r.deploy_status & DeployStatus.UNCHANGED
+        ])
+        logger.info(
+            f'Successfully replicated {len(results) - failed_count} pipeline(s) '
+            f'(skipped deployment of {unchanged_count} unchanged pipeline(s))'
+        )
 
         if failed_count == 0:
             return True
@@ -644,6 +813,51 @@ class PipelineValidationResultProcessor:
         return True
 
 
+_done = object() # sentinel signalling end of stage
+
+
+class StageMetrics:
+    def __init__(self, name: str):
+        '''
+        collects throughput and latency of a stage of pipeline-replication
+        '''
+        self.name = name
+        self._lock = threading.Lock()
+        self.count = 0
+        self.busy_seconds = 0
+        self.max_seconds = 0
+        self.started = None
+        self.finished = None
+
+    def record(self, start: float, end: float):
+        with self._lock:
+            self.count += 1
+            self.busy_seconds += end - start
+            self.max_seconds = max(self.max_seconds, end - start)
+            self.started = min(self.started or start, start)
+            self.finished = max(self.finished or end, end)
+
+    @contextlib.contextmanager
+    def measure(self):
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record(start=start, end=time.monotonic())
+
+    def summary(self) -> str:
+        with self._lock:
+            if not self.count:
+                return f'{self.name}: no items processed'
+
+            elapsed_seconds = max(self.finished - self.started, 0.001)
+            return (
+                f'{self.name}: {self.count} item(s) in {elapsed_seconds:.1f}s '
+                f'({self.count / elapsed_seconds:.1f}/s); latency: '
+                f'mean={self.busy_seconds / self.count:.3f}s max={self.max_seconds:.3f}s'
+            )
+
+
 class PipelineReplicator:
     def __init__(
             self,
@@ -652,12 +866,29 @@ class PipelineReplicator:
             definition_renderer,
             definition_deployer,
             result_processor=None,
+            replication_state: concourse.replication_state.ReplicationState=None,
+            render_workers: int=4,
+            deploy_workers: int=16,
+            queue_size: int=64,
         ):
+        '''
+        @param replication_state: if passed, entries of successfully deployed (or unchanged)
+            branches are committed and persisted after replication
+        @param render_workers: amount of threads rendering pipeline-definitions (rendering is
+            CPU-bound, so more threads than CPUs will not help)
+        @param deploy_workers: amount of threads deploying rendered pipelines
+        @param queue_size: max amount of definitions waiting to be rendered (or deployed)
+        '''
         self.definition_enumerators = definition_enumerators
         self.descriptor_preprocessor = descriptor_preprocessor
         self.definition_renderer = definition_renderer
         self.definition_deployer = definition_deployer
         self.result_processor = result_processor
+        self.replication_state = replication_state
+        self.render_workers = render_workers
+        self.deploy_workers = deploy_workers
+        self.queue_size = queue_size
+        self.stage_metrics: dict[str, StageMetrics] = {}
 
         # keep track of generated pipelines to detect conflicts
         self._pipeline_names_lock = threading.Lock()
@@ -674,7 +905,14 @@ class PipelineReplicator:
         for enumerator in self.definition_enumerators:
             yield from enumerator.enumerate_definition_descriptors()
 
-    def _process_definition_descriptor(self, definition_descriptor):
+    def _render_definition_descriptor(
+        self,
+        definition_descriptor: DefinitionDescriptor,
+    ) -> DeployResult | DefinitionDescriptor:
+        '''
+        returns the rendered definition-descriptor (to be deployed), or a DeployResult if there
+        is nothing to deploy
+        '''
         if definition_descriptor.exception:
             return DeployResult(
                 definition_descriptor=definition_descriptor,
@@ -685,6 +923,23 @@ class PipelineReplicator:
         preprocessed = self.descriptor_preprocessor.process_definition_descriptor(
                 definition_descriptor
         )
+
+        if definition_descriptor.unchanged:
+            if self._pipeline_name_conflict(definition_descriptor=preprocessed):
+                pipeline_name = preprocessed.pipeline_name
+                logger.warning(f'duplicate pipeline name: {pipeline_name}')
+                return DeployResult(
+                    definition_descriptor=definition_descriptor,
+                    deploy_status=DeployStatus.SKIPPED,
+                    error_details=f'duplicate pipeline name: {pipeline_name}',
+                )
+
+            logger.info(f'inputs of {preprocessed.pipeline_name} did not change - skipping')
+            return DeployResult(
+                definition_descriptor=preprocessed,
+                deploy_status=DeployStatus.SUCCEEDED | DeployStatus.UNCHANGED,
+            )
+
         result = self.definition_renderer.render(preprocessed)
 
         if self._pipeline_name_conflict(
@@ -700,27 +955,162 @@ class PipelineReplicator:
             )
 
         if result.render_status == RenderStatus.SUCCEEDED:
-            deploy_result = self.definition_deployer.deploy(result.definition_descriptor)
-        else:
-            deploy_result = DeployResult(
+            return result.definition_descriptor
+
+        return DeployResult(
+            definition_descriptor=definition_descriptor,
+            deploy_status=DeployStatus.SKIPPED,
+            error_details=result.error_details,
+        )
+
+    def _process_definition_descriptor(self, definition_descriptor):
+        result = self._render_definition_descriptor(definition_descriptor)
+
+        if isinstance(result, DeployResult):
+            return result
+
+        return self.definition_deployer.deploy(result)
+
+    def _replicate(self):
+        '''
+        runs enumeration, rendering and deployment as separate stages, each w/ its own worker(s),
+        connected through bounded queues. Yields deploy-results as they become available.
+        '''
+        self.stage_metrics = {
+            name: StageMetrics(name=name) for name in ('enumerate', 'render', 'deploy')
+        }
+        render_queue = queue.Queue(maxsize=self.queue_size)
+        deploy_queue = queue.Queue(maxsize=self.queue_size)
+        result_queue = queue.Queue()
+        errors = []
+
+        def enumerate_definitions():
+            metrics = self.stage_metrics['enumerate']
+            definitions = self._enumerate_definitions()
+            try:
+                while True:
+                    start = time.monotonic()
+                    if (definition_descriptor := next(definitions, _done)) is _done:
+                        break
+                    metrics.record(start=start, end=time.monotonic())
+                    render_queue.put(definition_descriptor)
+            except BaseException as e:
+                logger.error(f'error while enumerating pipeline-definitions: {e}')
+                errors.append(e)
+            finally:
+                for _ in range(self.render_workers):
+                    render_queue.put(_done)
+
+        def failed_result(definition_descriptor):
+            logger.warning(traceback.format_exc())
+            return DeployResult(
                 definition_descriptor=definition_descriptor,
-                deploy_status=DeployStatus.SKIPPED,
-                error_details=result.error_details,
+                deploy_status=DeployStatus.FAILED,
+                error_details=traceback.format_exc(),
             )
-        return deploy_result
 
-    def _replicate(self):
-        executor = ThreadPoolExecutor(max_workers=16)
-        yield from executor.map(
-            self._process_definition_descriptor,
-            self._enumerate_definitions(),
+        def render():
+            metrics = self.stage_metrics['render']
+            while (definition_descriptor := render_queue.get()) is not _done:
+                try:
+                    with metrics.measure():
+                        result = self._render_definition_descriptor(definition_descriptor)
+                except Exception:
+                    result = failed_result(definition_descriptor)
+
+                if isinstance(result, DeployResult):
+                    result_queue.put(result)
+                else:
+                    deploy_queue.put(result)
+
+        def deploy():
+            metrics = self.stage_metrics['deploy']
+            while (definition_descriptor := deploy_queue.get()) is not _done:
+                try:
+                    with metrics.measure():
+                        result = self.definition_deployer.deploy(definition_descriptor)
+                except Exception:
+                    result = failed_result(definition_descriptor)
+
+                result_queue.put(result)
+
+        def run_stage(
+            name: str,
+            target: typing.Callable[[], None],
+            worker_count: int,
+            downstream: queue.Queue,
+            downstream_worker_count: int,
+        ):
+            # signals end of stage to downstream workers once all workers finished
+            def run_workers():
+                workers = [
+                    threading.Thread(target=target, name=f'replicator-{name}-{idx}', daemon=True)
+                    for idx in range(worker_count)
+                ]
+                for worker in workers:
+                    worker.start()
+                for worker in workers:
+                    worker.join()
+                for _ in range(downstream_worker_count):
+                    downstream.put(_done)
+
+            threading.Thread(target=run_workers, name=f'replicator-{name}', daemon=True).start()
+
+        threading.Thread(
+            target=enumerate_definitions,
+            name='replicator-enumerate',
+            daemon=True,
+        ).start()
+        run_stage(
+            name='render',
+            target=render,
+            worker_count=self.render_workers,
+            downstream=deploy_queue,
+            downstream_worker_count=self.deploy_workers,
         )
+        run_stage(
+            name='deploy',
+            target=deploy,
+            worker_count=self.deploy_workers,
+            downstream=result_queue,
+            downstream_worker_count=1,
+        )
+
+        while (result := result_queue.get()) is not _done:
+            yield result
+
+        if errors:
+            raise errors[0]
+
+    def _update_replication_state(self, results: list[DeployResult]):
+        succeeded_keys = set()
+        failed_keys = set()
+
+        for result in results:
+            if not (key := result.definition_descriptor.replication_state_key):
+                continue
+            if result.deploy_status & DeployStatus.SUCCEEDED:
+                succeeded_keys.add(key)
+            else:
+                failed_keys.add(key)
+
+        self.replication_state.commit(
+            succeeded_keys=succeeded_keys,
+            failed_keys=failed_keys,
+        )
+        self.replication_state.save()
 
     def replicate(self):
         results = [
             result for result in self._replicate()
         ]
 
+        for metrics in self.stage_metrics.values():
+            logger.info(metrics.summary())
+
+        if self.replication_state:
+            self._update_replication_state(results=results)
+
         if self.result_processor:
             return self.result_processor.process_results(results)
         else:
@@ -5,18 +5,17 @@
 
 import os
 
-import mako.template
-import mako.lookup
-
 import makoutil
 
 steps_dir = os.path.abspath(os.path.dirname(__file__))
-template_lookup = mako.lookup.TemplateLookup(directories=(steps_dir,))
 
 
 def step_template(name):
-    with makoutil.template_lock:
-        return template_lookup.get_template(f'/{name}.mako')
+    template_cache = makoutil.template_cache(
+        directories=(steps_dir,),
+        module_directory=makoutil.module_directory(),
+    )
+    return template_cache.get_template(f'/{name}.mako')
 
 
 def step_def(name):
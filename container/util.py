@@ -19,6 +19,7 @@ import oci
 import oci.client as oc
 import oci.convert as oconv
 import oci.platform
+import oci.transfer
 import oci.model as om
 import tarutil
 
@@ -33,6 +34,7 @@ def filter_image(
     mode: oci.ReplicationMode=oci.ReplicationMode.REGISTRY_DEFAULTS,
     platform_filter: typing.Callable[[om.OciPlatform], bool]=None,
     oci_manifest_annotations: dict[str, str]=None,
+    blob_transfer_pool: oci.transfer.BlobTransferPool=None,
 ) -> typing.Tuple[requests.Response, str, bytes]: # response, tgt-ref, manifest_bytes
     source_ref = om.OciImageReference.to_image_ref(source_ref)
     target_ref = om.OciImageReference.to_image_ref(target_ref)
@@ -46,6 +48,7 @@ def filter_image(
             mode=mode,
             platform_filter=platform_filter,
             annotations=oci_manifest_annotations,
+            blob_transfer_pool=blob_transfer_pool,
         )
 
     if mode is oci.ReplicationMode.REGISTRY_DEFAULTS:
@@ -91,6 +94,7 @@ def filter_image(
                 remove_files=remove_files,
                 oci_client=oci_client,
                 oci_manifest_annotations=oci_manifest_annotations,
+                blob_transfer_pool=blob_transfer_pool,
             )
 
             # patch (potentially) modified manifest-digest
@@ -141,6 +145,7 @@ def filter_image(
             remove_files=remove_files,
             oci_client=oci_client,
             oci_manifest_annotations=oci_manifest_annotations,
+            blob_transfer_pool=blob_transfer_pool,
         )
 
         manifest_list = om.OciImageManifestList(
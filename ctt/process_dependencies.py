@@ -4,6 +4,7 @@
 
 import collections.abc
 import concurrent.futures
+import contextlib
 import copy
 import dataclasses
 import enum
@@ -15,20 +16,21 @@ import jsonschema
 import logging
 import os
 import threading
+import time
 import typing
 
-import dacite
-
 import ci.util
 import ctt.replicate
 import cnudie.iter
 import cnudie.retrieve
 import container.util
 import ocm
+import ocm.decoder
 import ocm.gardener
 import oci
 import oci.client
 import oci.model as om
+import oci.transfer
 
 import ctt.filters as filters
 import ctt.model
@@ -282,43 +284,123 @@ def enum_processing_cfgs(
     )
 
 
-def determine_changed_components(
-    component_descriptor: ocm.ComponentDescriptor,
-    tgt_ocm_repo_url: str,
-    component_descriptor_lookup: cnudie.retrieve.ComponentDescriptorLookupById,
-    tgt_component_descriptor_lookup: cnudie.retrieve.ComponentDescriptorLookupById,
-    component_filter: collections.abc.Callable[[ocm.Component], bool]=None,
-    reftype_filter: collections.abc.Callable[[cnudie.iter.NodeReferenceType], bool]=None,
-) -> collections.abc.Generator[ocm.ComponentDescriptor, None, None]:
-    component = component_descriptor.component
-
-    if component_filter and component_filter(component):
-        return
-
-    if tgt_component_descriptor_lookup(
-        component.identity(),
-        absent_ok=True,
+class ExecutionContext:
+    def __init__(
+        self,
+        max_workers: int=16,
+        blob_transfer_pool: oci.transfer.BlobTransferPool=None,
     ):
-        logger.info(
-            f'{component.identity()} already exists in {tgt_ocm_repo_url=} '
-            '- skipping replication of transitive closure'
+        '''
+        state shared throughout processing (planning and execution of replication-plan-steps):
+
+        - a thread-pool used for (concurrent) processing of resources; it is shut down upon
+          `close` (or when leaving the context, if used as context-manager)
+        - a blob-transfer-pool shared by all concurrently processed resources (so its limits
+          apply to the replication as a whole)
+        - processing-pipelines, instantiated once per processing-cfg (see `processing_pipelines`)
+        - accumulated durations per processing-stage (see `stage`, `timings`)
+
+        :param int max_workers: size of thread-pool
+        :param BlobTransferPool blob_transfer_pool: defaults to the process-wide pool (see
+            `oci.transfer.default_blob_transfer_pool`); not shut down upon `close`
+        '''
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix='ctt',
         )
+        self.blob_transfer_pool = blob_transfer_pool or oci.transfer.default_blob_transfer_pool()
+        self._processing_pipelines = {} # {id(processing_cfg): (processing_cfg, pipelines)}
+        self._timings = collections.defaultdict(float) # {stage: seconds}
+        self._lock = threading.Lock()
+
+    def processing_pipelines(
+        self,
+        processing_cfg: dict,
+    ) -> tuple[ProcessingPipeline]:
+        '''
+        returns the processing-pipelines for the given processing-cfg (which must not be modified
+        afterwards). Pipelines are stateless, and may thus be shared between resources.
+        '''
+        with self._lock:
+            # keep reference to processing-cfg, so its id is not reused
+            if (entry := self._processing_pipelines.get(id(processing_cfg))):
+                return entry[1]
+
+            pipelines = tuple(enum_processing_cfgs(
+                processing_cfg=processing_cfg,
+                shared_targets={
+                    name: _target(cfg)
+                    for name, cfg in processing_cfg.get('targets', {}).items()
+                },
+                shared_processors={
+                    name: _processor(cfg)
+                    for name, cfg in processing_cfg.get('processors', {}).items()
+                },
+                shared_uploaders={
+                    name: _uploader(cfg)
+                    for name, cfg in processing_cfg.get('uploaders', {}).items()
+                },
+            ))
+            self._processing_pipelines[id(processing_cfg)] = (processing_cfg, pipelines)
+
+            return pipelines
+
+    @contextlib.contextmanager
+    def stage(
+        self,
+        name: str,
+    ):
+        '''
+        context-manager measuring the duration of the given processing-stage; durations of
+        stages w/ same name are summed up
+        '''
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._timings[name] += time.monotonic() - start
+
+    @property
+    def timings(self) -> dict[str, float]:
+        with self._lock:
+            return dict(self._timings)
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        self.close()
+
+
+@contextlib.contextmanager
+def _execution_context(
+    execution_context: ExecutionContext | None,
+):
+    '''
+    yields the given execution-context, or, if none is passed, a new one, which is closed afterwards
+    '''
+    if execution_context:
+        yield execution_context
         return
 
-    for cref in component.componentReferences:
-        referenced_component_descriptor = component_descriptor_lookup(ocm.ComponentIdentity(
+    with ExecutionContext() as execution_context:
+        yield execution_context
+
+
+def _referenced_component_ids(
+    component: ocm.Component,
+    reftype_filter: collections.abc.Callable[[cnudie.iter.NodeReferenceType], bool]=None,
+) -> tuple[ocm.ComponentIdentity]:
+    component_ids = [
+        ocm.ComponentIdentity(
             name=cref.componentName,
             version=cref.version,
-        ))
-
-        yield from determine_changed_components(
-            component_descriptor=referenced_component_descriptor,
-            tgt_ocm_repo_url=tgt_ocm_repo_url,
-            component_descriptor_lookup=component_descriptor_lookup,
-            tgt_component_descriptor_lookup=tgt_component_descriptor_lookup,
-            component_filter=component_filter,
-            reftype_filter=reftype_filter,
-        )
+        ) for cref in component.componentReferences
+    ]
 
     if not (
         reftype_filter and reftype_filter(cnudie.iter.NodeReferenceType.EXTRA_COMPONENT_REFS_LABEL)
@@ -326,23 +408,157 @@ def determine_changed_components(
         extra_crefs_label := component.find_label(ocm.gardener.ExtraComponentReferencesLabel.name)
     ):
         for extra_cref_raw in extra_crefs_label.value:
-            extra_cref = dacite.from_dict(
+            extra_cref = ocm.decoder.default_decoder.decode(
                 data_class=ocm.gardener.ExtraComponentReference,
                 data=extra_cref_raw,
             )
-            extra_cref_id = extra_cref.component_reference
-            referenced_component_descriptor = component_descriptor_lookup(extra_cref_id)
+            component_ids.append(extra_cref.component_reference)
+
+    return tuple(component_ids)
+
+
+def determine_changed_components_for_targets(
+    component_descriptor: ocm.ComponentDescriptor,
+    component_descriptor_lookup: cnudie.retrieve.ComponentDescriptorLookupById,
+    tgt_component_descriptor_lookups: dict[str, cnudie.retrieve.ComponentDescriptorLookupById],
+    component_filter: collections.abc.Callable[[ocm.Component], bool]=None,
+    reftype_filter: collections.abc.Callable[[cnudie.iter.NodeReferenceType], bool]=None,
+    execution_context: ExecutionContext | None=None,
+) -> dict[str, tuple[ocm.ComponentDescriptor]]:
+    '''
+    determines, for each of the given target ocm-repositories, the components that need to be
+    replicated (i.e. are absent in the target ocm-repository), starting from the given root
+    component. Components found in a target ocm-repository are assumed to be complete, i.e. their
+    transitive closure is not considered for this target.
+
+    The component-graph is resolved level-by-level; lookups of referenced components, as well as
+    probes for existence in all target ocm-repositories, are done concurrently. Each component is
+    looked-up (and probed for in each target ocm-repository) at most once.
+
+    Returns a mapping {tgt_ocm_repo_url: component-descriptors}. Component-descriptors are ordered
+    topologically (referenced components precede referencing ones, root-component comes last).
+
+    @param tgt_component_descriptor_lookups: {tgt_ocm_repo_url: lookup}
+    @param execution_context: provides thread-pool to use (a new one is created if not passed)
+    '''
+    root_component_id = component_descriptor.component.identity()
+    component_descriptors = {root_component_id: component_descriptor}
+    references = {} # {component-id: referenced component-ids}
+    exists = {} # {(tgt_ocm_repo_url, component-id): bool}
+    filtered_component_ids = set()
+
+    with _execution_context(execution_context) as execution_context:
+        executor = execution_context.executor
+        level = [root_component_id]
+
+        while level:
+            for component_id in level:
+                component = component_descriptors[component_id].component
+                if component_filter and component_filter(component):
+                    filtered_component_ids.add(component_id)
+
+            level = [
+                component_id for component_id in level
+                if component_id not in filtered_component_ids
+            ]
+
+            probes = {
+                (tgt_ocm_repo_url, component_id): executor.submit(
+                    tgt_component_descriptor_lookup,
+                    component_id,
+                    absent_ok=True,
+                )
+                for component_id in level
+                for tgt_ocm_repo_url, tgt_component_descriptor_lookup
+                in tgt_component_descriptor_lookups.items()
+            }
+            for key, probe in probes.items():
+                exists[key] = bool(probe.result())
+
+            next_level = []
+            for component_id in level:
+                if all(
+                    exists[(tgt_ocm_repo_url, component_id)]
+                    for tgt_ocm_repo_url in tgt_component_descriptor_lookups
+                ):
+                    continue # no need to resolve transitive closure
+
+                references[component_id] = _referenced_component_ids(
+                    component=component_descriptors[component_id].component,
+                    reftype_filter=reftype_filter,
+                )
+
+                for referenced_component_id in references[component_id]:
+                    if (
+                        referenced_component_id in component_descriptors
+                        or referenced_component_id in next_level
+                    ):
+                        continue
+                    next_level.append(referenced_component_id)
+
+            for referenced_component_id, referenced_component_descriptor in zip(
+                next_level,
+                executor.map(component_descriptor_lookup, next_level),
+            ):
+                component_descriptors[referenced_component_id] = referenced_component_descriptor
+
+            level = next_level
+
+    def iter_changed_components(
+        tgt_ocm_repo_url: str,
+        component_id: ocm.ComponentIdentity,
+        visited: set[ocm.ComponentIdentity],
+    ) -> collections.abc.Generator[ocm.ComponentDescriptor, None, None]:
+        if component_id in visited or component_id in filtered_component_ids:
+            return
+        visited.add(component_id)
+
+        if exists[(tgt_ocm_repo_url, component_id)]:
+            logger.info(
+                f'{component_id} already exists in {tgt_ocm_repo_url=} '
+                '- skipping replication of transitive closure'
+            )
+            return
 
-            yield from determine_changed_components(
-                component_descriptor=referenced_component_descriptor,
+        for referenced_component_id in references[component_id]:
+            yield from iter_changed_components(
                 tgt_ocm_repo_url=tgt_ocm_repo_url,
-                component_descriptor_lookup=component_descriptor_lookup,
-                tgt_component_descriptor_lookup=tgt_component_descriptor_lookup,
-                component_filter=component_filter,
-                reftype_filter=reftype_filter,
+                component_id=referenced_component_id,
+                visited=visited,
             )
 
-    yield component_descriptor
+        yield component_descriptors[component_id]
+
+    return {
+        tgt_ocm_repo_url: tuple(iter_changed_components(
+            tgt_ocm_repo_url=tgt_ocm_repo_url,
+            component_id=root_component_id,
+            visited=set(),
+        ))
+        for tgt_ocm_repo_url in tgt_component_descriptor_lookups
+    }
+
+
+def determine_changed_components(
+    component_descriptor: ocm.ComponentDescriptor,
+    tgt_ocm_repo_url: str,
+    component_descriptor_lookup: cnudie.retrieve.ComponentDescriptorLookupById,
+    tgt_component_descriptor_lookup: cnudie.retrieve.ComponentDescriptorLookupById,
+    component_filter: collections.abc.Callable[[ocm.Component], bool]=None,
+    reftype_filter: collections.abc.Callable[[cnudie.iter.NodeReferenceType], bool]=None,
+) -> collections.abc.Generator[ocm.ComponentDescriptor, None, None]:
+    '''
+    single-target variant of `determine_changed_components_for_targets`
+    '''
+    yield from determine_changed_components_for_targets(
+        component_descriptor=component_descriptor,
+        component_descriptor_lookup=component_descriptor_lookup,
+        tgt_component_descriptor_lookups={
+            tgt_ocm_repo_url: tgt_component_descriptor_lookup,
+        },
+        component_filter=component_filter,
+        reftype_filter=reftype_filter,
+    )[tgt_ocm_repo_url]
 
 
 uploaded_image_refs_to_digests = {}  # <ref>:<digest>
@@ -358,6 +574,7 @@ def process_upload_request(
     platform_filter: collections.abc.Callable[[om.OciPlatform], bool]=None,
     inject_ocm_coordinates_into_oci_manifests: bool=False,
     processing_mode: ProcessingMode=ProcessingMode.REGULAR,
+    blob_transfer_pool: oci.transfer.BlobTransferPool=None,
 ) -> str:
     src_ref = replication_resource_element.src_ref
     tgt_ref = replication_resource_element.tgt_ref
@@ -419,6 +636,7 @@ def process_upload_request(
             platform_filter=platform_filter,
             oci_client=oci_client,
             oci_manifest_annotations=oci_manifest_annotations,
+            blob_transfer_pool=blob_transfer_pool,
         )
     except Exception as e:
         logger.error(
@@ -514,42 +732,8 @@ def iter_replication_resource_elements(
     tgt_oci_registry: str,
     oci_client: oci.client.Client,
     replication_mode: oci.ReplicationMode=oci.ReplicationMode.PREFER_MULTIARCH,
+    execution_context: ExecutionContext | None=None,
 ) -> collections.abc.Iterable[ctt.model.ReplicationResourceElement]:
-    shared_targets = {
-        name: _target(cfg) for name, cfg in processing_cfg.get('targets', {}).items()
-    }
-    shared_processors = {
-        name: _processor(cfg) for name, cfg in processing_cfg.get('processors', {}).items()
-    }
-    shared_uploaders = {
-        name: _uploader(cfg) for name, cfg in processing_cfg.get('uploaders', {}).items()
-    }
-
-    def create_replication_resource_element(
-        component: ocm.Component,
-        resource: ocm.Resource,
-    ) -> ctt.model.ReplicationResourceElement | None:
-        for pipeline in enum_processing_cfgs(
-            processing_cfg=processing_cfg,
-            shared_targets=shared_targets,
-            shared_processors=shared_processors,
-            shared_uploaders=shared_uploaders,
-        ):
-            replication_resource_element = pipeline.process(
-                component=component,
-                resource=resource,
-                tgt_oci_registry=tgt_oci_registry,
-                oci_client=oci_client,
-                replication_mode=replication_mode,
-            )
-
-            if replication_resource_element:
-                return replication_resource_element
-
-        logger.debug(
-            f'skipped processing: {component.name}:{resource.access} ({tgt_oci_registry=})'
-        )
-
     components_with_resource = [
         (component_descriptor.component, resource)
         for component_descriptor in component_descriptors
@@ -557,14 +741,37 @@ def iter_replication_resource_elements(
         if resource.access.type is ocm.AccessType.OCI_REGISTRY
     ]
 
-    executor = concurrent.futures.ThreadPoolExecutor(max_workers=16)
-    yield from (
-        replication_resource_element for replication_resource_element in executor.map(
-            create_replication_resource_element,
-            [component for component, _ in components_with_resource],
-            [resource for _, resource in components_with_resource],
-        ) if replication_resource_element
-    )
+    with _execution_context(execution_context) as execution_context:
+        pipelines = execution_context.processing_pipelines(processing_cfg)
+
+        def create_replication_resource_element(
+            component: ocm.Component,
+            resource: ocm.Resource,
+        ) -> ctt.model.ReplicationResourceElement | None:
+            for pipeline in pipelines:
+                replication_resource_element = pipeline.process(
+                    component=component,
+                    resource=resource,
+                    tgt_oci_registry=tgt_oci_registry,
+                    oci_client=oci_client,
+                    replication_mode=replication_mode,
+                )
+
+                if replication_resource_element:
+                    return replication_resource_element
+
+            logger.debug(
+                f'skipped processing: {component.name}:{resource.access} ({tgt_oci_registry=})'
+            )
+
+        yield from (
+            replication_resource_element
+            for replication_resource_element in execution_context.executor.map(
+                create_replication_resource_element,
+                [component for component, _ in components_with_resource],
+                [resource for _, resource in components_with_resource],
+            ) if replication_resource_element
+        )
 
 
 def create_replication_plan_step(
@@ -579,33 +786,51 @@ def create_replication_plan_step(
     component_filter: collections.abc.Callable[[ocm.Component], bool] | None=None,
     reftype_filter: collections.abc.Callable[[cnudie.iter.NodeReferenceType], bool] | None=None,
     remove_label: collections.abc.Callable[[str], bool]=None,
+    component_descriptors: collections.abc.Iterable[ocm.ComponentDescriptor] | None=None,
+    execution_context: ExecutionContext | None=None,
 ) -> ctt.model.ReplicationPlanStep:
+    '''
+    @param component_descriptors: optional, precalculated components to be replicated (see
+                                  `determine_changed_components_for_targets`); if not passed,
+                                  they are determined using the given lookups
+    @param execution_context: optional, shared execution-context (a new one is created if not
+                              passed)
+    '''
     tgt_ocm_repo = ocm.OciOcmRepository(
         baseUrl=ci.util.urljoin(tgt_oci_registry, tgt_ocm_repo_path),
     )
 
-    component_descriptors = tuple(determine_changed_components(
-        component_descriptor=root_component_descriptor,
-        tgt_ocm_repo_url=tgt_ocm_repo.oci_ref,
-        component_descriptor_lookup=src_component_descriptor_lookup,
-        tgt_component_descriptor_lookup=tgt_component_descriptor_lookup,
-        component_filter=component_filter,
-        reftype_filter=reftype_filter,
-    ))
-
-    components = tuple(iter_replication_plan_components(
-        component_descriptors=component_descriptors,
-        tgt_ocm_repo=tgt_ocm_repo,
-        remove_label=remove_label,
-    ))
-
-    resources = tuple(iter_replication_resource_elements(
-        component_descriptors=component_descriptors,
-        processing_cfg=processing_cfg,
-        tgt_oci_registry=tgt_oci_registry,
-        oci_client=oci_client,
-        replication_mode=replication_mode,
-    ))
+    with _execution_context(execution_context) as execution_context:
+        if component_descriptors is None:
+            with execution_context.stage('determine-changed-components'):
+                component_descriptors = tuple(determine_changed_components_for_targets(
+                    component_descriptor=root_component_descriptor,
+                    component_descriptor_lookup=src_component_descriptor_lookup,
+                    tgt_component_descriptor_lookups={
+                        tgt_ocm_repo.oci_ref: tgt_component_descriptor_lookup,
+                    },
+                    component_filter=component_filter,
+                    reftype_filter=reftype_filter,
+                    execution_context=execution_context,
+                )[tgt_ocm_repo.oci_ref])
+        component_descriptors = tuple(component_descriptors)
+
+        with execution_context.stage('plan-components'):
+            components = tuple(iter_replication_plan_components(
+                component_descriptors=component_descriptors,
+                tgt_ocm_repo=tgt_ocm_repo,
+                remove_label=remove_label,
+            ))
+
+        with execution_context.stage('plan-resources'):
+            resources = tuple(iter_replication_resource_elements(
+                component_descriptors=component_descriptors,
+                processing_cfg=processing_cfg,
+                tgt_oci_registry=tgt_oci_registry,
+                oci_client=oci_client,
+                replication_mode=replication_mode,
+                execution_context=execution_context,
+            ))
 
     return ctt.model.ReplicationPlanStep(
         target_ocm_repository=tgt_ocm_repo.oci_ref,
@@ -630,6 +855,7 @@ def process_images(
     remove_label: collections.abc.Callable[[str], bool]=None,
     tgt_ocm_repo_path: str=None,
     tgt_ocm_base_url: str | None=None, # deprecated -> replaced by `tgt_ocm_repo_path`
+    execution_context: ExecutionContext | None=None,
 ) -> collections.abc.Generator[cnudie.iter.Node, None, None]:
     '''
     note: Passing a filter to prevent component descriptors from being replicated using the
@@ -638,6 +864,8 @@ def process_images(
     `component_filter` parameter will also exclude its resources as well as all transitive component
     references from the replication. In both cases, `True` means the respective component is
     _excluded_.
+
+    If no `execution_context` is passed, a new one is created (and closed after processing).
     '''
     processing_cfg = parse_processing_cfg(processing_cfg_path)
 
@@ -670,53 +898,82 @@ def process_images(
         elif 'registries' in target_cfg['kwargs']:
             tgt_oci_registries.update(target_cfg['kwargs']['registries'])
 
-    replication_plan = ctt.model.ReplicationPlan()
-
-    for tgt_oci_registry in tgt_oci_registries:
-        tgt_component_descriptor_lookup = create_component_descriptor_lookup_for_ocm_repo(
-            ocm_repo_url=ci.util.urljoin(tgt_oci_registry, tgt_ocm_repo_path),
-            oci_client=oci_client,
-            delivery_service_client=delivery_service_client,
-        )
+    with _execution_context(execution_context) as execution_context:
+        try:
+            replication_plan = ctt.model.ReplicationPlan()
+
+            tgt_ocm_repo_urls = {
+                tgt_oci_registry: ci.util.urljoin(tgt_oci_registry, tgt_ocm_repo_path)
+                for tgt_oci_registry in tgt_oci_registries
+            }
+            tgt_component_descriptor_lookups = {
+                tgt_ocm_repo_url: create_component_descriptor_lookup_for_ocm_repo(
+                    ocm_repo_url=tgt_ocm_repo_url,
+                    oci_client=oci_client,
+                    delivery_service_client=delivery_service_client,
+                ) for tgt_ocm_repo_url in tgt_ocm_repo_urls.values()
+            }
+
+            # resolve component-graph only once, probing for existing components in all targets
+            with execution_context.stage('determine-changed-components'):
+                changed_component_descriptors = determine_changed_components_for_targets(
+                    component_descriptor=root_component_descriptor,
+                    component_descriptor_lookup=component_descriptor_lookup,
+                    tgt_component_descriptor_lookups=tgt_component_descriptor_lookups,
+                    component_filter=component_filter,
+                    reftype_filter=reftype_filter,
+                    execution_context=execution_context,
+                )
 
-        replication_plan_step = create_replication_plan_step(
-            processing_cfg=processing_cfg,
-            root_component_descriptor=root_component_descriptor,
-            src_component_descriptor_lookup=component_descriptor_lookup,
-            tgt_component_descriptor_lookup=tgt_component_descriptor_lookup,
-            tgt_oci_registry=tgt_oci_registry,
-            tgt_ocm_repo_path=tgt_ocm_repo_path,
-            oci_client=oci_client,
-            replication_mode=replication_mode,
-            component_filter=component_filter,
-            reftype_filter=reftype_filter,
-            remove_label=remove_label,
-        )
-        replication_plan.steps.append(replication_plan_step)
+            for tgt_oci_registry in tgt_oci_registries:
+                tgt_ocm_repo_url = tgt_ocm_repo_urls[tgt_oci_registry]
+                tgt_component_descriptor_lookup = tgt_component_descriptor_lookups[tgt_ocm_repo_url]
+
+                replication_plan_step = create_replication_plan_step(
+                    processing_cfg=processing_cfg,
+                    root_component_descriptor=root_component_descriptor,
+                    src_component_descriptor_lookup=component_descriptor_lookup,
+                    tgt_component_descriptor_lookup=tgt_component_descriptor_lookup,
+                    tgt_oci_registry=tgt_oci_registry,
+                    tgt_ocm_repo_path=tgt_ocm_repo_path,
+                    oci_client=oci_client,
+                    replication_mode=replication_mode,
+                    component_filter=component_filter,
+                    reftype_filter=reftype_filter,
+                    remove_label=remove_label,
+                    component_descriptors=changed_component_descriptors[tgt_ocm_repo_url],
+                    execution_context=execution_context,
+                )
+                replication_plan.steps.append(replication_plan_step)
 
-    logger.info(replication_plan)
+            logger.info(replication_plan)
 
-    for replication_plan_step in replication_plan.steps:
-        tgt_component_descriptor_lookup = create_component_descriptor_lookup_for_ocm_repo(
-            ocm_repo_url=replication_plan_step.target_ocm_repository,
-            oci_client=oci_client,
-            delivery_service_client=delivery_service_client,
-        )
+            for replication_plan_step in replication_plan.steps:
+                tgt_component_descriptor_lookup = create_component_descriptor_lookup_for_ocm_repo(
+                    ocm_repo_url=replication_plan_step.target_ocm_repository,
+                    oci_client=oci_client,
+                    delivery_service_client=delivery_service_client,
+                )
 
-        yield from process_replication_plan_step(
-            replication_plan_step=replication_plan_step,
-            root_component_descriptor=root_component_descriptor,
-            oci_client=oci_client,
-            tgt_component_descriptor_lookup=tgt_component_descriptor_lookup,
-            processing_mode=processing_mode,
-            replication_mode=replication_mode,
-            inject_ocm_coordinates_into_oci_manifests=inject_ocm_coordinates_into_oci_manifests,
-            platform_filter=platform_filter,
-            component_filter=component_filter,
-            reftype_filter=reftype_filter,
-            skip_cd_validation=skip_cd_validation,
-            skip_component_upload=skip_component_upload,
-        )
+                yield from process_replication_plan_step(
+                    replication_plan_step=replication_plan_step,
+                    root_component_descriptor=root_component_descriptor,
+                    oci_client=oci_client,
+                    tgt_component_descriptor_lookup=tgt_component_descriptor_lookup,
+                    processing_mode=processing_mode,
+                    replication_mode=replication_mode,
+                    inject_ocm_coordinates_into_oci_manifests=(
+                        inject_ocm_coordinates_into_oci_manifests
+                    ),
+                    platform_filter=platform_filter,
+                    component_filter=component_filter,
+                    reftype_filter=reftype_filter,
+                    skip_cd_validation=skip_cd_validation,
+                    skip_component_upload=skip_component_upload,
+                    execution_context=execution_context,
+                )
+        finally:
+            logger.info(f'processing-stage durations (seconds): {execution_context.timings}')
 
 
 def process_replication_plan_step(
@@ -732,6 +989,7 @@ def process_replication_plan_step(
     reftype_filter: collections.abc.Callable[[cnudie.iter.NodeReferenceType], bool] | None=None,
     skip_cd_validation: bool=False,
     skip_component_upload: collections.abc.Callable[[ocm.Component], bool] | None=None,
+    execution_context: ExecutionContext | None=None,
 ) -> collections.abc.Generator[cnudie.iter.Node, None, None]:
     def process_replication_resource_element(
         replication_resource_element: ctt.model.ReplicationResourceElement,
@@ -743,6 +1001,7 @@ def process_replication_plan_step(
             platform_filter=platform_filter,
             inject_ocm_coordinates_into_oci_manifests=inject_ocm_coordinates_into_oci_manifests,
             processing_mode=processing_mode,
+            blob_transfer_pool=execution_context.blob_transfer_pool,
         )
 
         if not oci_manifest_digest:
@@ -815,133 +1074,147 @@ def process_replication_plan_step(
             logger.error(f'exception while processing {replication_resource_element=}')
             raise e
 
-    executor = concurrent.futures.ThreadPoolExecutor(max_workers=16)
-    replication_resource_elements = tuple(executor.map(
-        wrap_process_resource,
-        replication_plan_step.resources,
-    ))
+    with _execution_context(execution_context) as execution_context:
+        with execution_context.stage('process-resources'):
+            replication_resource_elements = tuple(execution_context.executor.map(
+                wrap_process_resource,
+                replication_plan_step.resources,
+            ))
 
-    is_root_component_descriptor = lambda component_descriptor: (
-        component_descriptor.component.name == root_component_descriptor.component.name
-        and component_descriptor.component.version == root_component_descriptor.component.version
-    )
+        is_root_component_descriptor = lambda component_descriptor: (
+            component_descriptor.component.name == root_component_descriptor.component.name
+            and component_descriptor.component.version == root_component_descriptor.component.version
+        )
 
-    for replication_plan_component in replication_plan_step.components:
-        if is_root_component_descriptor(replication_plan_component.target):
-            # store modified root target component descriptor because `cnudie.iter.iter` won't
-            # resolve the (updated) root component descriptor again
-            root_component_descriptor = replication_plan_component.target
-
-        component = replication_plan_component.target.component
-
-        resource_group = [
-            replication_resource_element.target
-            for replication_resource_element in replication_resource_elements
-            if replication_resource_element.component_id == component.identity()
-        ]
-
-        patched_resources = {}
-
-        # patch-in overwrites (caveat: must be done sequentially, as lists are not threadsafe)
-        # use copy of resources as peers to shortcut "self"-check in identity function
-        peer_resources = [
-            copy.deepcopy(resource)
-            for resource in component.resources
-        ]
-
-        for resource in resource_group:
-            patched_resources[resource.identity(peer_resources)] = resource
-
-        component.resources = [
-            patched_resources.get(resource.identity(peer_resources), resource)
-            for resource in component.resources
-        ]
-
-        # Validate the patched component-descriptor and exit on fail
-        if not skip_cd_validation:
-            # ensure component-descriptor is json-serialisable
-            raw = dataclasses.asdict(replication_plan_component.target)
-            try:
-                raw_json = json.dumps(raw, cls=ctt_util.EnumJSONEncoder)
-            except Exception as e:
-                logger.error(f'Component-Descriptor could not be json-serialised: {e}')
-                raise
-            try:
-                raw = json.loads(raw_json)
-            except Exception as e:
-                logger.error(f'Component-Descriptor could not be deserialised: {e}')
-                raise
-
-            try:
-                ocm.ComponentDescriptor.validate(raw, validation_mode=ocm.ValidationMode.FAIL)
-            except jsonschema.exceptions.RefResolutionError as rre:
-                logger.warning(
-                    'error whilst resolving reference from json-schema (see below) - will ignore'
+        with execution_context.stage('publish-components'):
+            for replication_plan_component in replication_plan_step.components:
+                if is_root_component_descriptor(replication_plan_component.target):
+                    # store modified root target component descriptor because `cnudie.iter.iter`
+                    # won't resolve the (updated) root component descriptor again
+                    root_component_descriptor = replication_plan_component.target
+
+                component = replication_plan_component.target.component
+
+                resource_group = [
+                    replication_resource_element.target
+                    for replication_resource_element in replication_resource_elements
+                    if replication_resource_element.component_id == component.identity()
+                ]
+
+                patched_resources = {}
+
+                # patch-in overwrites (caveat: must be done sequentially, as lists are not
+                # threadsafe)
+                # do not regard resources as peers to shortcut "self"-check in identity function
+                resource_identities = component.resource_identities()
+
+                for resource in resource_group:
+                    resource_identity = resource_identities.identity(resource, as_peer=False)
+                    patched_resources[resource_identity] = resource
+
+                component.resources = [
+                    patched_resources.get(
+                        resource_identities.identity(resource, as_peer=False),
+                        resource,
+                    ) for resource in component.resources
+                ]
+
+                # Validate the patched component-descriptor and exit on fail
+                if not skip_cd_validation:
+                    # ensure component-descriptor is json-serialisable
+                    raw = dataclasses.asdict(replication_plan_component.target)
+                    try:
+                        raw_json = json.dumps(raw, cls=ctt_util.EnumJSONEncoder)
+                    except Exception as e:
+                        logger.error(f'Component-Descriptor could not be json-serialised: {e}')
+                        raise
+                    try:
+                        raw = json.loads(raw_json)
+                    except Exception as e:
+                        logger.error(f'Component-Descriptor could not be deserialised: {e}')
+                        raise
+
+                    try:
+                        ocm.ComponentDescriptor.validate(
+                            raw,
+                            validation_mode=ocm.ValidationMode.FAIL,
+                        )
+                    except jsonschema.exceptions.RefResolutionError as rre:
+                        logger.warning(
+                            'error whilst resolving reference from json-schema (see below) - '
+                            'will ignore'
+                        )
+                        print(rre)
+                    except Exception as e:
+                        component_id = f'{component.name}:{component.version}'
+                        logger.warning(
+                            f'Schema validation for component-descriptor {component_id} failed '
+                            f'with {e}'
+                        )
+
+                # publish the (patched) component-descriptors
+                if skip_component_upload and skip_component_upload(component):
+                    continue
+
+                if processing_mode is ProcessingMode.DRY_RUN:
+                    print('dry-run - will not publish component-descriptor')
+                    continue
+                elif processing_mode is not ProcessingMode.REGULAR:
+                    raise NotImplementedError(processing_mode)
+
+                if len(ocm_repos := component.repositoryContexts) >= 2:
+                    orig_ocm_repo = component.repositoryContexts[-2]
+                elif len(ocm_repos) == 1:
+                    logger.warning(
+                        f'{component.name}:{component.version} has only one ocm-repository'
+                    )
+                    logger.warning('(expected: two or more)')
+                    logger.warning(f'{ocm_repos=}')
+                    orig_ocm_repo = component.repositoryContexts[-1]
+                else:
+                    raise RuntimeError(f'{component.name}:{component.version} has no ocm-repository')
+
+                ctt.replicate.replicate_oci_artifact_with_patched_component_descriptor(
+                    src_name=component.name,
+                    src_version=component.version,
+                    patched_component_descriptor=replication_plan_component.target,
+                    src_ocm_repo=orig_ocm_repo,
+                    oci_client=oci_client,
+                    blob_transfer_pool=execution_context.blob_transfer_pool,
                 )
-                print(rre)
-            except Exception as e:
-                component_id = f'{component.name}:{component.version}'
-                logger.warning(
-                    f'Schema validation for component-descriptor {component_id} failed with {e}'
-                )
-
-        # publish the (patched) component-descriptors
-        if skip_component_upload and skip_component_upload(component):
-            continue
 
         if processing_mode is ProcessingMode.DRY_RUN:
-            print('dry-run - will not publish component-descriptor')
-            continue
-        elif processing_mode is not ProcessingMode.REGULAR:
-            raise NotImplementedError(processing_mode)
-
-        if len(ocm_repos := component.repositoryContexts) >= 2:
-            orig_ocm_repo = component.repositoryContexts[-2]
-        elif len(ocm_repos) == 1:
-            logger.warning(f'{component.name}:{component.version} has only one ocm-repository')
-            logger.warning('(expected: two or more)')
-            logger.warning(f'{ocm_repos=}')
-            orig_ocm_repo = component.repositoryContexts[-1]
-        else:
-            raise RuntimeError(f'{component.name}:{component.version} has no ocm-repository')
-
-        ctt.replicate.replicate_oci_artifact_with_patched_component_descriptor(
-            src_name=component.name,
-            src_version=component.version,
-            patched_component_descriptor=replication_plan_component.target,
-            src_ocm_repo=orig_ocm_repo,
-            oci_client=oci_client,
-        )
+            return # early exit because components cannot be retrieved from target
 
-    if processing_mode is ProcessingMode.DRY_RUN:
-        return # early exit because components cannot be retrieved from target
-
-    # retrieve component descriptor from the target registry as local descriptor might not contain
-    # patched image references (if it was already existing the the target registry and thus patching
-    # has been skipped)
-    if not skip_component_upload or not skip_component_upload(root_component_descriptor.component):
-        root_component_descriptor = tgt_component_descriptor_lookup(ocm.ComponentIdentity(
-            name=root_component_descriptor.component.name,
-            version=root_component_descriptor.component.version,
-        ))
-
-    for node in cnudie.iter.iter(
-        component=root_component_descriptor,
-        lookup=tgt_component_descriptor_lookup,
-        component_filter=component_filter,
-        reftype_filter=reftype_filter,
-    ):
-        if cnudie.iter.Filter.components(node):
-            pass
-        elif cnudie.iter.Filter.resources(node):
-            node: cnudie.iter.ResourceNode
-
-            if node.resource.access.type not in (
-                ocm.AccessType.OCI_REGISTRY,
-                ocm.AccessType.RELATIVE_OCI_REFERENCE,
-            ):
+        # retrieve component descriptor from the target registry as local descriptor might not
+        # contain patched image references (if it was already existing the the target registry and
+        # thus patching has been skipped)
+        if (
+            not skip_component_upload
+            or not skip_component_upload(root_component_descriptor.component)
+        ):
+            root_component_descriptor = tgt_component_descriptor_lookup(ocm.ComponentIdentity(
+                name=root_component_descriptor.component.name,
+                version=root_component_descriptor.component.version,
+            ))
+
+        for node in cnudie.iter.iter(
+            component=root_component_descriptor,
+            lookup=tgt_component_descriptor_lookup,
+            component_filter=component_filter,
+            reftype_filter=reftype_filter,
+        ):
+            if cnudie.iter.Filter.components(node):
+                pass
+            elif cnudie.iter.Filter.resources(node):
+                node: cnudie.iter.ResourceNode
+
+                if node.resource.access.type not in (
+                    ocm.AccessType.OCI_REGISTRY,
+                    ocm.AccessType.RELATIVE_OCI_REFERENCE,
+                ):
+                    continue
+            else:
                 continue
-        else:
-            continue
 
-        yield node
+            yield node
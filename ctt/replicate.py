@@ -11,6 +11,7 @@ import logging
 import oci
 import oci.client
 import oci.model as om
+import oci.transfer
 import ocm
 import ocm.oci
 
@@ -23,6 +24,7 @@ def replicate_oci_artifact_with_patched_component_descriptor(
     patched_component_descriptor: ocm.ComponentDescriptor,
     src_ocm_repo: ocm.OciOcmRepository,
     oci_client: oci.client.Client,
+    blob_transfer_pool: oci.transfer.BlobTransferPool=None,
 ):
     if isinstance(src_ocm_repo, str):
         src_ocm_repo = ocm.OciOcmRepository(baseUrl=src_ocm_repo)
@@ -84,6 +86,7 @@ def replicate_oci_artifact_with_patched_component_descriptor(
             src_component_descriptor_oci_blob_ref: raw_fobj,
             src_manifest.config: cfg_raw,
         },
+        blob_transfer_pool=blob_transfer_pool,
     )
 
     target_manifest_dict = dataclasses.asdict(target_manifest)
@@ -2,7 +2,9 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import ctt.model
 import ctt.process_dependencies as process_dependencies
+import ocm
 
 
 def test_processor_instantiation(tmpdir):
@@ -61,3 +63,153 @@ def test_processor_instantiation(tmpdir):
     cfg['upload'] = 'shared_u'
 
     _ = process_dependencies.processing_pipeline(cfg, shared_uploaders=shared_upld)
+
+
+def test_determine_changed_components_for_targets():
+    def component_descriptor(name: str, references=()):
+        return ocm.ComponentDescriptor(
+            meta=ocm.Metadata(),
+            component=ocm.Component(
+                name=name,
+                version='1.0.0',
+                provider={'name': 'some company'},
+                repositoryContexts=[],
+                componentReferences=[
+                    ocm.ComponentReference(
+                        name=ref,
+                        componentName=ref,
+                        version='1.0.0',
+                    ) for ref in references
+                ],
+                sources=[],
+                resources=[],
+                labels=[],
+            ),
+        )
+
+    # root -> a -> c
+    #      -> b -> c
+    component_descriptors = {
+        cd.component.identity(): cd for cd in (
+            component_descriptor('root', references=('a', 'b')),
+            component_descriptor('a', references=('c',)),
+            component_descriptor('b', references=('c',)),
+            component_descriptor('c'),
+        )
+    }
+    root = component_descriptors[ocm.ComponentIdentity('root', '1.0.0')]
+
+    src_lookups = []
+
+    def src_lookup(component_id):
+        src_lookups.append(component_id)
+        return component_descriptors[component_id]
+
+    probes = []
+
+    def tgt_lookup(existing: set[str]):
+        def lookup(component_id, absent_ok):
+            probes.append(component_id)
+            if component_id.name in existing:
+                return component_descriptors[component_id]
+        return lookup
+
+    changed_components = process_dependencies.determine_changed_components_for_targets(
+        component_descriptor=root,
+        component_descriptor_lookup=src_lookup,
+        tgt_component_descriptor_lookups={
+            'tgt-1': tgt_lookup(existing={'a'}),
+            'tgt-2': tgt_lookup(existing=set()),
+        },
+    )
+
+    def names(component_descriptors):
+        return [cd.component.name for cd in component_descriptors]
+
+    assert names(changed_components['tgt-1']) == ['c', 'b', 'root']
+    assert names(changed_components['tgt-2']) == ['c', 'a', 'b', 'root']
+
+    # each component must be looked-up and probed for (per target) only once
+    assert len(src_lookups) == len(set(src_lookups)) == 3
+    assert len(probes) == 2 * len(component_descriptors)
+
+    assert names(process_dependencies.determine_changed_components(
+        component_descriptor=root,
+        tgt_ocm_repo_url='tgt-1',
+        component_descriptor_lookup=src_lookup,
+        tgt_component_descriptor_lookup=tgt_lookup(existing={'a'}),
+        component_filter=lambda component: component.name == 'c',
+    )) == ['b', 'root']
+
+
+def test_execution_context():
+    processing_cfg = {
+        'image_processing_cfg': [
+            {
+                'name': 'default',
+                'target': {
+                    'type': 'RegistriesTarget',
+                    'kwargs': {
+                        'registries': ['foo'],
+                    },
+                },
+                'filter': {
+                    'type': 'ImageFilter',
+                    'kwargs': {
+                        'include_image_refs': ['^aaa'],
+                    },
+                },
+                'upload': 'shared_u',
+            },
+        ],
+        'uploaders': {
+            'shared_u': {
+                'type': 'RepositoryUploader',
+                'kwargs': {
+                    'repository': 'a/repository',
+                },
+            },
+        },
+    }
+
+    with process_dependencies.ExecutionContext(max_workers=2) as execution_context:
+        pipelines = execution_context.processing_pipelines(processing_cfg)
+        assert len(pipelines) == 1
+        # pipelines must be instantiated only once per processing-cfg
+        assert execution_context.processing_pipelines(processing_cfg) is pipelines
+
+        with execution_context.stage('some-stage'):
+            pass
+        with execution_context.stage('some-stage'):
+            pass
+
+        assert set(execution_context.timings) == {'some-stage'}
+
+    assert execution_context.executor._shutdown
+
+
+def test_process_replication_plan_step_wo_execution_context(monkeypatch):
+    closed_timings = []
+    close = process_dependencies.ExecutionContext.close
+
+    def record_timings_and_close(self):
+        closed_timings.append(self.timings)
+        close(self)
+
+    monkeypatch.setattr(process_dependencies.ExecutionContext, 'close', record_timings_and_close)
+
+    assert list(process_dependencies.process_replication_plan_step(
+        replication_plan_step=ctt.model.ReplicationPlanStep(
+            target_ocm_repository='tgt.example.org/ocm',
+            resources=(),
+            components=(),
+        ),
+        root_component_descriptor=None,
+        oci_client=None,
+        tgt_component_descriptor_lookup=None,
+        processing_mode=process_dependencies.ProcessingMode.DRY_RUN,
+    )) == []
+
+    # all stages must be run w/ (implicitly created) execution-context, before it is closed
+    timings, = closed_timings
+    assert set(timings) == {'process-resources', 'publish-components'}
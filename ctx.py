@@ -82,6 +82,13 @@ class CtxCfg:
         else:
             return os.path.join(self.cache_dir, 'component-descriptors')
 
+    @property
+    def mako_module_dir(self) -> str | None:
+        if not self.cache_dir:
+            return None
+        else:
+            return os.path.join(self.cache_dir, 'mako-modules')
+
     def __post_init__(self):
         if not self.ocm_repository_mappings:
             return
@@ -1,7 +1,12 @@
+import codecs
 import collections.abc
+import concurrent.futures
 import dataclasses
 import datetime
+import itertools
+import json
 import logging
+import threading
 import time
 import typing
 
@@ -126,20 +131,192 @@ by lookups are not handled.
 AuthTokenLookup: typing.TypeAlias = typing.Callable[[Url], AuthToken]
 
 
+def _iter_json_array(
+    chunks: collections.abc.Iterable[bytes],
+    encoding: str='utf-8',
+) -> collections.abc.Generator[typing.Any, None, None]:
+    '''
+    incrementally decodes a JSON-array from the given chunks, yielding its elements as soon as
+    they are complete (so the serialised array need not be kept in memory as a whole)
+    '''
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder(encoding)()
+    chunks = iter(chunks)
+    buffer = ''
+    pos = 0
+    exhausted = False
+    started = False
+
+    def read() -> bool:
+        nonlocal buffer, pos, exhausted
+        if exhausted:
+            return False
+        try:
+            chunk = next(chunks)
+            buffer = buffer[pos:] + text_decoder.decode(chunk)
+        except StopIteration:
+            exhausted = True
+            buffer = buffer[pos:] + text_decoder.decode(b'', final=True)
+        pos = 0
+        return True
+
+    def skip_whitespace() -> str | None:
+        # returns next non-whitespace character (w/o consuming it), reading more chunks as needed
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos].isspace():
+                pos += 1
+            if pos < len(buffer):
+                return buffer[pos]
+            if not read():
+                return None
+
+    if skip_whitespace() != '[':
+        raise ValueError('expected JSON-array')
+    pos += 1
+
+    while True:
+        char = skip_whitespace()
+        if char is None:
+            raise ValueError('unexpected end of JSON-array')
+        if char == ']':
+            return
+        if started:
+            if char != ',':
+                raise ValueError(f'unexpected {char=} in JSON-array')
+            pos += 1
+            skip_whitespace()
+
+        while True:
+            try:
+                element, end = decoder.raw_decode(buffer, pos)
+                # scalars at end of buffer might be truncated (e.g. numbers)
+                if end < len(buffer) or exhausted or isinstance(element, (dict, list)):
+                    break
+            except json.JSONDecodeError:
+                if exhausted:
+                    raise
+            read()
+
+        pos = end
+        started = True
+        yield element
+
+
+# versions which are resolved by delivery-service (i.e. results for those are not immutable)
+_pseudo_versions = ('greatest', 'latest')
+
+
+@dataclasses.dataclass
+class _CacheEntry:
+    value: typing.Any
+    expiry: float | None # None -> does not expire
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def expired(self) -> bool:
+        return self.expiry is not None and self.expiry < time.monotonic()
+
+
+class _ResponseCache:
+    def __init__(
+        self,
+        max_entries: int=4096,
+    ):
+        '''
+        an in-memory cache for (deserialised) responses of the delivery-service, w/ optional
+        expiry. Concurrent retrievals of the same key are coalesced (i.e. only one retrieval is
+        in-flight per key; concurrent callers wait for its result). Expired entries are passed
+        to retrievals, so they can be revalidated using conditional requests.
+        '''
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._entries: collections.OrderedDict[typing.Hashable, _CacheEntry] = \
+            collections.OrderedDict()
+        self._in_flight: dict[typing.Hashable, concurrent.futures.Future] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'coalesced': self.coalesced,
+            'entries': len(self._entries),
+        }
+
+    def get(
+        self,
+        key: typing.Hashable,
+        retrieve: typing.Callable[[_CacheEntry | None], _CacheEntry],
+    ) -> typing.Any:
+        '''
+        returns the cached value for the given key; if absent or expired, `retrieve` is called
+        (w/ the expired entry, if any) and its result is cached
+        '''
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and not entry.expired():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.value
+
+            if (future := self._in_flight.get(key)):
+                self.coalesced += 1
+                owner = False
+            else:
+                future = concurrent.futures.Future()
+                self._in_flight[key] = future
+                self.misses += 1
+                owner = True
+
+        if not owner:
+            return future.result()
+
+        try:
+            entry = retrieve(entry)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        future.set_result(entry.value)
+        return entry.value
+
+
 class DeliveryServiceClient:
     def __init__(
         self,
         routes: DeliveryServiceRoutes,
         auth_token_lookup: AuthTokenLookup | None=None,
+        cache_ttl_seconds: int | None=60,
     ):
         '''
         Initialises a client which can be used to interact with the delivery-service.
 
+        Component-descriptors, component-versions and -responsibles are cached in-process.
+        Component-descriptors of pinned versions are immutable, and are thus cached w/o expiry;
+        other results expire after `cache_ttl_seconds` (and are then revalidated using
+        conditional requests, if the delivery-service returned an ETag or Last-Modified header).
+
         :param DeliveryServiceRoutes routes
             object which contains information of the base url of the desired instance of the
             delivery-service as well as the available routes
         :param AuthTokenLookup auth_token_lookup (optional)
             the lookup to use for retrieving auth-tokens against oauth-endpoints
+        :param int cache_ttl_seconds (optional)
+            expiry of cached mutable results; if None, caching is disabled
         '''
         self._routes = routes
         self.auth_token_lookup = auth_token_lookup
@@ -148,6 +325,66 @@ class DeliveryServiceClient:
         self._bearer_token = None
         self._session = requests.sessions.Session()
 
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self._cache = _ResponseCache()
+
+    def _cached_get(
+        self,
+        key: typing.Hashable,
+        url: str,
+        params: dict,
+        deserialise: typing.Callable[[typing.Any], typing.Any],
+        immutable: bool=False,
+        retry_while_accepted: bool=False,
+        **kwargs,
+    ) -> typing.Any:
+        '''
+        issues a GET request, caching the deserialised result (see `_ResponseCache`)
+
+        @param immutable:            if True, result is cached w/o expiry
+        @param retry_while_accepted: if True, request is repeated as long as the delivery-service
+                                     responds w/ 202 (i.e. result is still being computed)
+        '''
+        def retrieve(expired_entry: _CacheEntry | None) -> _CacheEntry:
+            headers = {}
+            if expired_entry and expired_entry.etag:
+                headers['If-None-Match'] = expired_entry.etag
+            if expired_entry and expired_entry.last_modified:
+                headers['If-Modified-Since'] = expired_entry.last_modified
+
+            for _ in range(24 if retry_while_accepted else 1):
+                res = self.request(
+                    url=url,
+                    params=params,
+                    headers=headers,
+                    **kwargs,
+                )
+                if res.status_code != 202:
+                    break
+                time.sleep(5)
+
+            if res.status_code == 304 and expired_entry:
+                logger.debug(f'cached result for {url=} {params=} is still valid')
+                value = expired_entry.value
+            else:
+                res.raise_for_status()
+                value = deserialise(res.json())
+
+            return _CacheEntry(
+                value=value,
+                expiry=None if immutable else time.monotonic() + self.cache_ttl_seconds,
+                etag=res.headers.get('ETag'),
+                last_modified=res.headers.get('Last-Modified'),
+            )
+
+        if self.cache_ttl_seconds is None:
+            return retrieve(expired_entry=None).value
+
+        return self._cache.get(
+            key=key,
+            retrieve=retrieve,
+        )
+
     def _openid_configuration(self):
         '''
         response according to OpenID provider configuration response
@@ -289,16 +526,22 @@ class DeliveryServiceClient:
         if version_filter is not None:
             params['version_filter'] = version_filter
 
-        res = self.request(
+        return self._cached_get(
+            key=(
+                'component_descriptor',
+                name,
+                version,
+                ocm_repo_url,
+                version_filter,
+                validation_mode, # validation is done upon deserialisation
+            ),
             url=self._routes.component_descriptor(),
             params=params,
-        )
-
-        res.raise_for_status()
-
-        return ocm.ComponentDescriptor.from_dict(
-            res.json(),
-            validation_mode=validation_mode,
+            deserialise=lambda raw: ocm.ComponentDescriptor.from_dict(
+                raw,
+                validation_mode=validation_mode,
+            ),
+            immutable=version not in _pseudo_versions,
         )
 
     def greatest_component_versions(
@@ -331,16 +574,14 @@ class DeliveryServiceClient:
         if end_date:
             params['end_date'] = end_date.isoformat()
 
-        res = self.request(
+        return self._cached_get(
+            key=('greatest_component_versions', *sorted(params.items())),
             url=self._routes.greatest_component_versions(),
             params=params,
+            deserialise=lambda raw: raw,
             timeout=timeout,
         )
 
-        res.raise_for_status()
-
-        return res.json()
-
     def update_metadata(
         self,
         data: collections.abc.Iterable[typing.Union[dict, 'ArtefactMetadata']],
@@ -460,45 +701,41 @@ class DeliveryServiceClient:
         else:
             logger.info(f'{params=}')
 
-        # wait for responsibles result
-        # -> delivery service is waiting up to ~2 min for contributor statistics
-        for _ in range(24):
-            resp = self.request(
+        def deserialise(resp_json: dict):
+            responsibles = resp_json['responsibles']
+            statuses_raw = resp_json.get('statuses', [])
+            statuses = [
+                dacite.from_dict(
+                    data_class=dm.Status,
+                    data=status_raw,
+                    config=dacite.Config(
+                        cast=[
+                            dm.StatusType,
+                        ],
+                    ),
+                )
+                for status_raw in statuses_raw
+            ]
+
+            return responsibles, statuses
+
+        try:
+            # wait for responsibles result
+            # -> delivery service is waiting up to ~2 min for contributor statistics
+            return self._cached_get(
+                key=('component_responsibles', *sorted(params.items())),
                 url=url,
                 params=params,
+                deserialise=deserialise,
+                retry_while_accepted=True,
                 timeout=(4, 121),
             )
-            if resp.status_code != 202:
-                break
-            time.sleep(5)
-
-        try:
-            resp.raise_for_status()
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 404 and absent_ok:
                 logger.warning(f'delivery service returned 404 for responsibles with {params=}')
                 return None, None
             raise
 
-        resp_json: dict = resp.json()
-
-        responsibles = resp_json['responsibles']
-        statuses_raw = resp_json.get('statuses', [])
-        statuses = [
-            dacite.from_dict(
-                data_class=dm.Status,
-                data=status_raw,
-                config=dacite.Config(
-                    cast=[
-                        dm.StatusType,
-                    ],
-                ),
-            )
-            for status_raw in statuses_raw
-        ]
-
-        return responsibles, statuses
-
     def sprints(self) -> list[dm.Sprint]:
         resp = self.request(
             url=self._routes.sprint_infos(),
@@ -530,27 +767,34 @@ class DeliveryServiceClient:
 
         return dm.Sprint.from_dict(resp.json())
 
-    def query_metadata(
+    def _query_metadata_entries(
         self,
         components: collections.abc.Iterable[ocm.Component]=(),
         artefacts: collections.abc.Iterable[typing.Union[dict, 'ComponentArtefactId']]=(),
-        type: str | collections.abc.Sequence[str]=None,
-        referenced_type: str | collections.abc.Sequence[str]=None,
-    ) -> tuple[dict]:
-        '''
-        Query artefact metadata from the delivery-db.
-
-        @param components:      component identities used for filtering; if no identities are
-                                specified, no component filtering is done
-        @param type:            datatype(s) used for filtering; if no datatype(s) is (are)
-                                specified, no datatype filtering is done
-        @param referenced_type: referenced datatype(s) used for filtering (only applies to artefact
-                                metadata of type `rescorings`); if no datatype(s) is (are)
-                                specified, no referenced datatype filtering is done
-        '''
+    ) -> list[dict]:
         if components and artefacts:
             raise ValueError('at most one of `artefacts` or `components` must be specified')
 
+        if components:
+            return [
+                {
+                    'component_name': c.name,
+                    'component_version': c.version,
+                } for c in components
+            ]
+
+        return [
+            dataclasses.asdict(artefact) if dataclasses.is_dataclass(artefact) else artefact
+            for artefact in artefacts
+        ]
+
+    def _query_metadata_request(
+        self,
+        entries: list[dict],
+        type: str | collections.abc.Sequence[str]=None,
+        referenced_type: str | collections.abc.Sequence[str]=None,
+        stream: bool=False,
+    ) -> requests.Response:
         params = dict()
 
         if type:
@@ -563,19 +807,6 @@ class DeliveryServiceClient:
             'Content-Type': 'application/json',
         }
 
-        if components:
-            entries = [
-                {
-                    'component_name': c.name,
-                    'component_version': c.version,
-                } for c in components
-            ]
-        else:
-            entries = [
-                dataclasses.asdict(artefact) if dataclasses.is_dataclass(artefact) else artefact
-                for artefact in artefacts
-            ]
-
         data, headers = http_requests.encode_request(
             json={'entries': entries},
             headers=headers,
@@ -588,14 +819,126 @@ class DeliveryServiceClient:
             data=data,
             params=params,
             timeout=None,
+            stream=stream,
         )
 
         res.raise_for_status()
 
+        return res
+
+    def query_metadata(
+        self,
+        components: collections.abc.Iterable[ocm.Component]=(),
+        artefacts: collections.abc.Iterable[typing.Union[dict, 'ComponentArtefactId']]=(),
+        type: str | collections.abc.Sequence[str]=None,
+        referenced_type: str | collections.abc.Sequence[str]=None,
+        batch_size: int | None=None,
+    ) -> tuple[dict]:
+        '''
+        Query artefact metadata from the delivery-db.
+
+        @param components:      component identities used for filtering; if no identities are
+                                specified, no component filtering is done
+        @param type:            datatype(s) used for filtering; if no datatype(s) is (are)
+                                specified, no datatype filtering is done
+        @param referenced_type: referenced datatype(s) used for filtering (only applies to artefact
+                                metadata of type `rescorings`); if no datatype(s) is (are)
+                                specified, no referenced datatype filtering is done
+        @param batch_size:      if set, query is split into concurrent requests w/ at most
+                                `batch_size` entries each (see `iter_metadata`)
+        '''
+        if batch_size:
+            return tuple(self.iter_metadata(
+                components=components,
+                artefacts=artefacts,
+                type=type,
+                referenced_type=referenced_type,
+                batch_size=batch_size,
+            ))
+
+        res = self._query_metadata_request(
+            entries=self._query_metadata_entries(
+                components=components,
+                artefacts=artefacts,
+            ),
+            type=type,
+            referenced_type=referenced_type,
+        )
+
         artefact_metadata_raw = res.json()
 
         return tuple(artefact_metadata_raw)
 
+    def iter_metadata(
+        self,
+        components: collections.abc.Iterable[ocm.Component]=(),
+        artefacts: collections.abc.Iterable[typing.Union[dict, 'ComponentArtefactId']]=(),
+        type: str | collections.abc.Sequence[str]=None,
+        referenced_type: str | collections.abc.Sequence[str]=None,
+        batch_size: int=64,
+        max_workers: int=4,
+    ) -> collections.abc.Generator[dict, None, None]:
+        '''
+        Query artefact metadata from the delivery-db (see `query_metadata`), splitting the given
+        components or artefacts into batches of at most `batch_size` entries, which are queried
+        concurrently (at most `max_workers` batches are in-flight). Responses are decoded
+        incrementally; artefact metadata is yielded per batch, in order of completion.
+
+        Note: if no components or artefacts are passed, a single (unfiltered) query is issued.
+        Artefact metadata matching entries of different batches is yielded once per batch.
+        '''
+        entries = self._query_metadata_entries(
+            components=components,
+            artefacts=artefacts,
+        )
+        # deduplicate entries (preserving order), so that batches do not overlap
+        entries = list({
+            json.dumps(entry, sort_keys=True, default=str): entry
+            for entry in entries
+        }.values())
+
+        def query(entries: list[dict]) -> list[dict]:
+            res = self._query_metadata_request(
+                entries=entries,
+                type=type,
+                referenced_type=referenced_type,
+                stream=True,
+            )
+            with res:
+                return list(_iter_json_array(
+                    chunks=res.iter_content(chunk_size=64 * 1024),
+                    encoding=res.encoding or 'utf-8',
+                ))
+
+        if len(entries) <= batch_size:
+            yield from query(entries=entries)
+            return
+
+        batches = itertools.batched(entries, batch_size)
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix='delivery-query',
+        ) as executor:
+            # limit amount of in-flight batches (and thus memory consumption)
+            futures = {
+                executor.submit(query, list(batch))
+                for batch in itertools.islice(batches, max_workers)
+            }
+            try:
+                while futures:
+                    done, futures = concurrent.futures.wait(
+                        futures,
+                        return_when=concurrent.futures.FIRST_COMPLETED,
+                    )
+                    for future in done:
+                        if (batch := next(batches, None)):
+                            futures.add(executor.submit(query, list(batch)))
+                        yield from future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
     def mark_cache_for_deletion(
         self,
         id: str | None=None,
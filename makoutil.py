@@ -1,5 +1,13 @@
+import functools
+import hashlib
+import os
+import re
+import tempfile
 import threading
 
+import mako.lookup
+import mako.template
+
 '''
 workaround bug in mako use lock to sequentialise invocations of mako.template.Template
 see: https://github.com/sqlalchemy/mako/issues/378
@@ -9,3 +17,125 @@ template_lock = threading.Lock()
 
 def indent_func(depth):
     return lambda text: text.replace("\n", "\n" + depth * " ")
+
+
+def module_directory() -> str | None:
+    '''
+    returns the directory compiled mako-templates should be persisted in (so compilation is
+    not repeated across runs), if configured (see `ctx`)
+    '''
+    try:
+        import ctx
+    except ImportError:
+        # ctx-module is an optional dependency for local dev setups
+        return None
+
+    if not ctx.cfg:
+        return None
+
+    return ctx.cfg.ctx.mako_module_dir
+
+
+class TemplateCache:
+    def __init__(
+        self,
+        directories: tuple[str, ...]=(),
+        module_directory: str | None=None,
+    ):
+        '''
+        caches compiled mako-templates, keyed by template-name and -contents (hash). If
+        `module_directory` is given, compiled templates (including templates retrieved through
+        `lookup`, e.g. included ones) are persisted there, and thus re-used across processes.
+
+        Compilation is serialised (see `template_lock`); rendering of cached templates may be
+        done concurrently.
+
+        :param tuple directories: directories used for looking-up included templates
+        :param str module_directory: directory to persist compiled templates in
+        '''
+        self.module_directory = module_directory
+        self.lookup = mako.lookup.TemplateLookup(
+            directories=list(directories),
+            module_directory=module_directory,
+        )
+        self._templates = {} # {(name, digest): template}
+
+    def _source_file(
+        self,
+        name: str,
+        digest: str,
+        contents: str,
+    ) -> str:
+        # mako only persists compiled templates read from files -> write contents to a
+        # (content-addressed) file
+        source_dir = os.path.join(self.module_directory, 'sources')
+        os.makedirs(source_dir, exist_ok=True)
+        path = os.path.join(source_dir, f'{re.sub(r"[^\w.-]", "_", name)}-{digest}.mako')
+
+        if os.path.exists(path):
+            return path
+
+        fd, tmp_path = tempfile.mkstemp(dir=source_dir, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(contents)
+            os.replace(tmp_path, path)
+        except:
+            os.unlink(tmp_path)
+            raise
+
+        return path
+
+    def template(
+        self,
+        name: str,
+        contents: str,
+    ) -> mako.template.Template:
+        digest = hashlib.sha256(contents.encode('utf-8')).hexdigest()
+        key = (name, digest)
+
+        if (template := self._templates.get(key)):
+            return template
+
+        with template_lock:
+            if (template := self._templates.get(key)):
+                return template # compiled concurrently
+
+            if self.module_directory:
+                source_file = self._source_file(name=name, digest=digest, contents=contents)
+                template = mako.template.Template( # nosec B702
+                    filename=source_file,
+                    uri=os.path.relpath(source_file, self.module_directory),
+                    lookup=self.lookup,
+                    module_directory=self.module_directory,
+                )
+            else:
+                template = mako.template.Template(contents, lookup=self.lookup) # nosec B702
+
+            self._templates[key] = template
+
+        return template
+
+    def get_template(
+        self,
+        uri: str,
+    ) -> mako.template.Template:
+        '''
+        retrieves (and compiles, if required) the given template from `lookup`
+        '''
+        with template_lock:
+            return self.lookup.get_template(uri)
+
+
+@functools.cache
+def template_cache(
+    directories: tuple[str, ...]=(),
+    module_directory: str | None=None,
+) -> TemplateCache:
+    '''
+    returns a (process-wide) shared TemplateCache for the given lookup-directories
+    '''
+    return TemplateCache(
+        directories=directories,
+        module_directory=module_directory,
+    )
@@ -104,6 +104,43 @@ class ConfigType:
         return self.model.type
 
 
+@functools.cache
+def _element_type(type_name: str) -> type:
+    '''
+    returns the model element type of the given name, as defined in this module or one of its
+    submodules.
+
+    Results are cached, which saves (repeatedly) importing and searching all submodules, and is
+    also a workaround for kaniko, which will purge our poor modules on multi-stage-builds.
+    '''
+    # TODO: switch to fully-qualified type names
+    own_module = sys.modules[__name__]
+
+    submodule_names = [
+        own_module.__name__ + '.' + m.name
+        for m in pkgutil.iter_modules(own_module.__path__)
+    ]
+    for module_name in [__name__] + submodule_names:
+        submodule_name = module_name.split('.')[-1]
+        if module_name != __name__:
+            module = getattr(__import__(module_name), submodule_name)
+        else:
+            module = sys.modules[submodule_name]
+
+        # skip if module does not define our type
+        if not hasattr(module, type_name):
+            continue
+
+        # if type is defined, validate
+        element_type = getattr(module, type_name)
+        if not type(element_type) == type:
+            raise ValueError()
+
+        return element_type
+
+    raise ValueError(f'failed to find cfg type: {type_name=}')
+
+
 class ConfigFactory:
     '''Creates configuration model element instances from the underlying configuration source
 
@@ -121,7 +158,6 @@ class ConfigFactory:
     '''
 
     CFG_TYPES = 'cfg_types'
-    _cfg_type_cache = {} # <name>:<type>
 
     @staticmethod
     def _parse_local_file(cfg_dir: str, cfg_src: LocalFileCfgSrc):
@@ -275,6 +311,10 @@ class ConfigFactory:
             raise ValueError(f'missing required attribute: {self.CFG_TYPES}')
         self.retrieve_cfg = retrieve_cfg
 
+        # {(cfg_type_name, cfg_name): (raw_dict, element)}
+        self._cfg_element_cache = {}
+        self._cfg_element_cache_lock = threading.Lock()
+
     def _retrieve_cfg_elements(self, cfg_type_name: str):
         if not cfg_type_name in self.raw:
             cfg_type = self._cfg_type(cfg_type_name=cfg_type_name)
@@ -336,45 +376,15 @@ class ConfigFactory:
         )
 
     def _cfg_element(self, cfg_type_name: str, cfg_name: str):
+        '''
+        returns the cfg-element of the given type and name. Elements are cached (and thus shared
+        between callers), so they must not be modified; they are recreated if the underlying
+        raw cfg was replaced.
+        '''
         cfg_type = self._cfg_type(cfg_type_name=cfg_type_name)
 
-        # retrieve model class c'tor - search module and sub-modules
-        # TODO: switch to fully-qualified type names
-        own_module = sys.modules[__name__]
-
-        submodule_names = [
-            own_module.__name__ + '.' + m.name
-            for m in pkgutil.iter_modules(own_module.__path__)
-        ]
-        for module_name in [__name__] + submodule_names:
-            submodule_name = module_name.split('.')[-1]
-            if module_name != __name__:
-                module = getattr(__import__(module_name), submodule_name)
-            else:
-                module = sys.modules[submodule_name]
-
-            # skip if module does not define our type
-            if not hasattr(module, cfg_type.cfg_type()):
-                continue
-
-            # if type is defined, validate
-            element_type = getattr(module, cfg_type.cfg_type())
-            if not type(element_type) == type:
-                raise ValueError()
-            # found it (write to cache as part of crazy workaround for kaniko)
-            self._cfg_type_cache[cfg_type_name] = element_type
-            break
-        else:
-            # workaround for kaniko, which will purge our poor modules on multi-stage-builds
-            if cfg_type_name in self._cfg_type_cache:
-                element_type = self._cfg_type_cache[cfg_type_name]
-            else:
-                print(f'{self._cfg_type_cache=}')
-                raise ValueError(f'failed to find cfg type: {cfg_type.cfg_type()=}')
-
-        # for now, let's assume all of our model element types are subtypes of NamedModelElement
-        # (with the exception of ConfigurationSet)
-        configs = self._configs(cfg_type.cfg_type_name())
+        self._retrieve_cfg_elements(cfg_type_name=cfg_type.cfg_type_name())
+        configs = self.raw[cfg_type.cfg_type_name()]
         if cfg_name not in configs:
             known_cfg_names = ', '.join(configs.keys())
 
@@ -382,7 +392,18 @@ class ConfigFactory:
                 f'cfg-factory: no such cfg-element: {cfg_name=} {cfg_type.cfg_type_name()=} '
                 f'{known_cfg_names=}'
             )
-        kwargs = {'raw_dict': configs[cfg_name]}
+        raw_dict = configs[cfg_name]
+
+        cache_key = (cfg_type.cfg_type_name(), cfg_name)
+        cached_raw_dict, element_instance = self._cfg_element_cache.get(cache_key, (None, None))
+        if element_instance and cached_raw_dict is raw_dict:
+            return element_instance
+
+        element_type = _element_type(type_name=cfg_type.cfg_type())
+
+        # for now, let's assume all of our model element types are subtypes of NamedModelElement
+        # (with the exception of ConfigurationSet)
+        kwargs = {'raw_dict': raw_dict}
 
         if element_type == ConfigurationSet:
             kwargs.update({'cfg_name': cfg_name, 'cfg_factory': self})
@@ -400,6 +421,9 @@ class ConfigFactory:
                 f"- ignored: {mve}"
             )
 
+        with self._cfg_element_cache_lock:
+            self._cfg_element_cache[cache_key] = (raw_dict, element_instance)
+
         return element_instance
 
     def _ensure_type_is_known(self, cfg_type_name: str):
@@ -4,10 +4,13 @@
 
 
 import base64
+import collections.abc
 import json
 import logging
+import threading
 import urllib.parse
 import typing
+import weakref
 
 import dacite
 
@@ -214,6 +217,132 @@ class GcrCredentials(BasicCredentials):
             return False
 
 
+class _TrieNode:
+    __slots__ = ('children', 'cfgs')
+
+    def __init__(self):
+        self.children: dict[str, _TrieNode] = {}
+        self.cfgs: list[tuple[oa.Privileges, int, ContainerRegistryConfig]] = []
+
+
+class RegistryCfgIndex:
+    def __init__(
+        self,
+        cfgs: collections.abc.Iterable[ContainerRegistryConfig],
+        max_memoised_lookups: int=4096,
+    ):
+        '''
+        index of container-registry-cfgs by their image-reference-prefixes (as a prefix-trie),
+        allowing to find matching cfgs w/o checking each cfg's prefixes (see `find`).
+
+        :param Iterable cfgs: cfgs to index (order is used to break ties, see `find`)
+        :param int max_memoised_lookups: max amount of memoised lookup-results
+        '''
+        self.max_memoised_lookups = max_memoised_lookups
+
+        self._root = _TrieNode()
+        for position, cfg in enumerate(cfgs):
+            privileges = cfg.privileges()
+            for prefix in cfg.image_reference_prefixes():
+                node = self._root
+                for char in prefix:
+                    node = node.children.setdefault(char, _TrieNode())
+                node.cfgs.append((privileges, position, cfg))
+
+        self._lock = threading.Lock()
+        self._memoised = {}
+
+    def _matching_cfgs(
+        self,
+        image_reference: str,
+    ) -> collections.abc.Generator[tuple[oa.Privileges, int, ContainerRegistryConfig], None, None]:
+        node = self._root
+        yield from node.cfgs
+
+        for char in image_reference:
+            if not (node := node.children.get(char)):
+                return
+            yield from node.cfgs
+
+    def find(
+        self,
+        image_reference: str,
+        privileges: oa.Privileges=None,
+    ) -> ContainerRegistryConfig | None:
+        '''
+        returns the cfg w/ least privileges of those matching the given image-reference (and
+        having at least the given privileges, if passed), i.e. the same cfg as returned from
+        sorting the cfgs matching according to `ContainerRegistryConfig.image_ref_matches` by
+        privileges, and picking the first one. None is returned if no cfg matches.
+        '''
+        key = (image_reference, privileges)
+
+        with self._lock:
+            if key in self._memoised:
+                return self._memoised[key]
+
+        best = None
+        for entry in self._matching_cfgs(image_reference):
+            cfg_privileges, position, _ = entry
+            if privileges and cfg_privileges < privileges:
+                continue
+            if not best or (cfg_privileges, position) < best[:2]:
+                best = entry
+
+        registry_cfg = best[2] if best else None
+
+        with self._lock:
+            if len(self._memoised) >= self.max_memoised_lookups:
+                self._memoised.pop(next(iter(self._memoised)))
+            self._memoised[key] = registry_cfg
+
+        return registry_cfg
+
+
+# {cfg_factory: ({cfg_name: raw_cfg}, RegistryCfgIndex)}
+_registry_cfg_indices = weakref.WeakKeyDictionary()
+_registry_cfg_indices_lock = threading.Lock()
+
+
+def _raw_cfgs(cfg_factory) -> dict[str, dict]:
+    '''
+    returns the raw container-registry-cfgs known to the given cfg-factory (or cfg-set), used to
+    detect whether cfgs were added, removed, or replaced
+    '''
+    factory = getattr(cfg_factory, 'cfg_factory', cfg_factory) # cfg-sets are backed by a factory
+    raw_cfgs = getattr(factory, 'raw', {}).get('container_registry', {})
+
+    return {
+        cfg_name: raw_cfgs.get(cfg_name)
+        for cfg_name in cfg_factory._cfg_element_names('container_registry')
+    }
+
+
+def registry_cfg_index(cfg_factory) -> RegistryCfgIndex:
+    '''
+    returns the (cached) index of container-registry-cfgs for the given cfg-factory (or cfg-set).
+    The index is rebuilt if cfgs were added, removed, or replaced.
+    '''
+    raw_cfgs = _raw_cfgs(cfg_factory)
+
+    with _registry_cfg_indices_lock:
+        indexed_raw_cfgs, index = _registry_cfg_indices.get(cfg_factory, ({}, None))
+
+    if (
+        index
+        and indexed_raw_cfgs.keys() == raw_cfgs.keys()
+        and all(indexed_raw_cfgs[name] is raw for name, raw in raw_cfgs.items())
+    ):
+        return index
+
+    index = RegistryCfgIndex(cfgs=cfg_factory._cfg_elements('container_registry'))
+
+    with _registry_cfg_indices_lock:
+        _registry_cfg_indices[cfg_factory] = (raw_cfgs, index)
+
+    return index
+
+
 def find_config(
     image_reference: typing.Union[str, om.OciImageReference],
     privileges:oa.Privileges=None,
@@ -228,27 +357,17 @@ def find_config(
         image_reference = image_reference.normalised_image_reference()
         _normalised_image_reference = True
 
-    matching_cfgs = sorted((
-        cfg for cfg in
-        cfg_factory._cfg_elements('container_registry')
-        if cfg.image_ref_matches(image_reference, privileges=privileges)
-        ),
-        key=lambda c:c.privileges(),
-    )
+    index = registry_cfg_index(cfg_factory=cfg_factory)
 
-    if not matching_cfgs:
-        # finally give up - did not match anything, even after normalisation
-        if _normalised_image_reference:
-            return None
-        else:
-            return find_config(
-                image_reference=oci.util.normalise_image_reference(image_reference=image_reference),
-                privileges=privileges,
-                _normalised_image_reference=True,
-                cfg_factory=cfg_factory,
-            )
+    # cfg w/ least privileges is preferred
+    if (registry_cfg := index.find(image_reference=image_reference, privileges=privileges)):
+        return registry_cfg
 
-    # return first match (because they are sorted, this will be the one with least privileges)
-    registry_cfg = matching_cfgs[0]
+    # finally give up - did not match anything, even after normalisation
+    if _normalised_image_reference:
+        return None
 
-    return registry_cfg
+    return index.find(
+        image_reference=oci.util.normalise_image_reference(image_reference=image_reference),
+        privileges=privileges,
+    )
@@ -4,9 +4,12 @@
 
 
 import collections.abc
+import dataclasses
 import enum
 import random
 import re
+import threading
+import time
 
 from urllib.parse import urlparse
 
@@ -27,6 +30,106 @@ class Protocol(enum.StrEnum):
     HTTPS = 'https'
 
 
+@dataclasses.dataclass(frozen=True)
+class RateLimit:
+    remaining: int
+    limit: int | None
+    reset: float # epoch-seconds at which quota is reset
+    observed: float = dataclasses.field(default_factory=time.time)
+
+
+class RateLimitTracker:
+    def __init__(
+        self,
+        max_age_seconds: float=5 * 60,
+    ):
+        '''
+        tracks remaining (core) github-api-quota per (github-hostname, username). Quota is learnt
+        passively from `X-RateLimit-*`-headers of responses to api-requests (see `response_hook`),
+        or recorded explicitly (see `record`).
+
+        Recorded quota expires if it is older than `max_age_seconds` (as quota might also be
+        consumed by other processes), or if the quota was reset in the meantime.
+
+        :param float max_age_seconds: max age of recorded quota to be considered
+        '''
+        self.max_age_seconds = max_age_seconds
+
+        self._lock = threading.Lock()
+        self._rate_limits: dict[tuple[str, str], RateLimit] = {}
+
+    def record(
+        self,
+        hostname: str,
+        username: str,
+        rate_limit: RateLimit,
+    ):
+        key = (hostname.lower(), username)
+        with self._lock:
+            if (
+                (recorded := self._rate_limits.get(key))
+                and recorded.observed > rate_limit.observed
+            ):
+                return # responses might be processed out-of-order
+            self._rate_limits[key] = rate_limit
+
+    def rate_limit(
+        self,
+        hostname: str,
+        username: str,
+    ) -> RateLimit | None:
+        '''
+        returns the recorded quota, or None if no (unexpired) quota is known
+        '''
+        with self._lock:
+            rate_limit = self._rate_limits.get((hostname.lower(), username))
+
+        if not rate_limit:
+            return None
+
+        now = time.time()
+        if now - rate_limit.observed > self.max_age_seconds or now >= rate_limit.reset:
+            return None
+
+        return rate_limit
+
+    def response_hook(
+        self,
+        hostname: str,
+        username: str,
+    ) -> collections.abc.Callable:
+        '''
+        returns a hook for `requests.Session.hooks['response']`, recording quota from responses
+        '''
+        def record_rate_limit(response, *args, **kwargs):
+            if getattr(response, 'from_cache', False):
+                return # cached responses carry outdated headers
+
+            headers = response.headers
+            if headers.get('X-RateLimit-Resource', 'core') != 'core':
+                return
+
+            try:
+                rate_limit = RateLimit(
+                    remaining=int(headers['X-RateLimit-Remaining']),
+                    limit=int(limit) if (limit := headers.get('X-RateLimit-Limit')) else None,
+                    reset=float(headers['X-RateLimit-Reset']),
+                )
+            except (KeyError, ValueError):
+                return # e.g. rate-limiting is disabled
+
+            self.record(
+                hostname=hostname,
+                username=username,
+                rate_limit=rate_limit,
+            )
+
+        return record_rate_limit
+
+
+rate_limit_tracker = RateLimitTracker()
+
+
 class GithubConfig(NamedModelElement):
     '''
     Not intended to be instantiated by users of this module
@@ -77,11 +180,18 @@ class GithubConfig(NamedModelElement):
         return random.choice(technical_users)
 
     def credentials_with_most_remaining_quota(self):
+        '''
+        returns the credentials w/ most remaining quota. Quota is looked-up from
+        `rate_limit_tracker`; it is only retrieved (and recorded) for credentials for which no
+        (unexpired) quota is known.
+        '''
         credentials = self._technical_user_credentials()
         if len(credentials) < 2:
             return credentials[0]
 
-        if self.hostname() == 'github.com':
+        hostname = self.hostname()
+
+        if hostname == 'github.com':
             ApiCtor = github3.github.GitHub
             api_kwargs = {}
         else:
@@ -89,12 +199,30 @@ class GithubConfig(NamedModelElement):
             api_kwargs = {'url': self.http_url()}
 
         def rate_limit_remaining(credentials) -> int:
+            if (rate_limit := rate_limit_tracker.rate_limit(
+                hostname=hostname,
+                username=credentials.username(),
+            )):
+                return rate_limit.remaining
+
             api = ApiCtor(token=credentials.auth_token(), **api_kwargs)
             try:
-                return api.ratelimit_remaining
+                core_rate_limit = api.rate_limit()['resources']['core']
             except github3.exceptions.ConnectionError:
                 return 0
 
+            rate_limit_tracker.record(
+                hostname=hostname,
+                username=credentials.username(),
+                rate_limit=RateLimit(
+                    remaining=core_rate_limit['remaining'],
+                    limit=core_rate_limit.get('limit'),
+                    reset=core_rate_limit['reset'],
+                ),
+            )
+
+            return core_rate_limit['remaining']
+
         best_credentials = max(credentials, key=rate_limit_remaining)
 
         return best_credentials
@@ -22,9 +22,45 @@ class WebhookDispatcherConfig(NamedModelElement, ModelDefaultsMixin):
             'concourse_config_names',
         }
 
+    def _defaults_dict(self):
+        return {
+            'resource_index_refresh_interval_seconds': 600,
+            'worker_count': 8,
+            'queue_max_size': 256,
+            'queue_backpressure_policy': 'block',
+            'queue_block_timeout_seconds': 10,
+        }
+
     def concourse_config_names(self):
         return self.raw['concourse_config_names']
 
+    def resource_index_refresh_interval_seconds(self) -> int:
+        '''
+        interval for refreshing the index of concourse-resources (0 disables the index)
+        '''
+        return self.raw['resource_index_refresh_interval_seconds']
+
+    def worker_count(self) -> int:
+        '''
+        amount of worker-threads processing github-events
+        '''
+        return self.raw['worker_count']
+
+    def queue_max_size(self) -> int:
+        '''
+        max amount of pending github-events
+        '''
+        return self.raw['queue_max_size']
+
+    def queue_backpressure_policy(self) -> str:
+        '''
+        behaviour if queue is full (one of: block, reject, drop_oldest)
+        '''
+        return self.raw['queue_backpressure_policy']
+
+    def queue_block_timeout_seconds(self) -> float:
+        return self.raw['queue_block_timeout_seconds']
+
 
 WHD_DEPLOYMENT_SUBDOMAIN_LABEL = 'webhooks'
 
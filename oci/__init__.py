@@ -1,6 +1,7 @@
 import collections.abc
 import dataclasses
 import enum
+import functools
 import hashlib
 import io
 import json
@@ -17,6 +18,7 @@ import oci.client as oc
 import oci.convert as oconv
 import oci.model as om
 import oci.platform as op
+import oci.transfer
 import ioutil
 
 logger = logging.getLogger(__name__)
@@ -72,6 +74,7 @@ def replicate_artifact(
     mode: ReplicationMode=ReplicationMode.REGISTRY_DEFAULTS,
     platform_filter: collections.abc.Callable[[om.OciPlatform], bool]=None,
     annotations: dict[str, str]=None,
+    blob_transfer_pool: oci.transfer.BlobTransferPool=None,
 ) -> tuple[requests.Response, str, bytes]:
     '''
     replicate the given OCI Artifact from src_image_reference to tgt_image_reference.
@@ -103,6 +106,13 @@ def replicate_artifact(
     overwritten. If existing values are identical, it is tried to avoid to create a "pseudo-diff"
     (i.e. in case the existing values are equal, the manifest will be left untouched).
 
+    Blobs are replicated concurrently, using the passed `blob_transfer_pool` (which allows
+    limiting concurrency per registry, and the total amount of octets in-flight). If no pool is
+    passed, the process-wide pool (see `oci.transfer.default_blob_transfer_pool`) is used, so
+    limits also apply across concurrent replications. The manifest is only uploaded after
+    all blobs were uploaded. If source and target are hosted by the same registry, it is tried to
+    mount blobs (rather than copying them).
+
     pass either `credentials_lookup`, `routes`, OR `oci_client`
     '''
     if not (bool(credentials_lookup) ^ bool(oci_client)):
@@ -119,6 +129,9 @@ def replicate_artifact(
     else:
         client = oci_client
 
+    if not blob_transfer_pool:
+        blob_transfer_pool = oci.transfer.default_blob_transfer_pool()
+
     accept = mode.accept_header()
 
     # we need the unaltered - manifest for verbatim replication
@@ -206,6 +219,7 @@ def replicate_artifact(
                     tgt_image_reference=tgt_reference,
                     oci_client=client,
                     annotations=annotations,
+                    blob_transfer_pool=blob_transfer_pool,
                 )
 
                 submanifest_digest = f'sha256:{hashlib.sha256(submanifest_bytes).hexdigest()}'
@@ -269,6 +283,7 @@ def replicate_artifact(
                     tgt_image_reference=tgt_image_ref,
                     oci_client=oci_client,
                     annotations=annotations,
+                    blob_transfer_pool=blob_transfer_pool,
                 )
 
                 manifest_list = om.OciImageManifestList(
@@ -305,17 +320,15 @@ def replicate_artifact(
     else:
       raise NotImplementedError(schema_version)
 
-    for idx, layer in enumerate(manifest.blobs()):
-        # need to specially handle cfg-blob (may be absent for v2 / legacy images)
-
-        is_cfg_blob = idx == 0
-        if is_cfg_blob and need_to_synthesise_cfg_blob:
-            # if we need(ed) to synthesise cfg-blob (because source-image contained a v1-manifest)
-            # then there will never be a cfg-blob in src.
-            # -> silently skip to avoid emitting a confusing, but unhelpful warning
-            logger.debug(f'{src_image_reference=} - synthesised cfg-blob - skipping replication')
-            continue
+    def replicate_blob(
+        layer: om.OciBlobRef,
+        is_cfg_blob: bool,
+    ) -> tuple[bool, str | None]:
+        '''
+        replicates the given blob (unless it is already present in tgt)
 
+        returns a two-tuple of (cfg_blob_absent: bool, uncompressed_layer_digest: str | None)
+        '''
         head_res = client.head_blob(
             image_reference=tgt_image_reference,
             digest=layer.digest,
@@ -323,7 +336,7 @@ def replicate_artifact(
         if head_res.ok:
             if not need_uncompressed_layer_digests:
                 logger.info(f'skipping blob download {layer.digest=} - already exists in tgt')
-                continue # no need to download if blob already exists in tgt
+                return False, None # no need to download if blob already exists in tgt
             elif not is_cfg_blob:
                 # we will not need to re-upload, however we do need the uncompressed digest
                 blob_res = client.blob(
@@ -338,8 +351,16 @@ def replicate_artifact(
                 for chunk in blob_res.iter_content(chunk_size=4096):
                     layer_hash.update(decompressor.decompress(chunk))
 
-                uncompressed_layer_digests.append(f'sha256:{layer_hash.hexdigest()}')
-                continue # we may still skip the upload, of course
+                # we may still skip the upload, of course
+                return False, f'sha256:{layer_hash.hexdigest()}'
+
+        if not need_uncompressed_layer_digests and client.mount_blob(
+            image_reference=tgt_image_reference,
+            digest=layer.digest,
+            source_image_reference=src_image_reference,
+        ):
+            logger.info(f'mounted {layer.digest=} from {src_image_reference=}')
+            return False, None
 
         # todo: consider silencing warning if we do v1->v2-conversion (cfg-blob will never exist
         #       in this case
@@ -354,9 +375,9 @@ def replicate_artifact(
                 'falling back to non-verbatim replication '
                 f'{src_image_reference=} {tgt_image_reference=}'
             )
-            need_to_synthesise_cfg_blob = True
-            continue
+            return True, None
 
+        uncompressed_layer_hash = None
         if need_uncompressed_layer_digests:
             uncompressed_layer_hash = hashlib.sha256()
             decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
@@ -366,8 +387,6 @@ def replicate_artifact(
                     uncompressed_layer_hash.update(decompressor.decompress(chunk))
                     yield chunk
 
-                uncompressed_layer_digests.append(f'sha256:{uncompressed_layer_hash.hexdigest()}')
-
             blob_res = intercept_chunks(blob_res=blob_res)
 
         client.put_blob(
@@ -377,6 +396,44 @@ def replicate_artifact(
             data=blob_res,
         )
 
+        if uncompressed_layer_hash:
+            return False, f'sha256:{uncompressed_layer_hash.hexdigest()}'
+        return False, None
+
+    blob_futures = []
+    try:
+        for idx, layer in enumerate(manifest.blobs()):
+            # need to specially handle cfg-blob (may be absent for v2 / legacy images)
+            is_cfg_blob = idx == 0
+            if is_cfg_blob and need_to_synthesise_cfg_blob:
+                # if we need(ed) to synthesise cfg-blob (because source-image contained a
+                # v1-manifest) then there will never be a cfg-blob in src.
+                # -> silently skip to avoid emitting a confusing, but unhelpful warning
+                logger.debug(
+                    f'{src_image_reference=} - synthesised cfg-blob - skipping replication'
+                )
+                continue
+
+            blob_futures.append(blob_transfer_pool.submit(
+                functools.partial(replicate_blob, layer=layer, is_cfg_blob=is_cfg_blob),
+                src_image_reference=src_image_reference,
+                tgt_image_reference=tgt_image_reference,
+                octets_count=layer.size,
+            ))
+
+        # manifest must only be uploaded after all blobs were uploaded; results are collected
+        # in order of blobs (required for uncompressed layer-digests)
+        for future in blob_futures:
+            cfg_blob_absent, uncompressed_layer_digest = future.result()
+            if cfg_blob_absent:
+                need_to_synthesise_cfg_blob = True
+            if need_uncompressed_layer_digests and uncompressed_layer_digest:
+                uncompressed_layer_digests.append(uncompressed_layer_digest)
+    except:
+        for future in blob_futures:
+            future.cancel()
+        raise
+
     if need_to_synthesise_cfg_blob:
         fake_cfg_dict = json.loads(json.loads(raw_manifest)['history'][0]['v1Compatibility'])
 
@@ -432,12 +489,19 @@ def replicate_blobs(
     tgt_ref: str,
     oci_client: oc.Client,
     blob_overwrites: dict[om.OciBlobRef, bytes | io.BytesIO],
+    blob_transfer_pool: oci.transfer.BlobTransferPool=None,
 ) -> om.OciImageManifest:
     '''
     replicates blobs from given oci-image-ref to the specified target-ref, optionally replacing
     the specified blobs. This is particularly useful for replacing some "special" blobs, such
     as a component-descriptor layer blob or the config-blob.
 
+    If source and target are hosted by the same registry, it is tried to mount blobs (rather than
+    copying them).
+
+    Blobs are replicated concurrently, using the passed `blob_transfer_pool` (the process-wide
+    pool is used if none is passed, see `oci.transfer.default_blob_transfer_pool`).
+
     Note that the uploaded artifact must be finalised after the upload by a "manifest-put".
     '''
     blob_overwrites = {k.digest:v for k,v in blob_overwrites.items()}
@@ -472,6 +536,18 @@ def replicate_blobs(
         else:
             digest = blob.digest
 
+            if oci_client.mount_blob(
+                image_reference=tgt_ref,
+                digest=digest,
+                source_image_reference=src_ref,
+            ):
+                logger.info(f'mounted {digest=} from {src_ref=}')
+                return om.OciBlobRef(
+                    digest=digest,
+                    mediaType=blob.mediaType,
+                    size=blob.size,
+                )
+
             src_blob: requests.models.Response = oci_client.blob(
                 image_reference=src_ref,
                 digest=digest,
@@ -491,9 +567,28 @@ def replicate_blobs(
                 size=octets_count,
             )
 
+    if not blob_transfer_pool:
+        blob_transfer_pool = oci.transfer.default_blob_transfer_pool()
+
+    blob_futures = []
+    try:
+        blob_futures.extend(
+            blob_transfer_pool.submit(
+                functools.partial(replicate_blob, blob=blob),
+                src_image_reference=src_ref,
+                tgt_image_reference=tgt_ref,
+                octets_count=blob.size,
+            ) for blob in src_oci_manifest.blobs()
+        )
+        cfg_blob, *layer_blobs = [future.result() for future in blob_futures]
+    except:
+        for future in blob_futures:
+            future.cancel()
+        raise
+
     return om.OciImageManifest(
-        config=replicate_blob(src_oci_manifest.config),
-        layers=[replicate_blob(blob) for blob in src_oci_manifest.layers],
+        config=cfg_blob,
+        layers=layer_blobs,
     )
 
 
@@ -0,0 +1,483 @@
+'''
+client-side caches for OCI registry contents (blobs, manifests) and auth-tokens
+'''
+
+import collections
+import dataclasses
+import hashlib
+import io
+import json
+import logging
+import os
+import secrets
+import tempfile
+import threading
+import time
+import typing
+
+import oci.model as om
+
+logger = logging.getLogger(__name__)
+
+
+def _hexdigest(digest: str) -> str | None:
+    '''
+    returns the hexdigest of the given digest, if it is a sha256-digest (the only algorithm
+    we cache for); otherwise, returns None.
+    '''
+    algorithm, _, hexdigest = digest.partition(':')
+
+    if algorithm != 'sha256' or len(hexdigest) != 64:
+        return None
+
+    try:
+        int(hexdigest, 16)
+    except ValueError:
+        return None
+
+    return hexdigest
+
+
+class BlobCache:
+    def __init__(
+        self,
+        cache_dir: str,
+        max_size_octets: int=1024 * 1024 * 1024, # 1 GiB
+        max_blob_octets: int=1024 * 1024 * 64, # 64 MiB
+        memory_max_size_octets: int=1024 * 1024 * 16, # 16 MiB
+        memory_max_blob_octets: int=1024 * 64, # 64 KiB
+    ):
+        '''
+        a two-tiered, content-addressed cache for OCI blobs (which are immutable, as they are
+        referenced by their digest). Blobs are stored on disk (in `cache_dir`); small blobs are
+        in addition kept in memory.
+
+        Writes to disk are atomic (write to temporary file + rename), so multiple threads and
+        processes may share the same cache_dir. Least-recently-used blobs are evicted if the
+        cache size exceeds `max_size_octets` (access-time is tracked using file-mtime).
+
+        Only blobs w/ sha256-digests are cached. Contents are validated against their digest
+        before being stored.
+
+        :param str cache_dir: directory to store blobs in (will be created if absent)
+        :param int max_size_octets: max size of on-disk cache
+        :param int max_blob_octets: blobs larger than this will not be cached
+        :param int memory_max_size_octets: max size of in-memory cache
+        :param int memory_max_blob_octets: blobs larger than this will not be cached in memory
+        '''
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.max_size_octets = max_size_octets
+        self.max_blob_octets = max_blob_octets
+        self.memory_max_size_octets = memory_max_size_octets
+        self.memory_max_blob_octets = memory_max_blob_octets
+
+        self._lock = threading.Lock()
+        self._memory_cache = collections.OrderedDict() # {hexdigest: octets}
+        self._memory_size_octets = 0
+        self._size_octets = None # determined lazily
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _path(self, hexdigest: str) -> str:
+        return os.path.join(self.cache_dir, hexdigest)
+
+    def cacheable(self, digest: str, octets_count: int | None) -> bool:
+        if octets_count is None or octets_count > self.max_blob_octets:
+            return False
+
+        return bool(_hexdigest(digest))
+
+    def open(self, digest: str) -> typing.BinaryIO | None:
+        '''
+        returns a readable filelike object w/ the blob's contents, if the blob is cached;
+        otherwise, returns None.
+        '''
+        if not (hexdigest := _hexdigest(digest)):
+            return None
+
+        with self._lock:
+            if (octets := self._memory_cache.get(hexdigest)) is not None:
+                self._memory_cache.move_to_end(hexdigest)
+                return io.BytesIO(octets)
+
+        path = self._path(hexdigest)
+        try:
+            fileobj = open(path, 'rb')
+        except FileNotFoundError:
+            return None
+
+        try:
+            os.utime(path) # track access for LRU-eviction
+        except OSError:
+            pass # might have been evicted concurrently (we still have an open fd, though)
+
+        octets_count = os.fstat(fileobj.fileno()).st_size
+        if octets_count <= self.memory_max_blob_octets:
+            with fileobj:
+                octets = fileobj.read()
+            self._put_into_memory(hexdigest=hexdigest, octets=octets)
+            return io.BytesIO(octets)
+
+        return fileobj
+
+    def put(self, digest: str, octets: bytes):
+        '''
+        stores the given blob (if it is cacheable). Raises ValueError if octets do not match
+        digest.
+        '''
+        if not self.cacheable(digest=digest, octets_count=len(octets)):
+            return
+
+        hexdigest = _hexdigest(digest)
+        if hashlib.sha256(octets).hexdigest() != hexdigest:
+            raise ValueError(f'blob does not match {digest=}')
+
+        if len(octets) <= self.memory_max_blob_octets:
+            self._put_into_memory(hexdigest=hexdigest, octets=octets)
+
+        path = self._path(hexdigest)
+        if os.path.exists(path):
+            return
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(octets)
+            os.replace(tmp_path, path)
+        except:
+            os.unlink(tmp_path)
+            raise
+
+        with self._lock:
+            if self._size_octets is not None:
+                self._size_octets += len(octets)
+
+        self._evict_if_required()
+
+    def _put_into_memory(self, hexdigest: str, octets: bytes):
+        with self._lock:
+            if hexdigest in self._memory_cache:
+                self._memory_cache.move_to_end(hexdigest)
+                return
+
+            self._memory_cache[hexdigest] = octets
+            self._memory_size_octets += len(octets)
+
+            while self._memory_size_octets > self.memory_max_size_octets:
+                _, evicted = self._memory_cache.popitem(last=False)
+                self._memory_size_octets -= len(evicted)
+
+    def _entries(self) -> list[os.DirEntry]:
+        return [
+            entry for entry in os.scandir(self.cache_dir)
+            if entry.is_file() and not entry.name.startswith('.tmp-')
+        ]
+
+    def _evict_if_required(self):
+        with self._lock:
+            if self._size_octets is None:
+                self._size_octets = sum(entry.stat().st_size for entry in self._entries())
+
+            if self._size_octets <= self.max_size_octets:
+                return
+
+            # other processes might have added or evicted blobs -> rescan
+            entries = []
+            for entry in self._entries():
+                try:
+                    entries.append((entry.path, entry.stat()))
+                except FileNotFoundError:
+                    pass # evicted concurrently
+
+            size_octets = sum(stat.st_size for _, stat in entries)
+            # evict some more than strictly required, so we do not need to scan upon each write
+            target_size_octets = int(self.max_size_octets * 0.9)
+
+            for path, stat in sorted(entries, key=lambda entry: entry[1].st_mtime):
+                if size_octets <= target_size_octets:
+                    break
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+                size_octets -= stat.st_size
+
+            logger.debug(f'evicted blobs from {self.cache_dir=}; {size_octets=}')
+            self._size_octets = size_octets
+
+
+@dataclasses.dataclass(frozen=True)
+class CachedManifest:
+    octets: bytes
+    content_type: str
+    digest: str
+
+
+class ManifestCache:
+    def __init__(
+        self,
+        tag_ttl_seconds: int=60,
+        max_manifests: int=4096,
+    ):
+        '''
+        an in-memory cache for OCI manifests.
+
+        Manifests referenced by digest are immutable, and are thus cached w/o expiry (however,
+        least-recently-used manifests are evicted if more than `max_manifests` are cached).
+        Resolutions of symbolic tags to digests are cached for `tag_ttl_seconds`.
+
+        Manifests retrieved by digest are only returned if their content-type is acceptable
+        (considering the accept-header requests are issued with). Tag-resolutions are cached per
+        accept-header (as registries might return different manifests depending on the
+        accept-header, e.g. for multi-arch images).
+
+        Hits and misses are counted (see `hits`, `misses`, `stats`).
+        '''
+        self.tag_ttl_seconds = tag_ttl_seconds
+        self.max_manifests = max_manifests
+
+        self._lock = threading.Lock()
+        self._manifests = collections.OrderedDict() # {repository@digest: CachedManifest}
+        self._tags = {} # {(repository:tag, accept): (digest, expiry)}
+
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'manifests': len(self._manifests),
+            'tags': len(self._tags),
+        }
+
+    def _digest_key(
+        self,
+        image_reference: om.OciImageReference,
+        digest: str,
+    ) -> str:
+        return f'{image_reference.ref_without_tag}@{digest}'
+
+    def get(
+        self,
+        image_reference: str | om.OciImageReference,
+        accept: str | None,
+    ) -> CachedManifest | None:
+        image_reference = om.OciImageReference.to_image_ref(image_reference)
+
+        with self._lock:
+            if image_reference.has_digest_tag:
+                digest = image_reference.tag
+            else:
+                digest, expiry = self._tags.get((str(image_reference), accept), (None, None))
+                if digest and expiry < time.monotonic():
+                    del self._tags[(str(image_reference), accept)]
+                    digest = None
+
+            key = self._digest_key(image_reference=image_reference, digest=digest)
+
+            if (
+                not digest
+                or not (manifest := self._manifests.get(key))
+                or (accept and manifest.content_type not in accept)
+            ):
+                self.misses += 1
+                return None
+
+            self._manifests.move_to_end(key)
+            self.hits += 1
+            return manifest
+
+    def put(
+        self,
+        image_reference: str | om.OciImageReference,
+        accept: str | None,
+        octets: bytes,
+        content_type: str | None,
+    ):
+        if not content_type:
+            # we cannot determine whether manifest is acceptable w/o knowing its content-type
+            return
+
+        image_reference = om.OciImageReference.to_image_ref(image_reference)
+        digest = f'sha256:{hashlib.sha256(octets).hexdigest()}'
+
+        manifest = CachedManifest(
+            octets=octets,
+            content_type=content_type,
+            digest=digest,
+        )
+
+        with self._lock:
+            if not image_reference.has_digest_tag:
+                self._tags[(str(image_reference), accept)] = (
+                    digest,
+                    time.monotonic() + self.tag_ttl_seconds,
+                )
+
+            key = self._digest_key(image_reference=image_reference, digest=digest)
+            self._manifests[key] = manifest
+            self._manifests.move_to_end(key)
+
+            while len(self._manifests) > self.max_manifests:
+                self._manifests.popitem(last=False)
+
+    def invalidate(
+        self,
+        image_reference: str | om.OciImageReference,
+    ):
+        '''
+        removes cached entries for the given image-reference. If it references a symbolic tag,
+        the tag-resolutions are removed; if it references a digest, both the manifest and all
+        tag-resolutions (of the same repository) pointing to it are removed.
+        '''
+        image_reference = om.OciImageReference.to_image_ref(image_reference)
+
+        with self._lock:
+            if image_reference.has_digest_tag:
+                digest = image_reference.tag
+                self._manifests.pop(
+                    self._digest_key(image_reference=image_reference, digest=digest),
+                    None,
+                )
+                repository = image_reference.ref_without_tag
+                self._tags = {
+                    (ref, accept): (tag_digest, expiry)
+                    for (ref, accept), (tag_digest, expiry) in self._tags.items()
+                    if not (
+                        tag_digest == digest
+                        and om.OciImageReference(ref).ref_without_tag == repository
+                    )
+                }
+            else:
+                self._tags = {
+                    (ref, accept): entry
+                    for (ref, accept), entry in self._tags.items()
+                    if ref != str(image_reference)
+                }
+
+
+class TokenStore:
+    '''
+    backend for sharing (oauth-)tokens between token-caches (see `oci.client.OauthTokenCache`),
+    e.g. of different processes. Tokens are passed as (JSON-serialisable) dicts.
+    '''
+    def get(self, key: str) -> dict | None:
+        raise NotImplementedError
+
+    def put(self, key: str, token: dict, expiry: float):
+        raise NotImplementedError
+
+    def secret(self) -> bytes:
+        '''
+        returns a secret shared by all users of the store (which must not be stored alongside
+        tokens), used for deriving keys of tokens (see `oci.client.OauthTokenCache.credentials_id`)
+        '''
+        raise NotImplementedError
+
+
+class FileTokenStore(TokenStore):
+    def __init__(
+        self,
+        path: str,
+    ):
+        '''
+        stores tokens in a JSON-file, which may be shared by multiple processes.
+
+        Writes are atomic (write to temporary file + rename); concurrent writes from different
+        processes might however discard each other's tokens (which will then be re-requested).
+        The file is only readable by its owner. Expired tokens are purged upon writes.
+
+        The secret (see `secret`) is stored in a separate file (`<path>.secret`, also only readable
+        by its owner), which is created upon first use.
+
+        :param str path: file to store tokens in (parent directory will be created if absent)
+        '''
+        self.path = os.path.abspath(path)
+        self.secret_path = f'{self.path}.secret'
+        self._secret = None
+
+        self._lock = threading.Lock()
+        self._tokens = {} # {key: {'token': token, 'expiry': expiry}}
+        self._mtime = None
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+    def _load(self) -> dict:
+        # must be called w/ lock being held; only re-reads file if it was modified
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            return self._tokens
+
+        if mtime == self._mtime:
+            return self._tokens
+
+        try:
+            with open(self.path) as f:
+                tokens = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f'failed to read tokens from {self.path=} - ignoring: {e}')
+            return self._tokens
+
+        self._tokens = tokens
+        self._mtime = mtime
+        return tokens
+
+    def get(self, key: str) -> dict | None:
+        with self._lock:
+            entry = self._load().get(key)
+
+        if not entry or entry['expiry'] <= time.time():
+            return None
+
+        return entry['token']
+
+    def put(self, key: str, token: dict, expiry: float):
+        with self._lock:
+            now = time.time()
+            tokens = {
+                k: entry for k, entry in self._load().items()
+                if entry['expiry'] > now
+            }
+            tokens[key] = {'token': token, 'expiry': expiry}
+
+            # mkstemp creates files only readable by owner
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.path), prefix='.tmp-')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(tokens, f)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                logger.warning(f'failed to store token in {self.path=}: {e}')
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                return
+
+            self._tokens = tokens
+            self._mtime = os.stat(self.path).st_mtime_ns
+
+    def secret(self) -> bytes:
+        with self._lock:
+            if self._secret:
+                return self._secret
+
+            if not os.path.exists(self.secret_path):
+                # mkstemp creates files only readable by owner; linking fails if secret was
+                # created concurrently (in which case the existing one is used)
+                fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.path), prefix='.tmp-')
+                try:
+                    with os.fdopen(fd, 'wb') as f:
+                        f.write(secrets.token_bytes(32))
+                    os.link(tmp_path, self.secret_path)
+                except FileExistsError:
+                    pass
+                finally:
+                    os.unlink(tmp_path)
+
+            with open(self.secret_path, 'rb') as f:
+                self._secret = f.read()
+
+            return self._secret
@@ -4,13 +4,18 @@ import collections.abc
 import dataclasses
 import datetime
 import enum
+import functools
 import hashlib
+import heapq
+import hmac
 import io
+import itertools
 import json
 import logging
-import tempfile
+import secrets
 import threading
 import time
+import typing
 import urllib.parse
 
 import dacite
@@ -21,6 +26,7 @@ import www_authenticate
 
 import oci.auth as oa
 import oci.aws
+import oci.cache
 import oci.model as om
 import oci.util
 
@@ -52,6 +58,36 @@ class AuthMethod(enum.Enum):
     BASIC = 'basic'
 
 
+class BlobUploadMode(enum.Enum):
+    '''
+    upload-mode used for streaming blobs that exceed `max_chunk` (see `Client.put_blob`)
+
+    CHUNKED:
+        upload using a series of PATCH requests (as specified by OCI distribution-spec).
+        Not supported by all registries (e.g. GCR).
+
+    STREAMING_PUT:
+        upload using a single ("monolithic") PUT request, streaming the blob as request-body
+    '''
+    CHUNKED = 'chunked'
+    STREAMING_PUT = 'streaming_put'
+
+
+class _ChunkedUploadUnsupported(Exception):
+    pass
+
+
+# statuses indicating that a registry does not support chunked-upload (as opposed to, e.g.,
+# transient errors, or missing permissions, which must not change the upload-mode)
+_chunked_upload_unsupported_status_codes = frozenset((
+    400, # bad request
+    404, # not found
+    405, # method not allowed
+    416, # range not satisfiable
+    501, # not implemented
+))
+
+
 @dataclasses.dataclass
 class OauthToken:
     token: str
@@ -59,13 +95,19 @@ class OauthToken:
     expires_in: int = None
     issued_at: str = None
 
-    def valid(self):
+    @functools.cached_property
+    def expiry(self) -> float:
+        '''
+        expiry date (as epoch-seconds)
+        '''
         issued_at = dateutil.parser.isoparse(self.issued_at)
         # pessimistically deduct 30s, to be on the safe side
         expiry_date = issued_at + datetime.timedelta(seconds=self.expires_in - 30)
 
-        now = datetime.datetime.now(tz=datetime.timezone.utc)
-        return now < expiry_date
+        return expiry_date.timestamp()
+
+    def valid(self):
+        return time.time() < self.expiry
 
     def __post_init__(self):
         if not self.issued_at:
@@ -97,31 +139,186 @@ class OauthToken:
                 self.expires_in = datetime.timedelta(minutes=10).seconds
 
 
+TokenCacheKey = tuple[str, str, str | None] # (netloc, scope, credentials-id)
+
+
+# used for deriving credentials-ids of tokens which are not persisted; never persisted itself
+_credentials_id_key = secrets.token_bytes(32)
+
+
+def _credentials_id(
+    credentials: oa.OciCredentials | None,
+    key: bytes=_credentials_id_key,
+) -> str | None:
+    '''
+    returns an identifier for the given credentials, used to distinguish tokens retrieved w/
+    different credentials. The id is a keyed hash (HMAC) over all attributes of the credentials,
+    so it neither discloses them, nor allows guessing them w/o knowing `key`.
+    '''
+    if not credentials:
+        return None
+
+    return hmac.new(
+        key=key,
+        msg=json.dumps([type(credentials).__name__, *dataclasses.astuple(credentials)]).encode(),
+        digestmod=hashlib.sha256,
+    ).hexdigest()
+
+
 class OauthTokenCache:
-    def __init__(self):
-        self.tokens = collections.defaultdict(dict) # {netloc: {scope: token}}
+    def __init__(
+        self,
+        store: oci.cache.TokenStore | None=None,
+        refresh_before_expiry_seconds: int=60,
+    ):
+        '''
+        cache for oauth-tokens, keyed by (netloc, scope, credentials-id), and may thus be shared
+        between clients (see `shared_token_cache`). Expired tokens are evicted lazily.
+
+        Tokens are due to be refreshed (see `refresh_due`) if they expire in less than
+        `refresh_before_expiry_seconds` (but at most half of their validity-period).
+
+        :param TokenStore store: optional backend to share tokens w/ (e.g. other processes)
+        :param int refresh_before_expiry_seconds: see `refresh_due`
+        '''
+        self.tokens: dict[TokenCacheKey, OauthToken] = {}
         self.auth_methods = {} # {netloc: method}
+        self.store = store
+        self.refresh_before_expiry_seconds = refresh_before_expiry_seconds
         self._token_access_lock = threading.Lock()
+        self._expiries = [] # heap: [(expiry, key)]
+        self._refreshing: set[TokenCacheKey] = set()
+
+    def credentials_id(
+        self,
+        credentials: oa.OciCredentials | None,
+    ) -> str | None:
+        '''
+        returns the id to pass for tokens retrieved w/ the given credentials. If tokens are shared
+        via a store, ids are derived using the store's secret (so they are stable across
+        processes); otherwise, a per-process key is used.
+        '''
+        if self.store:
+            return _credentials_id(credentials, key=self.store.secret())
 
-    def token(self, image_reference: str, scope: str):
+        return _credentials_id(credentials)
+
+    def _key(
+        self,
+        image_reference: str,
+        scope: str,
+        credentials_id: str | None,
+    ) -> TokenCacheKey:
         netloc = om.OciImageReference(image_reference).netloc
+        return netloc, scope, credentials_id
+
+    def _evict_expired(self):
+        # must be called w/ lock being held
+        now = time.time()
+        while self._expiries and self._expiries[0][0] <= now:
+            _, key = heapq.heappop(self._expiries)
+            # token might have been replaced in the meantime
+            if (token := self.tokens.get(key)) and token.expiry <= now:
+                del self.tokens[key]
+
+    def _put(
+        self,
+        key: TokenCacheKey,
+        token: OauthToken,
+    ):
+        # must be called w/ lock being held
+        self.tokens[key] = token
+        heapq.heappush(self._expiries, (token.expiry, key))
+        self._refreshing.discard(key)
+
+    def token(
+        self,
+        image_reference: str,
+        scope: str,
+        credentials_id: str | None=None,
+    ) -> OauthToken | None:
+        key = self._key(image_reference, scope, credentials_id)
+
+        with self._token_access_lock:
+            self._evict_expired()
+
+            if (token := self.tokens.get(key)):
+                return token
+
+        if not self.store:
+            return None
+
+        if not (raw_token := self.store.get(json.dumps(key))):
+            return None
+
+        try:
+            token = OauthToken(**raw_token)
+        except TypeError:
+            return None
+
+        if not token.valid():
+            return None
 
         with self._token_access_lock:
-            # purge expired tokens
-            self.tokens[netloc] = {s:t for s,t in self.tokens.get(netloc, {}).items() if t.valid()}
+            self._put(key, token)
 
-            return self.tokens.get(netloc, {}).get(scope)
+        return token
 
-    def set_token(self, image_reference: str, token: OauthToken):
+    def set_token(
+        self,
+        image_reference: str,
+        token: OauthToken,
+        credentials_id: str | None=None,
+    ):
         if not token.valid():
             raise ValueError(f'token expired: {token=}')
-        # TODO: we might compare remaining validity, and only replace existing tokens
-        # if the new one has a later expiry date
 
-        netloc = om.OciImageReference(image_reference).netloc
+        key = self._key(image_reference, token.scope, credentials_id)
 
         with self._token_access_lock:
-            self.tokens[netloc][token.scope] = token
+            self._put(key, token)
+
+        if self.store:
+            self.store.put(
+                key=json.dumps(key),
+                token=dataclasses.asdict(token),
+                expiry=token.expiry,
+            )
+
+    def refresh_due(
+        self,
+        image_reference: str,
+        scope: str,
+        credentials_id: str | None=None,
+    ) -> bool:
+        '''
+        returns whether the cached token should be refreshed (because it will expire soon). Only
+        returns True once per token (callers are expected to refresh it, and to call
+        `refresh_done` if refreshing failed).
+        '''
+        key = self._key(image_reference, scope, credentials_id)
+
+        with self._token_access_lock:
+            if not (token := self.tokens.get(key)) or key in self._refreshing:
+                return False
+
+            refresh_period = min(self.refresh_before_expiry_seconds, (token.expires_in - 30) / 2)
+            if token.expiry - time.time() > refresh_period:
+                return False
+
+            self._refreshing.add(key)
+            return True
+
+    def refresh_done(
+        self,
+        image_reference: str,
+        scope: str,
+        credentials_id: str | None=None,
+    ):
+        key = self._key(image_reference, scope, credentials_id)
+
+        with self._token_access_lock:
+            self._refreshing.discard(key)
 
     def set_auth_method(self, image_reference: str, auth_method: AuthMethod):
         netloc = om.OciImageReference(image_reference).netloc
@@ -134,6 +331,10 @@ class OauthTokenCache:
         return self.auth_methods.get(netloc)
 
 
+# default token-cache, shared by all clients
+shared_token_cache = OauthTokenCache()
+
+
 def base_api_url(
     image_reference: str | om.OciImageReference,
 ) -> str:
@@ -190,6 +391,24 @@ class OciRoutes:
         })
         return self.uploads_url(image_reference=image_reference) + '?' + query
 
+    def mount_blob_url(
+        self,
+        image_reference: str | om.OciImageReference,
+        digest: str,
+        source_image_reference: str | om.OciImageReference,
+    ) -> str:
+        '''
+        used for cross-repository blob mounts (mounting blob from source-repository into
+        repository of image_reference). Both repositories must be hosted by the same registry.
+        '''
+        source_image_reference = om.OciImageReference.to_image_ref(source_image_reference)
+
+        query = urllib.parse.urlencode({
+            'mount': digest,
+            'from': source_image_reference.name,
+        })
+        return self.uploads_url(image_reference=str(image_reference)) + '?' + query
+
     def blob_url(self, image_reference: str | om.OciImageReference, digest: str):
         if isinstance(image_reference, om.OciImageReference):
             image_reference = str(image_reference)
@@ -229,6 +448,122 @@ def _scope(image_reference: str | om.OciImageReference, action: str):
     return scope
 
 
+def _mount_scope(
+    image_reference: str | om.OciImageReference,
+    source_image_reference: str | om.OciImageReference,
+):
+    '''
+    returns scope required for mounting blobs from source_image_reference into image_reference.
+    As two repositories are involved, the scope consists of two (space-separated) scopes.
+    '''
+    return ' '.join((
+        _scope(image_reference=image_reference, action='push,pull'),
+        _scope(image_reference=source_image_reference, action='pull'),
+    ))
+
+
+def _token_query(
+    scope: str,
+    service: str=None,
+) -> str:
+    '''
+    returns query-string for requesting a bearer-token for the given scope. If scope consists of
+    multiple (space-separated) scopes, each is passed as separate `scope` parameter.
+    '''
+    params = [('scope', s) for s in scope.split(' ')]
+    if service:
+        params.append(('service', service))
+
+    return urllib.parse.urlencode(params)
+
+
+def _scope_privileges(scope: str) -> oa.Privileges:
+    actions = ','.join(s.split(':')[-1] for s in scope.split(' '))
+    if 'push' in actions:
+        return oa.Privileges.READWRITE
+    return oa.Privileges.READONLY
+
+
+def _upload_url(
+    res: requests.Response,
+    digest: str=None,
+) -> str:
+    '''
+    returns the upload-url from the `Location` header of the given response (returned for
+    requests against upload-sessions). As the returned url _may_ be relative, it is completed
+    using the url of the response. If `digest` is passed, it is appended as query parameter
+    (as required for the last request closing an upload-session).
+    '''
+    upload_url = res.headers.get('Location')
+
+    # returned url _may_ be relative
+    if upload_url.startswith('/'):
+        parsed_url = urllib.parse.urlparse(res.url)
+        upload_url = f'{parsed_url.scheme}://{parsed_url.netloc}{upload_url}'
+
+    if not digest:
+        return upload_url
+
+    if '?' in upload_url:
+        prefix = '&'
+    else:
+        prefix = '?'
+
+    return upload_url + prefix + urllib.parse.urlencode({'digest': digest})
+
+
+def _blob_response(
+    fileobj: typing.BinaryIO,
+    digest: str,
+    url: str,
+) -> requests.models.Response:
+    '''
+    creates a "synthetic" response for blobs read from a blob-cache (for compatibility w/
+    callers expecting a response returned by `requests`).
+    '''
+    fileobj.seek(0, io.SEEK_END)
+    octets_count = fileobj.tell()
+    fileobj.seek(0)
+
+    res = requests.models.Response()
+    res.status_code = 200
+    res.reason = 'OK'
+    res.url = url
+    res.headers = requests.structures.CaseInsensitiveDict({
+        'Content-Length': str(octets_count),
+        'Content-Type': 'application/octet-stream',
+        'Docker-Content-Digest': digest,
+    })
+    res.raw = fileobj
+
+    return res
+
+
+def _manifest_response(
+    manifest: oci.cache.CachedManifest,
+    url: str,
+) -> requests.models.Response:
+    '''
+    creates a "synthetic" response for manifests read from a manifest-cache (for compatibility w/
+    callers expecting a response returned by `requests`).
+    '''
+    res = requests.models.Response()
+    res.status_code = 200
+    res.reason = 'OK'
+    res.url = url
+    res.headers = requests.structures.CaseInsensitiveDict({
+        'Content-Length': str(len(manifest.octets)),
+        'Docker-Content-Digest': manifest.digest,
+    })
+    if manifest.content_type:
+        res.headers['Content-Type'] = manifest.content_type
+    res.encoding = 'utf-8'
+    res._content = manifest.octets
+    res._content_consumed = True
+
+    return res
+
+
 def initialise_repository_if_required(func):
     '''
     Some OCI registries require separate repositories for each OCI artefact (e.g. AWS ECR), which
@@ -303,6 +638,9 @@ class Client:
         session: requests.Session=None,
         tag_preprocessing_callback: collections.abc.Callable[[str], str]=None,
         tag_postprocessing_callback: collections.abc.Callable[[str], str]=None,
+        blob_cache: oci.cache.BlobCache=None,
+        manifest_cache: oci.cache.ManifestCache=None,
+        token_cache: OauthTokenCache=None,
     ):
         '''
         :param Callable credentials_lookup:
@@ -317,9 +655,18 @@ class Client:
         :param Callable tag_postprocessing_callback:
             callback which is instrumented _after_ interacting with the OCI registry, i.e. useful to
             revert required sanitisation of `tag_preprocessing_callback`
+        :param BlobCache blob_cache:
+            optional cache for (small) blobs retrieved via `blob`
+        :param ManifestCache manifest_cache:
+            optional cache for manifests (used by `manifest_raw`, `manifest` and `head_manifest`;
+            invalidated by `put_manifest` and `delete_manifest`)
+        :param OauthTokenCache token_cache:
+            cache for auth-tokens; defaults to `shared_token_cache`
         '''
         self.credentials_lookup = credentials_lookup
-        self.token_cache = OauthTokenCache()
+        self.blob_cache = blob_cache
+        self.manifest_cache = manifest_cache
+        self.token_cache = token_cache or shared_token_cache
         if not session:
             self.session = requests.Session()
         else:
@@ -328,31 +675,62 @@ class Client:
         self.disable_tls_validation = disable_tls_validation
         self.tag_preprocessing_callback = tag_preprocessing_callback
         self.tag_postprocessing_callback = tag_postprocessing_callback
+        self.blob_upload_modes = {} # {netloc: BlobUploadMode}; detected upon first large upload
 
         if timeout_seconds:
             timeout_seconds = int(timeout_seconds)
         self.timeout_seconds = timeout_seconds
 
+    def _refresh_token_if_due(
+        self,
+        image_reference: str,
+        scope: str,
+        credentials_id: str | None,
+    ):
+        if not self.token_cache.refresh_due(
+            image_reference=image_reference,
+            scope=scope,
+            credentials_id=credentials_id,
+        ):
+            return
+
+        def refresh_token():
+            try:
+                self._authenticate(
+                    image_reference=image_reference,
+                    scope=scope,
+                    force=True,
+                )
+            except Exception as e:
+                logger.warning(f'failed to refresh token for {image_reference=} {scope=}: {e}')
+            finally:
+                self.token_cache.refresh_done(
+                    image_reference=image_reference,
+                    scope=scope,
+                    credentials_id=credentials_id,
+                )
+
+        threading.Thread(target=refresh_token, daemon=True).start()
+
     def _authenticate(
         self,
         image_reference: str | om.OciImageReference,
         scope: str,
         remaining_retries: int=3,
-    ):
+        force: bool=False,
+    ) -> OauthToken | None:
+        '''
+        ensures a (valid) token for the given scope is cached (unless basic-auth is to be used),
+        and returns it. Tokens which are about to expire are refreshed in the background.
+
+        @param force: if True, a new token is retrieved, even if a valid one is cached
+        '''
         if isinstance(image_reference, om.OciImageReference):
             image_reference = str(image_reference)
 
         cached_auth_method = self.token_cache.auth_method(image_reference=image_reference)
         if cached_auth_method is AuthMethod.BASIC:
-            return # basic-auth does not require any additional preliminary steps
-        if (
-            cached_auth_method in (AuthMethod.BEARER, AuthMethod.AWS_BASIC)
-            and self.token_cache.token(
-                image_reference=image_reference,
-                scope=scope,
-            )
-        ):
-            return # no re-auth required, yet
+            return None # basic-auth does not require any additional preliminary steps
 
         if 'push' in scope:
             privileges = oa.Privileges.READWRITE
@@ -366,6 +744,23 @@ class Client:
             privileges=privileges,
             absent_ok=True,
         )
+        credentials_id = self.token_cache.credentials_id(oci_creds)
+
+        if (
+            not force
+            and cached_auth_method in (AuthMethod.BEARER, AuthMethod.AWS_BASIC)
+            and (token := self.token_cache.token(
+                image_reference=image_reference,
+                scope=scope,
+                credentials_id=credentials_id,
+            ))
+        ):
+            self._refresh_token_if_due(
+                image_reference=image_reference,
+                scope=scope,
+                credentials_id=credentials_id,
+            )
+            return token # no re-auth required, yet
 
         if om.OciImageReference(image_reference).registry_type is om.OciRegistryType.AWS:
             if not oci_creds:
@@ -384,12 +779,13 @@ class Client:
             self.token_cache.set_token(
                 image_reference=image_reference,
                 token=token,
+                credentials_id=credentials_id,
             )
             self.token_cache.set_auth_method(
                 image_reference=image_reference,
                 auth_method=AuthMethod.AWS_BASIC,
             )
-            return
+            return token
 
         if not oci_creds:
             logger.debug(f'no credentials for {image_reference=} - attempting anonymous-auth')
@@ -412,7 +808,7 @@ class Client:
                 image_reference=image_reference,
                 auth_method=AuthMethod.BASIC,
             )
-            return # no additional preliminary steps required for basic-auth
+            return None # no additional preliminary steps required for basic-auth
         elif 'bearer' in auth_challenge:
             bearer = auth_challenge['bearer']
             service = bearer.get('service')
@@ -423,11 +819,7 @@ class Client:
         else:
             logger.warning(f'did not understand {auth_challenge=} - pbly a bug')
 
-        bearer_dict = {'scope': scope}
-        if service:
-            bearer_dict['service'] = service
-
-        realm = bearer['realm'] + '?' + urllib.parse.urlencode(bearer_dict)
+        realm = bearer['realm'] + '?' + _token_query(scope=scope, service=service)
 
         if oci_creds:
             auth = requests.auth.HTTPBasicAuth(
@@ -456,6 +848,7 @@ class Client:
                     image_reference=image_reference,
                     scope=scope,
                     remaining_retries=remaining_retries - 1,
+                    force=force,
                 )
 
         res.raise_for_status()
@@ -471,8 +864,11 @@ class Client:
         self.token_cache.set_token(
             image_reference=image_reference,
             token=token,
+            credentials_id=credentials_id,
         )
 
+        return token
+
     def _request(
         self,
         url: str,
@@ -491,7 +887,7 @@ class Client:
         image_reference = om.OciImageReference.to_image_ref(image_reference)
 
         try:
-            self._authenticate(
+            token = self._authenticate(
                 image_reference=image_reference,
                 scope=scope,
             )
@@ -518,33 +914,19 @@ class Client:
         auth = None
 
         if auth_method is AuthMethod.BASIC:
-            actions = scope.split(':')[-1]
-            if 'push' in actions:
-                privileges = oa.Privileges.READWRITE
-            else:
-                privileges = oa.Privileges.READONLY
-
             if oci_creds := self.credentials_lookup(
                 image_reference=image_reference.original_image_reference,
-                privileges=privileges,
+                privileges=_scope_privileges(scope=scope),
                 absent_ok=True,
             ):
                 auth = oci_creds.username, oci_creds.password
             else:
                 logger.debug(f'did not find any matching credentials for {image_reference=}')
         elif auth_method is AuthMethod.AWS_BASIC:
-            password = self.token_cache.token(
-                image_reference=image_reference,
-                scope=scope,
-            ).token
-            auth = 'AWS', password
+            auth = 'AWS', token.token
         else:
-            token = self.token_cache.token(
-                image_reference=image_reference,
-                scope=scope,
-            ).token
             headers = {
-              'Authorization': f'Bearer {token}',
+              'Authorization': f'Bearer {token.token}',
               **headers,
             }
 
@@ -619,12 +1001,23 @@ class Client:
         if not accept:
             accept = f'{om.OCI_MANIFEST_SCHEMA_V2_MIME}, {om.DOCKER_MANIFEST_SCHEMA_V2_MIME}'
 
+        url = self.routes.manifest_url(
+            image_reference=image_reference,
+            tag_preprocessing_callback=self.tag_preprocessing_callback,
+        )
+
+        if self.manifest_cache and (cached_manifest := self.manifest_cache.get(
+            image_reference=image_reference,
+            accept=accept,
+        )):
+            return _manifest_response(
+                manifest=cached_manifest,
+                url=url,
+            )
+
         try:
             res = self._request(
-                url=self.routes.manifest_url(
-                    image_reference=image_reference,
-                    tag_preprocessing_callback=self.tag_preprocessing_callback,
-                ),
+                url=url,
                 image_reference=image_reference,
                 scope=scope,
                 warn_if_not_ok=not absent_ok,
@@ -639,6 +1032,14 @@ class Client:
                 raise om.OciImageNotFoundException(he) from he
             raise he
 
+        if self.manifest_cache:
+            self.manifest_cache.put(
+                image_reference=image_reference,
+                accept=accept,
+                octets=res.content,
+                content_type=res.headers.get('Content-Type'),
+            )
+
         return res
 
     def manifest(
@@ -766,6 +1167,16 @@ class Client:
         if not accept:
             accept = om.MimeTypes.single_image
 
+        if self.manifest_cache and (cached_manifest := self.manifest_cache.get(
+            image_reference=image_reference,
+            accept=accept,
+        )):
+            return om.OciBlobRef(
+                digest=cached_manifest.digest,
+                mediaType=cached_manifest.content_type,
+                size=len(cached_manifest.octets),
+            )
+
         res = self._request(
             url=self.routes.manifest_url(
                 image_reference=image_reference,
@@ -899,6 +1310,9 @@ class Client:
         if not res.ok:
             logger.warning(f'our manifest was rejected (see below for more details): {manifest=}')
 
+        if self.manifest_cache:
+            self.manifest_cache.invalidate(image_reference=image_reference)
+
         res.raise_for_status()
 
         return res
@@ -928,6 +1342,9 @@ class Client:
         image_reference = om.OciImageReference(image_reference)
         scope = _scope(image_reference=image_reference, action='push,pull')
 
+        if self.manifest_cache:
+            self.manifest_cache.invalidate(image_reference=image_reference)
+
         if not purge or image_reference.has_digest_tag:
             if accept:
                 headers = {'Accept': accept}
@@ -998,12 +1415,26 @@ class Client:
         stream=True,
         absent_ok=False,
     ) -> requests.models.Response:
+        '''
+        retrieves the specified blob. If client has a `blob_cache`, it is tried to read the blob
+        from it (blobs are added to the cache after retrieval, if cacheable). In this case, a
+        "synthetic" response is returned (which does not stem from an actual HTTP-request).
+        '''
         image_reference = om.OciImageReference(image_reference)
+        url = self.routes.blob_url(image_reference=image_reference, digest=digest)
+
+        if self.blob_cache and (fileobj := self.blob_cache.open(digest=digest)):
+            logger.debug(f'read {digest=} from blob-cache')
+            return _blob_response(
+                fileobj=fileobj,
+                digest=digest,
+                url=url,
+            )
 
         scope = _scope(image_reference=image_reference, action='pull')
 
         res = self._request(
-            url=self.routes.blob_url(image_reference=image_reference, digest=digest),
+            url=url,
             image_reference=image_reference,
             scope=scope,
             method='GET',
@@ -1016,7 +1447,26 @@ class Client:
             return None
         res.raise_for_status()
 
-        return res
+        if not self.blob_cache:
+            return res
+
+        if (octets_count := res.headers.get('Content-Length')) is not None:
+            octets_count = int(octets_count)
+
+        if not self.blob_cache.cacheable(digest=digest, octets_count=octets_count):
+            return res
+
+        octets = res.content
+        try:
+            self.blob_cache.put(digest=digest, octets=octets)
+        except ValueError as ve:
+            logger.warning(f'will not cache blob: {ve}')
+
+        return _blob_response(
+            fileobj=io.BytesIO(octets),
+            digest=digest,
+            url=url,
+        )
 
     def head_blob(
         self,
@@ -1046,6 +1496,79 @@ class Client:
 
         return res
 
+    def mount_blob(
+        self,
+        image_reference: str | om.OciImageReference,
+        digest: str,
+        source_image_reference: str | om.OciImageReference,
+    ) -> bool:
+        '''
+        tries to mount the specified blob from source_image_reference's repository into
+        image_reference's repository (cross-repository blob mount, as specified by
+        oci-distribution-spec), which avoids the need of copying the blob.
+
+        This is only possible if both repositories are hosted by the same registry, and if the
+        registry supports mounting blobs. Returns `True` if blob was mounted (or already existed
+        in target repository), `False` otherwise. In the latter case, callers need to fallback to
+        copying the blob.
+        '''
+        image_reference = om.OciImageReference(image_reference)
+        source_image_reference = om.OciImageReference(source_image_reference)
+
+        if image_reference.netloc != source_image_reference.netloc:
+            return False
+
+        if image_reference.name == source_image_reference.name:
+            return self.head_blob(
+                image_reference=image_reference,
+                digest=digest,
+            ).ok
+
+        scope = _mount_scope(
+            image_reference=image_reference,
+            source_image_reference=source_image_reference,
+        )
+
+        try:
+            res = self._request(
+                url=self.routes.mount_blob_url(
+                    image_reference=image_reference,
+                    digest=digest,
+                    source_image_reference=source_image_reference,
+                ),
+                image_reference=image_reference,
+                scope=scope,
+                method='POST',
+                headers={
+                    'content-length': '0',
+                },
+                raise_for_status=False,
+                warn_if_not_ok=False,
+            )
+        except requests.exceptions.HTTPError as he:
+            # e.g. if we are not allowed to request a token for requested scope
+            logger.info(f'failed to mount {digest=} from {source_image_reference=}: {he}')
+            return False
+
+        if res.status_code == 201:
+            logger.debug(f'mounted {digest=} from {source_image_reference=} to {image_reference=}')
+            return True
+
+        if res.status_code == 202 and res.headers.get('Location'):
+            # registry refused to mount (or does not support mounting), and started
+            # an upload-session instead -> cancel it
+            self._request(
+                url=_upload_url(res),
+                image_reference=image_reference,
+                scope=scope,
+                method='DELETE',
+                raise_for_status=False,
+                warn_if_not_ok=False,
+            )
+
+        logger.debug(f'could not mount {digest=} from {source_image_reference=}: {res.status_code=}')
+        return False
+
     def put_blob(
         self,
         image_reference: str | om.OciImageReference,
@@ -1061,6 +1584,10 @@ class Client:
 
         mimetype should not be set to a different value than the default. It is exposed for
         users seeking lowlevel control.
+
+        If data is passed as generator or `requests.Response`, and `octets_count` exceeds
+        `max_chunk`, the blob is streamed (w/o buffering it in memory or on disk); see
+        `BlobUploadMode`.
         '''
         image_reference = om.OciImageReference(image_reference)
         head_res = self.head_blob(
@@ -1076,19 +1603,8 @@ class Client:
         data_is_filelike = hasattr(data, 'read')
         data_is_bytes = isinstance(data, bytes)
 
-        if octets_count < max_chunk or data_is_filelike or data_is_bytes:
-            if data_is_requests_resp:
-                data = data.content
-            elif data_is_generator:
-                # at least GCR does not like chunked-uploads; if small enough, workaround this
-                # and create one (not-that-big) bytes-obj
-                _data = bytes()
-                for chunk in data:
-                    _data += chunk
-                data = _data
-            elif data_is_filelike:
-                pass # if filelike, http.client will handle streaming for us
-
+        if data_is_filelike or data_is_bytes:
+            # if filelike, http.client will handle streaming for us
             return self._put_blob_single_post(
                 image_reference=image_reference,
                 digest=digest,
@@ -1096,41 +1612,92 @@ class Client:
                 data=data,
                 mimetype=mimetype,
             )
-        elif octets_count >= max_chunk and (data_is_generator or data_is_requests_resp):
-            # workaround: write into temporary file, as at least GCR does not implement
-            # chunked-upload, and requests will not properly work w/ all generators
-            # (in particular, it will not work w/ our "fake" on)
-            with tempfile.TemporaryFile() as tf:
-                if data_is_generator:
-                    for chunk in data:
-                        tf.write(chunk)
-                elif data_is_requests_resp:
-                    while (chunk := data.raw.read(4096)):
-                        tf.write(chunk)
-                else:
-                    # must only enter this codepath, if either generator or requests-response
-                    raise RuntimeError('this line must not be reached')
-                tf.seek(0)
-
-                return self._put_blob_single_post(
+
+        if data_is_requests_resp:
+            data_iterator = iter(functools.partial(data.raw.read, max_chunk), b'')
+        elif data_is_generator:
+            data_iterator = data
+        else:
+            raise NotImplementedError(type(data))
+
+        if octets_count < max_chunk:
+            # at least GCR does not like chunked-uploads; if small enough, workaround this
+            # and create one (not-that-big) bytes-obj
+            return self._put_blob_single_post(
+                image_reference=image_reference,
+                digest=digest,
+                octets_count=octets_count,
+                data=b''.join(data_iterator),
+                mimetype=mimetype,
+            )
+
+        try:
+            return self._put_blob_streaming(
+                image_reference=image_reference,
+                digest=digest,
+                octets_count=octets_count,
+                data_iterator=data_iterator,
+                chunk_size=max_chunk,
+                mimetype=mimetype,
+            )
+        finally:
+            if data_is_requests_resp:
+                data.close()
+
+    def _put_blob_streaming(
+        self,
+        image_reference: om.OciImageReference,
+        digest: str,
+        octets_count: int,
+        data_iterator: collections.abc.Iterator[bytes],
+        chunk_size: int,
+        mimetype: str,
+    ):
+        '''
+        uploads blob w/o buffering it (neither in memory, nor on disk). The upload-mode is chosen
+        depending on the target registry's capabilities: chunked-upload is tried first; if it
+        is rejected by the registry, a single PUT (streaming the blob as request-body) is used
+        instead. The detected upload-mode is cached per registry (netloc).
+        '''
+        netloc = image_reference.netloc
+        upload_mode = self.blob_upload_modes.get(netloc)
+
+        data_iterator = oci.util.rechunk(chunks=data_iterator, chunk_size=chunk_size)
+
+        if upload_mode in (None, BlobUploadMode.CHUNKED):
+            # buffer first chunk, so we can fallback to streaming-put if chunked-upload is
+            # rejected upon first chunk
+            first_chunk = next(data_iterator, b'')
+            try:
+                res = self._put_blob_chunked(
                     image_reference=image_reference,
-                    digest=digest,
                     octets_count=octets_count,
-                    data=tf,
+                    data_iterator=itertools.chain((first_chunk,), data_iterator),
+                    chunk_size=chunk_size,
                     mimetype=mimetype,
+                    probe=upload_mode is None,
                 )
-        else:
-            if data_is_requests_resp:
-                with data:
-                  return self._put_blob_chunked(
-                      image_reference=image_reference,
-                      octets_count=octets_count,
-                      data_iterator=data.iter_content(chunk_size=max_chunk),
-                      chunk_size=max_chunk,
-                      mimetype=mimetype,
-                  )
-            else:
-              raise NotImplementedError
+                self.blob_upload_modes[netloc] = BlobUploadMode.CHUNKED
+                return res
+            except _ChunkedUploadUnsupported:
+                logger.info(f'{netloc=} does not support chunked-upload - will use single PUT')
+                self.blob_upload_modes[netloc] = upload_mode = BlobUploadMode.STREAMING_PUT
+
+            data_iterator = itertools.chain((first_chunk,), data_iterator)
+
+        if upload_mode is BlobUploadMode.STREAMING_PUT:
+            return self._put_blob_single_post(
+                image_reference=image_reference,
+                digest=digest,
+                octets_count=octets_count,
+                data=oci.util.IterableReader(
+                    chunks=data_iterator,
+                    octets_count=octets_count,
+                ),
+                mimetype=mimetype,
+            )
+
+        raise NotImplementedError(upload_mode)
 
     @initialise_repository_if_required
     def _put_blob_chunked(
@@ -1140,7 +1707,16 @@ class Client:
         data_iterator: collections.abc.Iterator[bytes],
         chunk_size: int=1024 * 1024 * 16, # 16 MiB
         mimetype='application/octect-stream',
+        probe: bool=False,
     ):
+        '''
+        uploads blob using chunked-upload. `data_iterator` must yield chunks of exactly
+        `chunk_size` octets (except for the last chunk).
+
+        if `probe` is set, _ChunkedUploadUnsupported is raised if the registry rejects the first
+        chunk w/ a status indicating chunked-upload is not supported (in which case no more than
+        the first chunk will have been consumed). Other errors are raised as HTTPError.
+        '''
         image_reference = om.OciImageReference(image_reference)
         scope = _scope(image_reference=image_reference, action='push,pull')
         logger.debug(f'chunked-put {chunk_size=}')
@@ -1157,7 +1733,7 @@ class Client:
         )
         res.raise_for_status()
 
-        upload_url = res.headers['location']
+        upload_url = _upload_url(res)
 
         octets_left = octets_count
         octets_sent = 0
@@ -1180,6 +1756,7 @@ class Client:
 
             crange_from = octets_sent
             crange_to = crange_from + len(data) - 1
+            probing = probe and octets_sent == 0
 
             res = self._request(
                 url=upload_url,
@@ -1192,21 +1769,36 @@ class Client:
                  'Content-Type': mimetype,
                  'Content-Range': f'{crange_from}-{crange_to}',
                  'Range': f'{crange_from}-{crange_to}',
-                }
+                },
+                raise_for_status=not probing,
+                warn_if_not_ok=not probing,
             )
-            res.raise_for_status()
 
-            upload_url = res.headers['location']
+            if not res.ok:
+                # only reached if probing upon first chunk
+                logger.info(f'chunked-upload rejected: {res.status_code=} - cancelling upload')
+                self._request(
+                    url=upload_url,
+                    image_reference=image_reference,
+                    scope=scope,
+                    method='DELETE',
+                    raise_for_status=False,
+                    warn_if_not_ok=False,
+                )
+
+                if res.status_code in _chunked_upload_unsupported_status_codes:
+                    raise _ChunkedUploadUnsupported(res.status_code)
+                res.raise_for_status()
+
+            upload_url = _upload_url(res)
 
             octets_sent += len(data)
 
         sha256_digest = f'sha256:{sha256.hexdigest()}'
 
         # close uploading session
-        query = urllib.parse.urlencode({'digest': sha256_digest})
-        upload_url = res.headers['location'] + '?' + query
         res = self._request(
-            url=upload_url,
+            url=_upload_url(res, digest=sha256_digest),
             image_reference=image_reference,
             scope=scope,
             method='PUT',
@@ -1242,22 +1834,8 @@ class Client:
             method='POST',
         )
 
-        upload_url = res.headers.get('Location')
-
-        # returned url _may_ be relative
-        if upload_url.startswith('/'):
-            parsed_url = urllib.parse.urlparse(res.url)
-            upload_url = f'{parsed_url.scheme}://{parsed_url.netloc}{upload_url}'
-
-        if '?' in upload_url:
-            prefix = '&'
-        else:
-            prefix = '?'
-
-        upload_url += prefix + urllib.parse.urlencode({'digest': digest})
-
         res = self._request(
-            url=upload_url,
+            url=_upload_url(res, digest=digest),
             image_reference=image_reference,
             scope=scope,
             method='PUT',
@@ -76,6 +76,7 @@ class Client:
         session: aiohttp.ClientSession=None,
         tag_preprocessing_callback: collections.abc.Callable[[str], str]=None,
         tag_postprocessing_callback: collections.abc.Callable[[str], str]=None,
+        token_cache: oci.client.OauthTokenCache=None,
     ):
         '''
         :param Callable credentials_lookup:
@@ -90,9 +91,12 @@ class Client:
         :param Callable tag_postprocessing_callback:
             callback which is instrumented _after_ interacting with the OCI registry, i.e. useful to
             revert required sanitisation of `tag_preprocessing_callback`
+        :param OauthTokenCache token_cache:
+            cache for auth-tokens; defaults to `oci.client.shared_token_cache`
         '''
         self.credentials_lookup = credentials_lookup
-        self.token_cache = oci.client.OauthTokenCache()
+        self.token_cache = token_cache or oci.client.shared_token_cache
+        self._refresh_tasks = set() # keep references to running tasks
         if not session:
             self.session = aiohttp.ClientSession()
         else:
@@ -106,26 +110,55 @@ class Client:
             timeout_seconds = int(timeout_seconds)
         self.timeout_seconds = timeout_seconds
 
+    def _refresh_token_if_due(
+        self,
+        image_reference: str,
+        scope: str,
+        credentials_id: str | None,
+    ):
+        if not self.token_cache.refresh_due(
+            image_reference=image_reference,
+            scope=scope,
+            credentials_id=credentials_id,
+        ):
+            return
+
+        async def refresh_token():
+            try:
+                await self._authenticate(
+                    image_reference=image_reference,
+                    scope=scope,
+                    force=True,
+                )
+            except Exception as e:
+                logger.warning(f'failed to refresh token for {image_reference=} {scope=}: {e}')
+            finally:
+                self.token_cache.refresh_done(
+                    image_reference=image_reference,
+                    scope=scope,
+                    credentials_id=credentials_id,
+                )
+
+        task = asyncio.get_running_loop().create_task(refresh_token())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
     async def _authenticate(
         self,
         image_reference: str | om.OciImageReference,
         scope: str,
         remaining_retries: int=3,
-    ):
+        force: bool=False,
+    ) -> oci.client.OauthToken | None:
+        '''
+        see `oci.client.Client._authenticate`
+        '''
         if isinstance(image_reference, om.OciImageReference):
             image_reference = str(image_reference)
 
         cached_auth_method = self.token_cache.auth_method(image_reference=image_reference)
         if cached_auth_method is oci.client.AuthMethod.BASIC:
-            return # basic-auth does not require any additional preliminary steps
-        if (
-            cached_auth_method in (oci.client.AuthMethod.BEARER, oci.client.AuthMethod.AWS_BASIC)
-            and self.token_cache.token(
-                image_reference=image_reference,
-                scope=scope,
-            )
-        ):
-            return # no re-auth required, yet
+            return None # basic-auth does not require any additional preliminary steps
 
         if 'push' in scope:
             privileges = oa.Privileges.READWRITE
@@ -139,6 +172,26 @@ class Client:
             privileges=privileges,
             absent_ok=True,
         )
+        credentials_id = self.token_cache.credentials_id(oci_creds)
+
+        if (
+            not force
+            and cached_auth_method in (
+                oci.client.AuthMethod.BEARER,
+                oci.client.AuthMethod.AWS_BASIC,
+            )
+            and (token := self.token_cache.token(
+                image_reference=image_reference,
+                scope=scope,
+                credentials_id=credentials_id,
+            ))
+        ):
+            self._refresh_token_if_due(
+                image_reference=image_reference,
+                scope=scope,
+                credentials_id=credentials_id,
+            )
+            return token # no re-auth required, yet
 
         if om.OciImageReference(image_reference).registry_type is om.OciRegistryType.AWS:
             if not oci_creds:
@@ -156,12 +209,13 @@ class Client:
             self.token_cache.set_token(
                 image_reference=image_reference,
                 token=token,
+                credentials_id=credentials_id,
             )
             self.token_cache.set_auth_method(
                 image_reference=image_reference,
                 auth_method=oci.client.AuthMethod.AWS_BASIC,
             )
-            return
+            return token
 
         if not oci_creds:
             logger.debug(f'no credentials for {image_reference=} - attempting anonymous-auth')
@@ -184,7 +238,7 @@ class Client:
                 image_reference=image_reference,
                 auth_method=oci.client.AuthMethod.BASIC,
             )
-            return # no additional preliminary steps required for basic-auth
+            return None # no additional preliminary steps required for basic-auth
         elif 'bearer' in auth_challenge:
             bearer = auth_challenge['bearer']
             service = bearer.get('service')
@@ -195,11 +249,7 @@ class Client:
         else:
             logger.warning(f'did not understand {auth_challenge=} - pbly a bug')
 
-        bearer_dict = {'scope': scope}
-        if service:
-            bearer_dict['service'] = service
-
-        realm = bearer['realm'] + '?' + urllib.parse.urlencode(bearer_dict)
+        realm = bearer['realm'] + '?' + oci.client._token_query(scope=scope, service=service)
 
         if oci_creds:
             auth = aiohttp.BasicAuth(
@@ -224,10 +274,11 @@ class Client:
             if res.status == 429 and remaining_retries > 0:
                 logger.warning('quota was exceeded, will wait a minute and then retry again')
                 await asyncio.sleep(60)
-                return self._authenticate(
+                return await self._authenticate(
                     image_reference=image_reference,
                     scope=scope,
                     remaining_retries=remaining_retries - 1,
+                    force=force,
                 )
 
         res.raise_for_status()
@@ -243,8 +294,11 @@ class Client:
         self.token_cache.set_token(
             image_reference=image_reference,
             token=token,
+            credentials_id=credentials_id,
         )
 
+        return token
+
     async def _request(
         self,
         url: str,
@@ -263,7 +317,7 @@ class Client:
         image_reference = om.OciImageReference.to_image_ref(image_reference)
 
         try:
-            await self._authenticate(
+            token = await self._authenticate(
                 image_reference=image_reference,
                 scope=scope,
             )
@@ -290,15 +344,9 @@ class Client:
         auth = None
 
         if auth_method is oci.client.AuthMethod.BASIC:
-            actions = scope.split(':')[-1]
-            if 'push' in actions:
-                privileges = oa.Privileges.READWRITE
-            else:
-                privileges = oa.Privileges.READONLY
-
             if oci_creds := self.credentials_lookup(
                 image_reference=image_reference.original_image_reference,
-                privileges=privileges,
+                privileges=oci.client._scope_privileges(scope=scope),
                 absent_ok=True,
             ):
                 auth = aiohttp.BasicAuth(
@@ -308,18 +356,10 @@ class Client:
             else:
                 logger.debug(f'did not find any matching credentials for {image_reference=}')
         elif auth_method is oci.client.AuthMethod.AWS_BASIC:
-            password = self.token_cache.token(
-                image_reference=image_reference,
-                scope=scope,
-            ).token
-            auth = 'AWS', password
+            auth = 'AWS', token.token
         else:
-            token = self.token_cache.token(
-                image_reference=image_reference,
-                scope=scope,
-            ).token
             headers = {
-              'Authorization': f'Bearer {token}',
+              'Authorization': f'Bearer {token.token}',
               **headers,
             }
 
@@ -786,6 +826,80 @@ class Client:
 
         return res
 
+    async def mount_blob(
+        self,
+        image_reference: str | om.OciImageReference,
+        digest: str,
+        source_image_reference: str | om.OciImageReference,
+    ) -> bool:
+        '''
+        tries to mount the specified blob from source_image_reference's repository into
+        image_reference's repository (cross-repository blob mount). Returns `True` if blob was
+        mounted, `False` otherwise (in which case callers need to fallback to copying the blob).
+
+        see `oci.client.Client.mount_blob`
+        '''
+        image_reference = om.OciImageReference(image_reference)
+        source_image_reference = om.OciImageReference(source_image_reference)
+
+        if image_reference.netloc != source_image_reference.netloc:
+            return False
+
+        if image_reference.name == source_image_reference.name:
+            return (await self.head_blob(
+                image_reference=image_reference,
+                digest=digest,
+            )).ok
+
+        scope = oci.client._mount_scope(
+            image_reference=image_reference,
+            source_image_reference=source_image_reference,
+        )
+
+        try:
+            res = await self._request(
+                url=self.routes.mount_blob_url(
+                    image_reference=image_reference,
+                    digest=digest,
+                    source_image_reference=source_image_reference,
+                ),
+                image_reference=image_reference,
+                scope=scope,
+                method='POST',
+                headers={
+                    'content-length': '0',
+                },
+                raise_for_status=False,
+                warn_if_not_ok=False,
+            )
+        except aiohttp.client_exceptions.ClientResponseError as e:
+            # e.g. if we are not allowed to request a token for requested scope
+            logger.info(f'failed to mount {digest=} from {source_image_reference=}: {e}')
+            return False
+
+        if res.status == 201:
+            logger.debug(f'mounted {digest=} from {source_image_reference=} to {image_reference=}')
+            return True
+
+        if res.status == 202 and (upload_url := res.headers.get('Location')):
+            # registry refused to mount (or does not support mounting), and started
+            # an upload-session instead -> cancel it
+            if upload_url.startswith('/'):
+                parsed_url = urllib.parse.urlparse(str(res.url))
+                upload_url = f'{parsed_url.scheme}://{parsed_url.netloc}{upload_url}'
+
+            await self._request(
+                url=upload_url,
+                image_reference=image_reference,
+                scope=scope,
+                method='DELETE',
+                raise_for_status=False,
+                warn_if_not_ok=False,
+            )
+
+        logger.debug(f'could not mount {digest=} from {source_image_reference=}: {res.status=}')
+        return False
+
     async def put_blob(
         self,
         image_reference: str | om.OciImageReference,
@@ -822,10 +936,7 @@ class Client:
             elif data_is_generator:
                 # at least GCR does not like chunked-uploads; if small enough, workaround this
                 # and create one (not-that-big) bytes-obj
-                _data = bytes()
-                for chunk in data:
-                    _data += chunk
-                data = _data
+                data = b''.join(data)
 
             return await self._put_blob_single_post(
                 image_reference=image_reference,
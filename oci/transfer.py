@@ -0,0 +1,169 @@
+'''
+bounded-concurrency execution of blob-transfers (download from source, upload to target)
+
+Blob transfers are I/O-bound, and independent of each other (the only ordering constraint
+is that the manifest referencing the blobs must only be uploaded after all blobs have been
+uploaded). `BlobTransferPool` allows running multiple blob-transfers concurrently, while
+still honouring:
+
+- a global maximum of concurrently running transfers (pool size)
+- a per-registry (netloc) maximum of concurrent transfers (applied to both source and target)
+- a total budget of "in-flight" octets (sum of sizes of blobs being transferred)
+
+Limits only apply within a pool. Hence, concurrent replications should share a pool (see
+`default_blob_transfer_pool`, which is used by `oci.replicate_artifact` and `oci.replicate_blobs`
+if no pool is passed).
+'''
+
+import collections.abc
+import concurrent.futures
+import logging
+import threading
+
+import oci.model as om
+
+logger = logging.getLogger(__name__)
+
+
+class _OctetsBudget:
+    '''
+    a counting semaphore, measured in octets. Acquiring blocks until enough octets are available.
+
+    To avoid deadlocks, requests exceeding the total budget are admitted if no other octets are
+    in-flight (i.e. an oversized blob will be transferred exclusively).
+    '''
+    def __init__(self, max_octets: int):
+        self.max_octets = max_octets
+        self.octets_in_flight = 0
+        self._cv = threading.Condition()
+
+    def acquire(self, octets: int):
+        octets = max(octets or 0, 0)
+        with self._cv:
+            self._cv.wait_for(
+                lambda: self.octets_in_flight == 0
+                or self.octets_in_flight + octets <= self.max_octets
+            )
+            self.octets_in_flight += octets
+        return octets
+
+    def release(self, octets: int):
+        with self._cv:
+            self.octets_in_flight -= octets
+            self._cv.notify_all()
+
+
+class BlobTransferPool:
+    def __init__(
+        self,
+        max_workers: int=8,
+        max_workers_per_registry: int=4,
+        registry_limits: dict[str, int]=None,
+        max_octets_in_flight: int=1024 * 1024 * 1024, # 1 GiB
+    ):
+        '''
+        :param int max_workers:
+            maximum amount of concurrently running blob-transfers (total)
+        :param int max_workers_per_registry:
+            maximum amount of concurrently running blob-transfers per registry (netloc) - both
+            source and target registries are considered
+        :param dict registry_limits:
+            optional overwrites for `max_workers_per_registry` ({netloc: limit})
+        :param int max_octets_in_flight:
+            maximum sum of (declared) sizes of blobs being transferred concurrently
+        '''
+        self.max_workers = max_workers
+        self.max_workers_per_registry = max_workers_per_registry
+        self.registry_limits = registry_limits or {}
+
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix='blob-transfer',
+        )
+        self._octets_budget = _OctetsBudget(max_octets=max_octets_in_flight)
+        self._registry_semaphores = {}
+        self._registry_semaphores_lock = threading.Lock()
+
+    def _registry_semaphore(self, netloc: str) -> threading.Semaphore:
+        with self._registry_semaphores_lock:
+            if not (semaphore := self._registry_semaphores.get(netloc)):
+                limit = self.registry_limits.get(netloc, self.max_workers_per_registry)
+                semaphore = threading.BoundedSemaphore(limit)
+                self._registry_semaphores[netloc] = semaphore
+
+            return semaphore
+
+    def _run(
+        self,
+        func: collections.abc.Callable,
+        netlocs: collections.abc.Iterable[str],
+        octets_count: int,
+    ):
+        # always acquire in same order to avoid deadlocks
+        semaphores = [
+            self._registry_semaphore(netloc)
+            for netloc in sorted(set(netlocs))
+        ]
+
+        for semaphore in semaphores:
+            semaphore.acquire()
+
+        try:
+            octets = self._octets_budget.acquire(octets_count)
+            try:
+                return func()
+            finally:
+                self._octets_budget.release(octets)
+        finally:
+            for semaphore in reversed(semaphores):
+                semaphore.release()
+
+    def submit(
+        self,
+        func: collections.abc.Callable,
+        src_image_reference: str | om.OciImageReference,
+        tgt_image_reference: str | om.OciImageReference,
+        octets_count: int=0,
+    ) -> concurrent.futures.Future:
+        '''
+        schedules the given (parameterless) callable for execution, honouring concurrency limits
+        for both source and target registries, as well as the in-flight octets budget.
+        '''
+        netlocs = (
+            om.OciImageReference.to_image_ref(src_image_reference).netloc,
+            om.OciImageReference.to_image_ref(tgt_image_reference).netloc,
+        )
+
+        return self._executor.submit(
+            self._run,
+            func=func,
+            netlocs=netlocs,
+            octets_count=octets_count,
+        )
+
+    def shutdown(self, wait: bool=True):
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        self.shutdown()
+
+
+_default_blob_transfer_pool = None
+_default_blob_transfer_pool_lock = threading.Lock()
+
+
+def default_blob_transfer_pool() -> BlobTransferPool:
+    '''
+    returns the process-wide blob-transfer-pool (w/ default limits), which is lazily created. It
+    must not be shut down by callers.
+    '''
+    global _default_blob_transfer_pool
+
+    with _default_blob_transfer_pool_lock:
+        if not _default_blob_transfer_pool:
+            _default_blob_transfer_pool = BlobTransferPool()
+
+        return _default_blob_transfer_pool
@@ -112,3 +112,68 @@ def tee_stream(
         yield fileobj
     finally:
         tee_receiver_thread.join()
+
+
+def rechunk(
+    chunks: collections.abc.Iterable[bytes],
+    chunk_size: int,
+) -> collections.abc.Generator[bytes, None, None]:
+    '''
+    re-chunks the given chunks such that each yielded chunk has exactly `chunk_size` octets
+    (except for the last one, which may be smaller)
+    '''
+    buf = bytearray()
+
+    for chunk in chunks:
+        buf += chunk
+        while len(buf) >= chunk_size:
+            yield bytes(buf[:chunk_size])
+            del buf[:chunk_size]
+
+    if buf:
+        yield bytes(buf)
+
+
+class IterableReader:
+    '''
+    Wraps an iterable of bytes into a (non-seekable) filelike object, whose length is known
+    upfront. This allows `requests` (and thus `http.client`) to stream the contents as request
+    body (w/ a Content-Length header, rather than using chunked transfer-encoding), without
+    the need of buffering all contents in memory or on disk.
+    '''
+    def __init__(
+        self,
+        chunks: collections.abc.Iterable[bytes],
+        octets_count: int,
+    ):
+        self._chunks = iter(chunks)
+        self._buf = b''
+        self._buf_offset = 0
+        self._pos = 0
+        self.octets_count = octets_count
+
+    def read(self, size: int=-1) -> bytes:
+        if size is None or size < 0:
+            data = self._buf[self._buf_offset:] + b''.join(self._chunks)
+            self._buf = b''
+            self._buf_offset = 0
+            self._pos += len(data)
+            return data
+
+        while len(self._buf) - self._buf_offset < size:
+            if (chunk := next(self._chunks, None)) is None:
+                break
+            self._buf = self._buf[self._buf_offset:] + chunk
+            self._buf_offset = 0
+
+        data = self._buf[self._buf_offset:self._buf_offset + size]
+        self._buf_offset += len(data)
+        self._pos += len(data)
+
+        return data
+
+    def tell(self) -> int:
+        return self._pos
+
+    def __len__(self) -> int:
+        return self.octets_count
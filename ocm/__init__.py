@@ -451,6 +451,96 @@ class Artifact(LabelMethodsMixin):
         return identity
 
 
+class ArtifactIdentityIndex:
+    def __init__(self, peers: collections.abc.Sequence[Artifact]):
+        '''
+        index of the identities of the given peers (which must all be of same type). Identities
+        are equal to those returned by `Artifact.identity(peers)`, but are computed once (in
+        linear time), rather than (in quadratic time) upon each lookup.
+
+        :param Sequence peers: artifacts to compute identities of (and for name-collision-checks)
+        '''
+        self.peers = tuple(peers)
+
+        if self.peers:
+            own_type = type(self.peers[0])
+            for peer in self.peers:
+                if not type(peer) == own_type:
+                    raise ValueError(f'all peers must be of same type {own_type=} {type(peer)=}')
+
+        self._ids = tuple(id(peer) for peer in self.peers)
+        self._positions = {peer_id: idx for idx, peer_id in enumerate(self._ids)}
+        # an artifact might be contained multiple times - all of those occurrences are "self"
+        self._occurrences = collections.Counter(self._ids)
+
+        bare_identities = [peer.identity(peers=()) for peer in self.peers]
+        self._counts = collections.Counter(bare_identities)
+
+        self._identities = tuple(
+            self._identity(
+                artifact=peer,
+                bare_identity=bare_identity,
+                collisions=self._counts[bare_identity] - self._occurrences[id(peer)],
+            ) for peer, bare_identity in zip(self.peers, bare_identities)
+        )
+
+    def _identity(
+        self,
+        artifact: Artifact,
+        bare_identity: ArtifactIdentity,
+        collisions: int,
+    ) -> ArtifactIdentity:
+        if not self.peers or len(bare_identity) > 1 or collisions < 1:
+            return bare_identity
+
+        return ArtifactIdentity(
+            name=artifact.name,
+            version=artifact.version,
+        )
+
+    def is_current(self, artifacts: collections.abc.Sequence[Artifact]) -> bool:
+        '''
+        returns whether this index was built for exactly the given artifacts (i.e. is not stale)
+        '''
+        return len(artifacts) == len(self.peers) and all(
+            artifact is peer and id(artifact) == peer_id
+            for artifact, peer, peer_id in zip(artifacts, self.peers, self._ids)
+        )
+
+    def identity(
+        self,
+        artifact: Artifact,
+        as_peer: bool=True,
+    ) -> ArtifactIdentity:
+        '''
+        returns the identity of the given artifact, as `artifact.identity(peers=self.peers)`
+        would. The artifact need not be one of the peers.
+
+        @param as_peer: if False, the artifact is regarded as not being one of the peers (even if
+                        it is), i.e. it will collide w/ itself. This is useful for matching
+                        artifacts against (modified copies of) the peers.
+        '''
+        if self.peers and not type(artifact) == type(self.peers[0]):
+            raise ValueError(f'all peers must be of same type {type(artifact)=}')
+
+        if (
+            as_peer
+            and (idx := self._positions.get(id(artifact))) is not None
+            and self.peers[idx] is artifact
+        ):
+            return self._identities[idx]
+
+        bare_identity = artifact.identity(peers=())
+        return self._identity(
+            artifact=artifact,
+            bare_identity=bare_identity,
+            collisions=self._counts[bare_identity],
+        )
+
+    def __iter__(self) -> collections.abc.Iterator[tuple[ArtifactIdentity, Artifact]]:
+        yield from zip(self._identities, self.peers)
+
+
 @dc
 class ComponentReference(Artifact, LabelMethodsMixin):
     name: str
@@ -594,6 +684,21 @@ class Component(LabelMethodsMixin):
     def identity(self):
         return ComponentIdentity(name=self.name, version=self.version)
 
+    def resource_identities(self) -> ArtifactIdentityIndex:
+        '''
+        returns an index of the identities of this component's resources (see
+        `ArtifactIdentityIndex`). The index is cached, and rebuilt if resources were modified
+        (i.e. added, removed, or replaced; in-place modifications of resources are not detected).
+        '''
+        resources = self.resources or ()
+        index = self.__dict__.get('_resource_identities')
+
+        if not index or not index.is_current(resources):
+            index = ArtifactIdentityIndex(peers=resources)
+            self.__dict__['_resource_identities'] = index
+
+        return index
+
     def iter_artefacts(self) -> collections.abc.Generator[Source | Resource, None, None]:
         if self.sources:
             yield from self.sources
@@ -670,40 +775,12 @@ class ComponentDescriptor:
         component_descriptor_dict: dict,
         validation_mode: ValidationMode | None=None,
     ):
-        def dateparse(v):
-            if not v:
-                return None
-            if isinstance(v, datetime.datetime):
-                return v
-            return datetime.datetime.fromisoformat(v)
-
         if not _have_dacite:
             raise RuntimeError('not available without dacite')
 
-        component_descriptor = dacite.from_dict(
+        component_descriptor = _component_descriptor_decoder().decode(
             data_class=ComponentDescriptor,
             data=component_descriptor_dict,
-            config=dacite.Config(
-                cast=[
-                    SchemaVersion,
-                    ResourceRelation,
-                ],
-                type_hooks={
-                    AccessType | str: functools.partial(
-                        enum_or_string, enum_type=AccessType
-                    ),
-                    ArtefactType | str: functools.partial(
-                        enum_or_string, enum_type=ArtefactType
-                    ),
-                    ArtifactIdentity | str: functools.partial(
-                        enum_or_string, enum_type=ArtefactType
-                    ),
-                    AccessType: functools.partial(
-                        enum_or_string, enum_type=AccessType
-                    ),
-                    datetime.datetime: dateparse,
-                },
-            )
         )
         if validation_mode is not None:
             ComponentDescriptor.validate(
@@ -729,6 +806,54 @@ class ComponentDescriptor:
             )
 
 
+def _dateparse(v):
+    if not v:
+        return None
+    if isinstance(v, datetime.datetime):
+        return v
+    return datetime.datetime.fromisoformat(v)
+
+
+def _component_descriptor_dacite_config() -> 'dacite.Config':
+    return dacite.Config(
+        cast=[
+            SchemaVersion,
+            ResourceRelation,
+        ],
+        type_hooks={
+            AccessType | str: functools.partial(
+                enum_or_string, enum_type=AccessType
+            ),
+            ArtefactType | str: functools.partial(
+                enum_or_string, enum_type=ArtefactType
+            ),
+            ArtifactIdentity | str: functools.partial(
+                enum_or_string, enum_type=ArtefactType
+            ),
+            AccessType: functools.partial(
+                enum_or_string, enum_type=AccessType
+            ),
+            datetime.datetime: _dateparse,
+        },
+    )
+
+
+@functools.cache
+def _component_descriptor_decoder():
+    '''
+    returns a (shared) decoder for component-descriptors, which is equivalent to, but (much) faster
+    than `dacite.from_dict` w/ `_component_descriptor_dacite_config`
+    '''
+    import ocm.decoder
+
+    dacite_config = _component_descriptor_dacite_config()
+
+    return ocm.decoder.DataclassDecoder(
+        type_hooks=dacite_config.type_hooks,
+        cast=dacite_config.cast,
+    )
+
+
 if _have_yaml:
     class EnumValueYamlDumper(yaml.SafeDumper):
         '''
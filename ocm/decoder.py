@@ -0,0 +1,334 @@
+'''
+a decoder for (OCM) dataclasses, which is semantically equivalent to `dacite.from_dict`, but
+"compiles" decoding-functions once per type (instead of inspecting types upon each decoding).
+
+Decoded objects are identical to those created by `dacite.from_dict` (w/ `check_types`, and
+neither `strict` nor `strict_unions_match`), and the same errors are raised.
+'''
+
+import collections.abc
+import dataclasses
+import threading
+import typing
+
+import dacite
+import dacite.core
+import dacite.dataclasses
+import dacite.exceptions
+import dacite.generics
+import dacite.types
+
+from dacite.types import (
+    extract_generic,
+    extract_origin_collection,
+    is_generic_collection,
+    is_optional,
+    is_subclass,
+    is_union,
+)
+
+
+Builder = typing.Callable[[typing.Any], typing.Any]
+Check = typing.Callable[[typing.Any], bool]
+
+
+def _compile_check(type_) -> Check:
+    '''
+    returns a function equivalent to `dacite.types.is_instance(value, type_)`
+    '''
+    if type_ == typing.Any:
+        return lambda value: True
+
+    if type_ in (float, complex):
+        return lambda value: isinstance(value, (int, float)) or isinstance(value, type_)
+
+    if isinstance(type_, type) and not is_generic_collection(type_):
+        return lambda value: isinstance(value, type_)
+
+    if is_union(type_):
+        checks = tuple(_compile_check(t) for t in extract_generic(type_))
+        return lambda value: any(check(value) for check in checks)
+
+    if is_generic_collection(type_) and not dacite.types.is_tuple(type_):
+        origin = extract_origin_collection(type_)
+
+        if not extract_generic(type_):
+            return lambda value: isinstance(value, origin)
+
+        key_check, value_check = (
+            _compile_check(t) for t in extract_generic(type_, defaults=(typing.Any, typing.Any))
+        ) if len(extract_generic(type_)) == 2 else (None, None)
+        item_check = _compile_check(extract_generic(type_, defaults=(typing.Any,))[0])
+
+        def check(value):
+            if not isinstance(value, origin):
+                return False
+            if isinstance(value, collections.abc.Mapping):
+                if not key_check:
+                    return dacite.types.is_instance(value, type_)
+                return all(
+                    key_check(k) and value_check(v)
+                    for k, v in value.items()
+                )
+            return all(item_check(item) for item in value)
+
+        return check
+
+    # rare cases (tuples, literals, new-types, ..) -> no need to specialise
+    return lambda value: dacite.types.is_instance(value, type_)
+
+
+class DataclassDecoder:
+    def __init__(
+        self,
+        type_hooks: dict[typing.Any, typing.Callable[[typing.Any], typing.Any]]={},
+        cast: collections.abc.Sequence[type]=(),
+    ):
+        '''
+        :param dict type_hooks: see `dacite.Config.type_hooks`
+        :param Sequence cast: see `dacite.Config.cast`
+        '''
+        self.type_hooks = dict(type_hooks)
+        self.cast = tuple(cast)
+
+        self._lock = threading.RLock()
+        self._builders: dict[typing.Any, Builder] = {}
+        self._dataclass_decoders: dict[type, Builder] = {}
+        # builders / decoders being compiled (only visible to compiling thread, which holds lock)
+        self._pending_builders: dict[typing.Any, Builder] = {}
+        self._pending_dataclass_decoders: dict[type, Builder] = {}
+
+    def decode(
+        self,
+        data_class: type,
+        data: collections.abc.Mapping,
+    ):
+        '''
+        equivalent to `dacite.from_dict(data_class, data, config)`
+        '''
+        if not (decode := self._dataclass_decoders.get(data_class)):
+            decode = self._dataclass_decoder(data_class)
+
+        return decode(data)
+
+    def _builder(self, type_) -> Builder:
+        if (builder := self._builders.get(type_)):
+            return builder
+
+        with self._lock:
+            if (builder := self._builders.get(type_) or self._pending_builders.get(type_)):
+                return builder
+
+            # register lazy placeholder first to allow for recursive types
+            compiled = None
+
+            def lazy_builder(data):
+                return compiled(data)
+
+            self._pending_builders[type_] = lazy_builder
+            try:
+                compiled = self._compile_builder(type_)
+            finally:
+                del self._pending_builders[type_]
+            self._builders[type_] = compiled
+
+            return compiled
+
+    def _compile_builder(self, type_) -> Builder:
+        '''
+        returns a function equivalent to `dacite.core._build_value(type_, data, config)`
+        '''
+        if dacite.types.is_init_var(type_):
+            type_ = dacite.types.extract_init_var(type_)
+
+        hook = self.type_hooks.get(type_)
+        optional = is_optional(type_)
+
+        if is_union(type_):
+            inner = self._compile_union_builder(type_)
+        elif is_generic_collection(type_):
+            inner = self._compile_collection_builder(type_)
+        elif dataclasses.is_dataclass(dacite.generics.orig(type_)):
+            decode_dataclass = self._dataclass_decoder(type_)
+
+            def inner(data):
+                if isinstance(data, collections.abc.Mapping):
+                    return decode_dataclass(data)
+                return data
+        else:
+            inner = None
+
+        for cast_type in self.cast:
+            if is_subclass(type_, cast_type):
+                if is_generic_collection(type_):
+                    cast = extract_origin_collection(type_)
+                else:
+                    cast = type_
+                break
+        else:
+            cast = None
+
+        if not hook and not optional and not cast:
+            if inner:
+                return inner
+            return lambda data: data
+
+        def build(data):
+            if hook:
+                data = hook(data)
+            if optional and data is None:
+                return data
+            if inner:
+                data = inner(data)
+            if cast:
+                data = cast(data)
+            return data
+
+        return build
+
+    def _compile_union_builder(self, union) -> Builder:
+        types = extract_generic(union)
+        if is_optional(union) and len(types) == 2:
+            return self._builder(types[0])
+
+        candidates = tuple(
+            (self._builder(inner_type), _compile_check(inner_type))
+            for inner_type in types
+        )
+
+        def build(data):
+            for builder, check in candidates:
+                try:
+                    value = builder(data)
+                except Exception:
+                    continue
+                if check(value):
+                    return value
+
+            raise dacite.exceptions.UnionMatchError(field_type=union, value=data)
+
+        return build
+
+    def _compile_collection_builder(self, collection) -> Builder:
+        is_mapping = is_subclass(collection, collections.abc.Mapping)
+        is_tuple = is_subclass(collection, tuple)
+        is_collection = is_subclass(collection, collections.abc.Collection)
+
+        if is_mapping:
+            item_type = extract_generic(collection, defaults=(typing.Any, typing.Any))[1]
+        else:
+            item_type = extract_generic(collection, defaults=(typing.Any,))[0]
+        build_item = self._builder(item_type)
+
+        def build(data):
+            data_type = data.__class__
+            if is_mapping and isinstance(data, collections.abc.Mapping):
+                return data_type((key, build_item(value)) for key, value in data.items())
+            elif is_tuple and isinstance(data, tuple):
+                # rare -> no need to specialise
+                return dacite.core._build_value_for_collection(
+                    collection=collection,
+                    data=data,
+                    config=dacite.Config(type_hooks=self.type_hooks, cast=list(self.cast)),
+                )
+            elif is_collection and isinstance(data, collections.abc.Collection):
+                return data_type(build_item(item) for item in data)
+            return data
+
+        return build
+
+    def _dataclass_decoder(self, data_class: type) -> Builder:
+        if (decode := self._dataclass_decoders.get(data_class)):
+            return decode
+
+        with self._lock:
+            if (decode := (
+                self._dataclass_decoders.get(data_class)
+                or self._pending_dataclass_decoders.get(data_class)
+            )):
+                return decode
+
+            fields = []
+
+            def decode(data: collections.abc.Mapping):
+                init_values = {}
+                post_init_values = {}
+
+                for name, build, check, field_type, default, init in fields:
+                    if name in data:
+                        try:
+                            value = build(data[name])
+                        except dacite.exceptions.DaciteFieldError as e:
+                            e.update_path(name)
+                            raise
+                        if not check(value):
+                            raise dacite.exceptions.WrongTypeError(
+                                field_path=name,
+                                field_type=field_type,
+                                value=value,
+                            )
+                    elif default:
+                        value = default()
+                    elif not init:
+                        continue
+                    else:
+                        raise dacite.exceptions.MissingValueError(name)
+
+                    if init:
+                        init_values[name] = value
+                    elif not frozen:
+                        post_init_values[name] = value
+
+                instance = data_class(**init_values)
+
+                for name, value in post_init_values.items():
+                    setattr(instance, name, value)
+
+                return instance
+
+            # register before compiling fields to allow for recursive types
+            self._pending_dataclass_decoders[data_class] = decode
+            try:
+                frozen = dacite.dataclasses.is_frozen(data_class)
+                try:
+                    type_hints = dacite.generics.get_concrete_type_hints(data_class)
+                except NameError as e:
+                    raise dacite.exceptions.ForwardReferenceError(str(e)) from None
+
+                for field in dacite.generics.get_fields(data_class):
+                    field_type = type_hints[field.name]
+                    fields.append((
+                        field.name,
+                        self._builder(field_type),
+                        _compile_check(field_type),
+                        field_type,
+                        _default_factory(field=field, field_type=field_type),
+                        field.init,
+                    ))
+            finally:
+                del self._pending_dataclass_decoders[data_class]
+
+            self._dataclass_decoders[data_class] = decode
+
+            return decode
+
+
+def _default_factory(
+    field: dataclasses.Field,
+    field_type,
+) -> typing.Callable[[], typing.Any] | None:
+    '''
+    returns a function equivalent to `dacite.dataclasses.get_default_value_for_field`, or None if
+    there is no default value
+    '''
+    if field.default != dataclasses.MISSING:
+        default = field.default
+        return lambda: default
+    elif field.default_factory != dataclasses.MISSING:
+        return field.default_factory
+    elif is_optional(field_type):
+        return lambda: None
+    return None
+
+
+default_decoder = DataclassDecoder()
@@ -0,0 +1,76 @@
+import concurrent.futures
+import unittest.mock
+
+import requests
+
+import ccc.github
+import model.github
+
+
+def github_cfg(http_url: str='https://github.example.org') -> model.github.GithubConfig:
+    return model.github.GithubConfig(
+        name='github',
+        raw_dict={
+            'httpUrl': http_url,
+            'apiUrl': f'{http_url}/api/v3',
+            'available_protocols': ['https'],
+            'technical_users': [
+                {'username': 'user', 'authToken': 'token'},
+            ],
+        },
+    )
+
+
+def test_sessions_are_shared():
+    pool = ccc.github.GithubSessionPool()
+
+    def api(username='user', session_adapter=ccc.github.SessionAdapter.RETRY):
+        ctor = ccc.github.github_api_ctor(
+            github_cfg=github_cfg(),
+            github_username=username,
+            session_adapter=session_adapter,
+            session_pool=pool,
+        )
+        return ctor(token='token')
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        sessions = {id(a.session) for a in executor.map(lambda _: api(), range(32))}
+    assert len(sessions) == 1
+
+    assert api().session is api().session
+    assert api().session is not api(username='other-user').session
+    assert api().session is not api(session_adapter=ccc.github.SessionAdapter.NONE).session
+
+    # caching may be combined w/ retries
+    adapter = api(session_adapter=ccc.github.SessionAdapter.RETRY_AND_CACHE).session.get_adapter(
+        'https://github.example.org',
+    )
+    assert adapter.max_retries.total
+    assert adapter.controller.cache_etags
+
+
+def test_requests_are_counted():
+    pool = ccc.github.GithubSessionPool()
+    session = pool.session(hostname='GitHub.example.org', username='user')
+    assert pool.session(hostname='github.example.org', username='user') is session
+
+    def send(request, **kwargs):
+        response = requests.Response()
+        response.status_code = 200 if request.url.endswith('/ok') else 404
+        response.request = request
+        response.url = request.url
+        return response
+
+    with unittest.mock.patch.object(session.get_adapter('https://'), 'send', side_effect=send):
+        session.get('https://github.example.org/api/v3/ok')
+        session.get('https://github.example.org/api/v3/ok')
+        session.get('https://github.example.org/api/v3/missing')
+
+    assert pool.stats() == {
+        'github.example.org/user (retry)': {
+            'requests': 3,
+            'errors': 1,
+            'cache_hits': 0,
+            'reused': 1,
+        },
+    }
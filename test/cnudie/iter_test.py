@@ -0,0 +1,246 @@
+import cnudie.iter
+import ocm
+
+
+def comp(
+    name: str,
+    references: list[str]=(),
+) -> ocm.Component:
+    return ocm.Component(
+        name=name,
+        version='1.0.0',
+        provider={
+            'name': 'some company',
+        },
+        repositoryContexts=[],
+        componentReferences=[
+            ocm.ComponentReference(
+                name=ref,
+                componentName=ref,
+                version='1.0.0',
+            ) for ref in references
+        ],
+        sources=[],
+        resources=[
+            ocm.Resource(
+                name=f'{name}-resource',
+                version='1.0.0',
+                type=ocm.ArtefactType.OCI_IMAGE,
+                access=None,
+            ),
+        ],
+        labels=[],
+    )
+
+
+def diamond_graph(
+    layers: int,
+    width: int=2,
+) -> dict[ocm.ComponentIdentity, ocm.Component]:
+    '''
+    returns components forming a diamond-shaped graph: a root-component, followed by `layers`
+    layers of `width` components each (each component references all components of the next
+    layer), followed by a single leaf-component. The amount of distinct paths from root to leaf
+    is thus width ** layers.
+    '''
+    def name(layer: int, idx: int):
+        return f'acme.org/layer-{layer}/{idx}'
+
+    components = [comp('acme.org/leaf')]
+    next_layer = ['acme.org/leaf']
+
+    for layer in reversed(range(layers)):
+        current_layer = [name(layer, idx) for idx in range(width)]
+        components.extend(comp(n, references=next_layer) for n in current_layer)
+        next_layer = current_layer
+
+    components.append(comp('acme.org/root', references=next_layer))
+
+    return {
+        component.identity(): component for component in components
+    }
+
+
+def counting_lookup(components: dict[ocm.ComponentIdentity, ocm.Component]):
+    lookups = []
+
+    def lookup(component_id: ocm.ComponentIdentity):
+        lookups.append(component_id)
+        return ocm.ComponentDescriptor(
+            meta=ocm.Metadata(),
+            component=components[component_id],
+        )
+
+    return lookup, lookups
+
+
+def paths(nodes):
+    return [
+        (type(n), tuple(e.component.identity() for e in n.path))
+        for n in nodes
+    ]
+
+
+def test_iter_prunes_duplicate_components():
+    components = diamond_graph(layers=6)
+    root = components[ocm.ComponentIdentity('acme.org/root', '1.0.0')]
+
+    lookup, _ = counting_lookup(components)
+    unpruned_nodes = list(cnudie.iter.iter(
+        component=root,
+        lookup=lookup,
+        prune_unique=False,
+    ))
+
+    lookup, lookups = counting_lookup(components)
+    nodes = list(cnudie.iter.iter(
+        component=root,
+        lookup=lookup,
+    ))
+
+    # each component must be looked-up only once
+    assert len(lookups) == len(components) - 1 # root-component is not looked-up
+    assert len(set(lookups)) == len(lookups)
+
+    # only redundant component-nodes are pruned; artefact-nodes are emitted for each path
+    seen_component_ids = set()
+    expected_nodes = []
+    for node in unpruned_nodes:
+        if isinstance(node, cnudie.iter.ComponentNode):
+            if node.component_id in seen_component_ids:
+                continue
+            seen_component_ids.add(node.component_id)
+        expected_nodes.append(node)
+
+    assert paths(nodes) == paths(expected_nodes)
+
+
+def test_iter_prunes_duplicate_subtrees():
+    layers = 12
+    components = diamond_graph(layers=layers)
+    root = components[ocm.ComponentIdentity('acme.org/root', '1.0.0')]
+    lookup, lookups = counting_lookup(components)
+
+    nodes = list(cnudie.iter.iter(
+        component=root,
+        lookup=lookup,
+        prune_subtrees=True,
+    ))
+
+    # 2 ** 12 distinct paths, but each component must be looked-up only once
+    assert len(lookups) == len(components) - 1 # root-component is not looked-up
+    assert len(set(lookups)) == len(lookups)
+
+    component_nodes = [n for n in nodes if isinstance(n, cnudie.iter.ComponentNode)]
+    resource_nodes = [n for n in nodes if isinstance(n, cnudie.iter.ResourceNode)]
+
+    assert len(component_nodes) == len(components)
+    assert len(resource_nodes) == len(components)
+    assert {n.component_id for n in component_nodes} == set(components)
+
+    # resource-nodes must be emitted directly after their component-node
+    for component_node, resource_node in zip(nodes[::2], nodes[1::2]):
+        assert component_node.path == resource_node.path
+
+    # pruning must also apply if component-nodes are not emitted
+    lookup, lookups = counting_lookup(components)
+    resource_nodes = list(cnudie.iter.iter_resources(
+        component=root,
+        lookup=lookup,
+        prune_subtrees=True,
+    ))
+    assert len(resource_nodes) == len(components)
+    assert len(lookups) == len(components) - 1
+
+
+def test_iter_wo_pruning():
+    components = diamond_graph(layers=3)
+    root = components[ocm.ComponentIdentity('acme.org/root', '1.0.0')]
+    lookup, lookups = counting_lookup(components)
+
+    component_nodes = list(cnudie.iter.iter(
+        component=root,
+        lookup=lookup,
+        prune_unique=False,
+        node_filter=cnudie.iter.Filter.components,
+    ))
+
+    # root + 2 + 4 + 8 + 8 (leaf, once per path)
+    assert len(component_nodes) == 23
+    assert len(lookups) == len(components) - 1
+
+
+def test_iter_prunes_considering_recursion_depth():
+    # root -> a -> b -> c
+    #      -> b
+    components = {
+        c.identity(): c for c in (
+            comp('root', references=['a', 'b']),
+            comp('a', references=['b']),
+            comp('b', references=['c']),
+            comp('c'),
+        )
+    }
+    root = components[ocm.ComponentIdentity('root', '1.0.0')]
+
+    for prune_subtrees in (False, True):
+        lookup, _ = counting_lookup(components)
+
+        component_nodes = list(cnudie.iter.iter(
+            component=root,
+            lookup=lookup,
+            recursion_depth=2,
+            prune_subtrees=prune_subtrees,
+            node_filter=cnudie.iter.Filter.components,
+        ))
+
+        # `b` is first reached via `a` (w/ exhausted recursion-depth); its references must still
+        # be traversed once it is reached via root
+        assert [n.component.name for n in component_nodes] == ['root', 'a', 'b', 'c']
+
+
+def test_iter_w_prefetching():
+    components = diamond_graph(layers=4, width=3)
+    root = components[ocm.ComponentIdentity('acme.org/root', '1.0.0')]
+
+    lookup, _ = counting_lookup(components)
+    expected = paths(cnudie.iter.iter(
+        component=root,
+        lookup=lookup,
+    ))
+
+    lookup, lookups = counting_lookup(components)
+    nodes = paths(cnudie.iter.iter(
+        component=root,
+        lookup=lookup,
+        prefetch_workers=4,
+    ))
+
+    assert nodes == expected
+    assert len(set(lookups)) == len(lookups)
+    assert len(lookups) == len(components) - 1
+
+    lookup, _ = counting_lookup(components)
+    nodes = paths(cnudie.iter.iter(
+        component=root,
+        lookup=lookup,
+        prune_unique=False,
+        prefetch_workers=4,
+    ))
+    lookup, _ = counting_lookup(components)
+    assert nodes == paths(cnudie.iter.iter(
+        component=root,
+        lookup=lookup,
+        prune_unique=False,
+    ))
+
+    for prefetch_workers in (0, 4):
+        lookup, lookups = counting_lookup(components)
+        nodes = list(cnudie.iter.iter(
+            component=root,
+            lookup=lookup,
+            prune_subtrees=True,
+            prefetch_workers=prefetch_workers,
+        ))
+        assert len(nodes) == 2 * len(components)
+        assert len(lookups) == len(components) - 1
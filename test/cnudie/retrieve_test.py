@@ -0,0 +1,124 @@
+import cnudie.retrieve
+import ocm
+
+ocm_repo_url = 'registry.example.org/ocm'
+
+
+def component_descriptor(
+    name: str,
+    version: str='1.0.0',
+) -> ocm.ComponentDescriptor:
+    return ocm.ComponentDescriptor(
+        meta=ocm.Metadata(),
+        component=ocm.Component(
+            name=name,
+            version=version,
+            provider={
+                'name': 'some company',
+            },
+            repositoryContexts=[
+                ocm.OciOcmRepository(baseUrl=ocm_repo_url),
+            ],
+            componentReferences=[],
+            sources=[],
+            resources=[
+                ocm.Resource(
+                    name='image',
+                    version=version,
+                    type=ocm.ArtefactType.OCI_IMAGE,
+                    access=ocm.OciAccess(imageReference=f'{ocm_repo_url}/image:{version}'),
+                    labels=[],
+                    srcRefs=[],
+                ),
+            ],
+            labels=[],
+        ),
+    )
+
+
+def test_indexed_file_system_cache_lookup(tmp_path):
+    lookup = cnudie.retrieve.indexed_file_system_cache_component_descriptor_lookup(
+        ocm_repository_lookup=cnudie.retrieve.ocm_repository_lookup(ocm_repo_url),
+        cache_dir=tmp_path,
+    )
+    cd = component_descriptor('acme.org/foo')
+    component_id = cd.component.identity()
+
+    writeback = lookup(component_id)
+    assert isinstance(writeback, cnudie.retrieve.WriteBack)
+
+    writeback(component_id, cd)
+    assert lookup(component_id) == cd
+
+    # other ocm-repository must not match
+    assert isinstance(
+        lookup(
+            component_id,
+            ocm_repository_lookup=cnudie.retrieve.ocm_repository_lookup('other.example.org/ocm'),
+        ),
+        cnudie.retrieve.WriteBack,
+    )
+
+
+def test_indexed_file_system_cache_lookup_eviction(tmp_path):
+    lookup = cnudie.retrieve.indexed_file_system_cache_component_descriptor_lookup(
+        ocm_repository_lookup=cnudie.retrieve.ocm_repository_lookup(ocm_repo_url),
+        cache_dir=tmp_path,
+        max_size_octets=4096,
+    )
+
+    component_ids = []
+    for idx in range(64):
+        cd = component_descriptor(f'acme.org/component-{idx}')
+        component_ids.append(cd.component.identity())
+        lookup(cd.component.identity())(cd.component.identity(), cd)
+
+    assert isinstance(lookup(component_ids[0]), cnudie.retrieve.WriteBack)
+    assert isinstance(lookup(component_ids[-1]), ocm.ComponentDescriptor)
+
+
+def test_indexed_file_system_cache_lookup_imports_yaml_cache(tmp_path):
+    yaml_cache_dir = tmp_path / 'yaml'
+    yaml_cache_dir.mkdir()
+    yaml_lookup = cnudie.retrieve.file_system_cache_component_descriptor_lookup(
+        ocm_repository_lookup=cnudie.retrieve.ocm_repository_lookup(ocm_repo_url),
+        cache_dir=str(yaml_cache_dir),
+    )
+    cd = component_descriptor('acme.org/foo')
+    component_id = cd.component.identity()
+    yaml_lookup(component_id)(component_id, cd)
+
+    lookup = cnudie.retrieve.indexed_file_system_cache_component_descriptor_lookup(
+        ocm_repository_lookup=cnudie.retrieve.ocm_repository_lookup(ocm_repo_url),
+        cache_dir=tmp_path / 'indexed',
+        import_yaml_cache_dir=str(yaml_cache_dir),
+    )
+
+    assert lookup(component_id) == cd
+
+
+def test_component_descriptor_db_size(tmp_path):
+    path = str(tmp_path / 'cache.db')
+    db = cnudie.retrieve._ComponentDescriptorDb(path=path, max_size_octets=4096)
+
+    def stored_size_octets():
+        size_octets, = db._connection.execute(
+            'SELECT COALESCE(SUM(size), 0) FROM component_descriptors',
+        ).fetchone()
+        return size_octets
+
+    for idx in range(64):
+        db.put(ocm_repo=ocm_repo_url, component_descriptor=component_descriptor(f'c-{idx}'))
+        # replacing entries must not change size
+        db.put(ocm_repo=ocm_repo_url, component_descriptor=component_descriptor(f'c-{idx}'))
+        assert db._size_octets() == stored_size_octets()
+
+    assert 0 < stored_size_octets() <= 4096
+
+    # size is initialised from existing entries
+    db._connection.execute('DROP TABLE metadata')
+    db = cnudie.retrieve._ComponentDescriptorDb(path=path, max_size_octets=4096)
+    assert db._size_octets() == stored_size_octets()
+
+    db._connection.execute("UPDATE metadata SET value = 0 WHERE key = 'size_octets'")
+    assert db.resync_size() == stored_size_octets()
@@ -0,0 +1,117 @@
+# SPDX-FileCopyrightText: 2024 SAP SE or an SAP affiliate company and Gardener contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest.mock
+
+import github3.exceptions
+
+import concourse.enumerator
+import concourse.replication_state
+
+from concourse.replication_state import (
+    ReplicationState,
+    ReplicationStateEntry,
+)
+
+
+def entry(
+    definition_committish: str='c1',
+    pipeline_names: tuple[str]=('p',),
+) -> ReplicationStateEntry:
+    return ReplicationStateEntry(
+        definition_committish=definition_committish,
+        branch_cfg_committish=None,
+        inputs_version='v1',
+        pipeline_names=pipeline_names,
+    )
+
+
+def test_replication_state(tmp_path):
+    path = tmp_path / 'state.json'
+    state = ReplicationState(path=str(path))
+
+    state.record(key='ok', entry=entry())
+    state.record(key='failed', entry=entry())
+    state.record(key='empty', entry=entry(pipeline_names=()))
+
+    # pending entries must not be considered
+    assert not state.entry('ok', 'c1', None, 'v1')
+    # entries w/o pipelines are committed immediately
+    assert state.entry('empty', 'c1', None, 'v1')
+
+    state.commit(succeeded_keys=('ok', 'failed'), failed_keys=('failed',))
+    state.save()
+
+    state = ReplicationState(path=str(path))
+    assert state.entry('ok', 'c1', None, 'v1') == entry()
+    assert not state.entry('ok', 'c2', None, 'v1')
+    assert not state.entry('ok', 'c1', 'meta-ci', 'v1')
+    assert not state.entry('ok', 'c1', None, 'v2')
+    assert not state.entry('failed', 'c1', None, 'v1')
+
+    state = ReplicationState(path=str(path), max_age_seconds=-1)
+    assert not state.entry('ok', 'c1', None, 'v1')
+
+
+def test_enumerate_incrementally(tmp_path):
+    def ref(ref):
+        if ref == 'meta/ci':
+            raise github3.exceptions.NotFoundError(unittest.mock.Mock(status_code=404))
+        return unittest.mock.Mock(object=unittest.mock.Mock(sha='c1'))
+
+    repository = unittest.mock.Mock()
+    repository.name = 'repo'
+    repository.default_branch = 'main'
+    repository.ref.side_effect = ref
+    repository.file_contents.return_value.decoded = b'pipeline: {}'
+
+    github_cfg = unittest.mock.Mock()
+    github_cfg.http_url.return_value = 'https://github.example'
+
+    job_mapping = unittest.mock.Mock()
+    job_mapping.team_name.return_value = 'team'
+    job_mapping.raw = {'concourse_target_team': 'team'}
+
+    concourse_cfg = unittest.mock.Mock(raw={'external_url': 'https://concourse.example'})
+    cfg_set = unittest.mock.Mock()
+    cfg_set.name.return_value = 'cfg-set'
+    cfg_set._cfg_mappings.return_value = [('concourse', {'config_names': ['concourse']})]
+    cfg_set._cfg_element_names.return_value = {'concourse'}
+    cfg_set._cfg_element.return_value = concourse_cfg
+
+    state = ReplicationState(path=str(tmp_path / 'state.json'))
+    enumerator = concourse.enumerator.GithubOrganisationDefinitionEnumerator(
+        job_mapping=job_mapping,
+        cfg_set=cfg_set,
+        replication_state=state,
+    )
+
+    def scan():
+        return list(enumerator._scan_repository_for_definitions(
+            repository=repository,
+            github_cfg=github_cfg,
+            org_name='org',
+        ))
+
+    descriptor, = scan()
+    assert not descriptor.unchanged
+    assert descriptor.pipeline_definition_committish == 'c1'
+    assert repository.file_contents.call_count == 1
+
+    state.commit(succeeded_keys=(descriptor.replication_state_key,))
+
+    descriptor, = scan()
+    assert descriptor.unchanged
+    assert descriptor.pipeline_name == 'pipeline'
+    assert repository.file_contents.call_count == 1 # definitions must not be retrieved again
+
+    state.save()
+
+    # changed cfg-contents must cause re-rendering
+    concourse_cfg.raw = {'external_url': 'https://other-concourse.example'}
+    state = ReplicationState(path=str(tmp_path / 'state.json'))
+    enumerator.replication_state = state
+
+    descriptor, = scan()
+    assert not descriptor.unchanged
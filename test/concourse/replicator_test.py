@@ -0,0 +1,160 @@
+# SPDX-FileCopyrightText: 2024 SAP SE or an SAP affiliate company and Gardener contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest.mock
+
+import ccc.concourse
+import concourse.client.model
+import concourse.replicator
+
+from concourse.replicator import DeployStatus
+
+
+rendered_definition = '''
+resources:
+- name: repo
+  type: git
+  source:
+    uri: https://github.com/acme/repo
+  tags: []
+  check_every: ~
+jobs:
+- name: build
+  public: false
+  plan:
+  - get: repo
+    trigger: true
+'''
+
+deployed_definition = {
+    'jobs': [{'name': 'build', 'plan': [{'trigger': True, 'get': 'repo'}]}],
+    'resources': [
+        {'source': {'uri': 'https://github.com/acme/repo'}, 'type': 'git', 'name': 'repo'},
+    ],
+}
+
+
+def test_pipeline_fingerprint():
+    fingerprint = concourse.replicator.pipeline_fingerprint
+    assert fingerprint(rendered_definition) == fingerprint(deployed_definition)
+    assert fingerprint(rendered_definition) != fingerprint(
+        rendered_definition.replace('trigger: true', 'trigger: false'),
+    )
+
+
+def test_pipeline_fingerprint_retains_falsy_params():
+    fingerprint = concourse.replicator.pipeline_fingerprint
+    definition = {
+        'jobs': [{
+            'name': 'build',
+            'plan': [{'task': 'build', 'params': {'DEBUG': True}}],
+        }],
+    }
+
+    fingerprints = set()
+    for params in (
+        {'DEBUG': True},
+        {'DEBUG': True, 'VERBOSE': False},
+        {'DEBUG': True, 'RETRIES': 0},
+        {'DEBUG': True, 'EXTRA': ''},
+        {'DEBUG': True, 'EXTRA': None},
+        {'DEBUG': False},
+    ):
+        definition['jobs'][0]['plan'][0]['params'] = params
+        fingerprints.add(fingerprint(definition))
+
+    assert len(fingerprints) == 6
+
+    # values of resource-sources are passed as-is to resources
+    assert fingerprint(rendered_definition) != fingerprint(
+        rendered_definition.replace('uri:', 'paths: []\n    uri:'),
+    )
+
+
+def test_deploy_skips_unchanged(monkeypatch):
+    api = unittest.mock.Mock()
+    api.pipeline_config_and_version.return_value = (deployed_definition, '42')
+    api.get_pipeline.return_value = concourse.client.model.Pipeline(
+        {'name': 'pipeline', 'paused': True, 'public': True},
+    )
+    monkeypatch.setattr(ccc.concourse, 'client_from_cfg_name', lambda **kwargs: api)
+
+    definition_descriptor = unittest.mock.Mock()
+    definition_descriptor.pipeline_name = 'pipeline'
+    definition_descriptor.pipeline = rendered_definition
+    definition_descriptor.concourse_target_team = 'team'
+
+    deployer = concourse.replicator.ConcourseDeployer(
+        cfg_set=None,
+        unpause_pipelines=True,
+        expose_pipelines=True,
+    )
+    result = deployer.deploy(definition_descriptor)
+
+    assert result.ok()
+    assert result.deploy_status & DeployStatus.UNCHANGED
+    api.set_pipeline.assert_not_called()
+    api.unpause_pipeline.assert_called_once_with(pipeline_name='pipeline')
+    api.expose_pipeline.assert_not_called()
+
+    # changed definitions must be deployed
+    api.set_pipeline.return_value = concourse.client.model.SetPipelineResult.UPDATED
+    definition_descriptor.pipeline = rendered_definition.replace('trigger: true', '')
+    result = deployer.deploy(definition_descriptor)
+
+    assert result.deploy_status == DeployStatus.SUCCEEDED
+    api.set_pipeline.assert_called_once()
+
+
+def test_replicate_in_stages():
+    def descriptor(name: str, exception: Exception=None):
+        definition_descriptor = unittest.mock.Mock(
+            exception=exception,
+            unchanged=False,
+            replication_state_key=None,
+        )
+        definition_descriptor.pipeline_name = name
+        return definition_descriptor
+
+    enumerator = unittest.mock.Mock()
+    enumerator.enumerate_definition_descriptors.return_value = [
+        descriptor(f'pipeline-{idx}') for idx in range(50)
+    ] + [descriptor('invalid', exception=ValueError())]
+
+    preprocessor = unittest.mock.Mock()
+    preprocessor.process_definition_descriptor.side_effect = lambda d: d
+
+    renderer = unittest.mock.Mock()
+    renderer.render.side_effect = lambda d: concourse.replicator.RenderResult(
+        definition_descriptor=d,
+        render_status=concourse.replicator.RenderStatus.SUCCEEDED,
+    )
+
+    deployer = unittest.mock.Mock()
+    deployer.deploy.side_effect = lambda d: concourse.replicator.DeployResult(
+        definition_descriptor=d,
+        deploy_status=DeployStatus.SUCCEEDED,
+    )
+
+    replicator = concourse.replicator.PipelineReplicator(
+        definition_enumerators=[enumerator],
+        descriptor_preprocessor=preprocessor,
+        definition_renderer=renderer,
+        definition_deployer=deployer,
+        render_workers=2,
+        deploy_workers=3,
+        queue_size=2,
+    )
+    results = replicator.replicate()
+
+    assert len(results) == 51
+    assert {
+        r.definition_descriptor.pipeline_name for r in results
+        if r.deploy_status is DeployStatus.SUCCEEDED
+    } == {f'pipeline-{idx}' for idx in range(50)}
+    assert deployer.deploy.call_count == 50
+
+    assert replicator.stage_metrics['enumerate'].count == 51
+    assert replicator.stage_metrics['render'].count == 51
+    assert replicator.stage_metrics['deploy'].count == 50
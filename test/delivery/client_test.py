@@ -0,0 +1,132 @@
+import concurrent.futures
+import json
+import threading
+import time
+import unittest.mock
+import zlib
+
+import pytest
+
+import delivery.client
+import ocm
+
+
+def chunked(octets: bytes, size: int):
+    return [octets[i:i + size] for i in range(0, len(octets), size)]
+
+
+@pytest.mark.parametrize('chunk_size', (1, 3, 1024))
+def test_iter_json_array(chunk_size):
+    elements = [
+        {'name': 'ä-component', 'values': [1, 2.5, None, True]},
+        42,
+        'str w/ ] and ,',
+        [],
+        {},
+    ]
+    octets = json.dumps(elements, indent=2, ensure_ascii=False).encode('utf-8')
+
+    assert list(delivery.client._iter_json_array(chunked(octets, chunk_size))) == elements
+    assert list(delivery.client._iter_json_array([b' [ ] '])) == []
+
+    with pytest.raises(ValueError):
+        list(delivery.client._iter_json_array(chunked(octets[:-3], chunk_size)))
+
+
+def test_iter_metadata():
+    client = delivery.client.DeliveryServiceClient(
+        routes=delivery.client.DeliveryServiceRoutes(base_url='https://delivery.example'),
+    )
+    queried_batches = []
+
+    def request(data, stream, **kwargs):
+        entries = json.loads(zlib.decompress(data, wbits=31))['entries']
+        queried_batches.append(entries)
+        octets = json.dumps([{'entry': entry} for entry in entries]).encode('utf-8')
+
+        res = unittest.mock.MagicMock(encoding='utf-8')
+        res.iter_content.return_value = chunked(octets, 16)
+        return res
+
+    client.request = request
+
+    artefacts = [{'component_name': f'c-{idx}'} for idx in range(10)]
+    results = list(client.iter_metadata(
+        artefacts=artefacts + artefacts[:2], # duplicates must be dropped
+        batch_size=3,
+        max_workers=2,
+    ))
+
+    assert sorted(len(batch) for batch in queried_batches) == [1, 3, 3, 3]
+    assert sorted(r['entry']['component_name'] for r in results) == sorted(
+        a['component_name'] for a in artefacts
+    )
+
+
+def test_cached_get():
+    client = delivery.client.DeliveryServiceClient(
+        routes=delivery.client.DeliveryServiceRoutes(base_url='https://delivery.example'),
+        cache_ttl_seconds=60,
+    )
+    requests = []
+    release = threading.Event()
+
+    def request(url, params, headers, **kwargs):
+        requests.append(headers)
+        release.wait(timeout=5)
+
+        res = unittest.mock.MagicMock(headers={'ETag': '"v1"'})
+        res.status_code = 304 if headers.get('If-None-Match') == '"v1"' else 200
+        res.json.return_value = ['1.0.0']
+        return res
+
+    client.request = request
+
+    def versions():
+        return client.greatest_component_versions(component_name='acme.org/c')
+
+    # concurrent identical requests must be coalesced
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(versions) for _ in range(4)]
+        time.sleep(0.1)
+        release.set()
+        assert [f.result() for f in futures] == [['1.0.0']] * 4
+
+    assert len(requests) == 1
+    assert versions() == ['1.0.0']
+    assert len(requests) == 1
+
+    # expired entries are revalidated using conditional requests
+    client._cache._entries[next(iter(client._cache._entries))].expiry = 0
+    assert versions() == ['1.0.0']
+    assert len(requests) == 2
+    assert requests[-1]['If-None-Match'] == '"v1"'
+    assert client._cache.stats()['coalesced'] == 3
+
+
+def test_cached_component_descriptor_is_validated():
+    client = delivery.client.DeliveryServiceClient(
+        routes=delivery.client.DeliveryServiceRoutes(base_url='https://delivery.example'),
+    )
+
+    def request(url, params, headers, **kwargs):
+        res = unittest.mock.MagicMock(headers={})
+        res.status_code = 200
+        res.json.return_value = {'meta': {'schemaVersion': 'v2'}, 'component': {}}
+        return res
+
+    client.request = request
+
+    with unittest.mock.patch('ocm.ComponentDescriptor.from_dict') as from_dict:
+        for validation_mode in (None, ocm.ValidationMode.FAIL, ocm.ValidationMode.FAIL):
+            client.component_descriptor(
+                name='acme.org/c',
+                version='1.0.0',
+                validation_mode=validation_mode,
+            )
+
+    # descriptors must not be served from cache for callers requesting different validation
+    assert [c.kwargs['validation_mode'] for c in from_dict.call_args_list] == [
+        None,
+        ocm.ValidationMode.FAIL,
+    ]
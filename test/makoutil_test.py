@@ -0,0 +1,34 @@
+import os
+
+import makoutil
+
+
+def test_template_cache(tmp_path):
+    include_dir = tmp_path / 'include'
+    include_dir.mkdir()
+    (include_dir / 'greeting.mako').write_text('hello ${name}')
+    module_dir = tmp_path / 'modules'
+
+    template_cache = makoutil.TemplateCache(
+        directories=(str(include_dir),),
+        module_directory=str(module_dir),
+    )
+
+    contents = '<%include file="/greeting.mako"/>!'
+    template = template_cache.template(name='my/template', contents=contents)
+
+    assert template.render(name='world') == 'hello world!'
+    assert template_cache.template(name='my/template', contents=contents) is template
+    assert template_cache.template(name='my/template', contents=contents + '!') is not template
+
+    # compiled modules are persisted
+    compiled = [
+        name for _, _, names in os.walk(module_dir) for name in names
+        if name.endswith('.py')
+    ]
+    assert len(compiled) == 3
+
+    # w/o module_directory, templates are compiled in-memory only
+    template_cache = makoutil.TemplateCache(directories=(str(include_dir),))
+    template = template_cache.template(name='my/template', contents=contents)
+    assert template.render(name='world') == 'hello world!'
@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: 2024 SAP SE or an SAP affiliate company and Gardener contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import model
+import model.container_registry
+import oci.auth as oa
+
+
+def registry_cfg(prefixes, privileges='readonly'):
+    return {
+        'username': 'user',
+        'password': 'pass',
+        'image_reference_prefixes': prefixes,
+        'privileges': privileges,
+    }
+
+
+def cfg_factory(**raw_cfgs):
+    return model.ConfigFactory.from_dict({
+        'cfg_types': {
+            'container_registry': {
+                'name': 'container_registry',
+                'src': [{'file': 'container_registry.yaml'}],
+                'model': {
+                    'cfg_type_name': 'container_registry',
+                    'type': 'ContainerRegistryConfig',
+                },
+            },
+        },
+        'container_registry': raw_cfgs,
+    })
+
+
+def test_find_config():
+    factory = cfg_factory(
+        ro=registry_cfg(['eu.gcr.io/proj/', 'europe-docker.pkg.dev/proj']),
+        rw=registry_cfg(['eu.gcr.io/proj/'], privileges='readwrite'),
+        admin=registry_cfg('eu.gcr.io/', privileges='admin'),
+        docker_hub=registry_cfg(['registry-1.docker.io/library/']),
+    )
+
+    def find(image_reference, privileges=None):
+        if (cfg := model.container_registry.find_config(
+            image_reference=image_reference,
+            privileges=privileges,
+            cfg_factory=factory,
+        )):
+            return cfg.name()
+        return None
+
+    # least privileges are preferred
+    assert find('eu.gcr.io/proj/image:1.0') == 'ro'
+    assert find('eu.gcr.io/proj/image:1.0', oa.Privileges.READWRITE) == 'rw'
+    assert find('eu.gcr.io/proj/image:1.0', oa.Privileges.ADMIN) == 'admin'
+    assert find('eu.gcr.io/other-proj/image:1.0') == 'admin'
+    assert find('europe-docker.pkg.dev/proj/image:1.0') == 'ro'
+    assert find('europe-docker.pkg.dev/proj/image:1.0', oa.Privileges.READWRITE) is None
+    assert find('eu.gcr.io') is None
+
+    # image-reference is normalised if it does not match
+    assert find('alpine:3') == 'docker_hub'
+
+    index = model.container_registry.registry_cfg_index(cfg_factory=factory)
+    assert model.container_registry.registry_cfg_index(cfg_factory=factory) is index
+
+    # index must be rebuilt if cfgs change
+    factory.raw['container_registry']['other'] = registry_cfg(['eu.gcr.io/other-proj/'])
+    assert find('eu.gcr.io/other-proj/image:1.0') == 'other'
+    assert model.container_registry.registry_cfg_index(cfg_factory=factory) is not index
@@ -107,6 +107,16 @@ class ConfigFactorySmokeTestsMixin:
         # compare the dictionaries here
         self.assertEqual(cfg_elem.raw, {'some_value':123})
 
+    def test_cfg_elements_are_cached(self):
+        element = self.examinee._cfg_element('a_type', 'first_value_of_a')
+        self.assertIs(self.examinee._cfg_element('a_type', 'first_value_of_a'), element)
+        self.assertIs(self.examinee.cfg_set('singleton_set')._cfg_element('a_type'), element)
+
+        # elements must be recreated if underlying raw cfg is replaced
+        self.examinee.raw['a_type']['first_value_of_a'] = {'some_value': 1}
+        element = self.examinee._cfg_element('a_type', 'first_value_of_a')
+        self.assertEqual(element.raw, {'some_value': 1})
+
 
 class ConfigFactoryCfgDirDeserialisationTest(unittest.TestCase, ConfigFactorySmokeTestsMixin):
     '''
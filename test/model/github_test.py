@@ -0,0 +1,117 @@
+# SPDX-FileCopyrightText: 2024 SAP SE or an SAP affiliate company and Gardener contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import time
+import unittest.mock
+
+import requests
+
+import model.github
+
+
+def response(headers: dict, from_cache: bool=False):
+    resp = requests.Response()
+    resp.headers.update(headers)
+    if from_cache:
+        resp.from_cache = True
+    return resp
+
+
+def test_rate_limit_tracker():
+    tracker = model.github.RateLimitTracker(max_age_seconds=60)
+    hook = tracker.response_hook(hostname='GitHub.com', username='user')
+    reset = time.time() + 3600
+
+    assert tracker.rate_limit(hostname='github.com', username='user') is None
+
+    hook(response({
+        'X-RateLimit-Limit': '5000',
+        'X-RateLimit-Remaining': '4711',
+        'X-RateLimit-Reset': str(int(reset)),
+        'X-RateLimit-Resource': 'core',
+    }))
+    rate_limit = tracker.rate_limit(hostname='github.com', username='user')
+    assert rate_limit.remaining == 4711
+    assert rate_limit.limit == 5000
+
+    # non-core quota, cached responses, and responses w/o rate-limit-headers must be ignored
+    hook(response({
+        'X-RateLimit-Remaining': '10',
+        'X-RateLimit-Reset': str(int(reset)),
+        'X-RateLimit-Resource': 'search',
+    }))
+    hook(response(
+        {'X-RateLimit-Remaining': '10', 'X-RateLimit-Reset': str(int(reset))},
+        from_cache=True,
+    ))
+    hook(response({}))
+    assert tracker.rate_limit(hostname='github.com', username='user').remaining == 4711
+
+    # outdated observations must not overwrite more recent ones
+    tracker.record(
+        hostname='github.com',
+        username='user',
+        rate_limit=model.github.RateLimit(
+            remaining=1,
+            limit=5000,
+            reset=reset,
+            observed=time.time() - 10,
+        ),
+    )
+    assert tracker.rate_limit(hostname='github.com', username='user').remaining == 4711
+
+    # expired quota must not be returned
+    for observed, reset in ((time.time() - 120, reset), (time.time(), time.time() - 1)):
+        tracker.record(
+            hostname='github.com',
+            username='other-user',
+            rate_limit=model.github.RateLimit(
+                remaining=1,
+                limit=5000,
+                reset=reset,
+                observed=observed,
+            ),
+        )
+        assert tracker.rate_limit(hostname='github.com', username='other-user') is None
+
+
+def test_credentials_with_most_remaining_quota():
+    github_cfg = model.github.GithubConfig(
+        name='github',
+        raw_dict={
+            'httpUrl': 'https://github.example.org',
+            'available_protocols': ['https'],
+            'technical_users': [
+                {'username': 'user-a', 'authToken': 'token-a'},
+                {'username': 'user-b', 'authToken': 'token-b'},
+                {'username': 'user-c', 'authToken': 'token-c'},
+            ],
+        },
+    )
+    tracker = model.github.RateLimitTracker()
+    reset = time.time() + 3600
+
+    for username, remaining in (('user-a', 10), ('user-b', 1000)):
+        tracker.record(
+            hostname='github.example.org',
+            username=username,
+            rate_limit=model.github.RateLimit(remaining=remaining, limit=5000, reset=reset),
+        )
+
+    with (
+        unittest.mock.patch.object(model.github, 'rate_limit_tracker', tracker),
+        unittest.mock.patch('github3.github.GitHubEnterprise') as api_ctor,
+    ):
+        api_ctor.return_value.rate_limit.return_value = {
+            'resources': {'core': {'limit': 5000, 'remaining': 100, 'reset': reset}},
+        }
+
+        assert github_cfg.credentials_with_most_remaining_quota().username() == 'user-b'
+
+        # quota must only be retrieved for credentials w/o known quota
+        api_ctor.assert_called_once_with(token='token-c', url='https://github.example.org')
+        assert tracker.rate_limit(hostname='github.example.org', username='user-c').remaining == 100
+
+        github_cfg.credentials_with_most_remaining_quota()
+        api_ctor.assert_called_once()
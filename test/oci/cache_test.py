@@ -0,0 +1,142 @@
+import hashlib
+import os
+import time
+
+import pytest
+
+import oci.cache
+
+
+def digest(octets: bytes) -> str:
+    return f'sha256:{hashlib.sha256(octets).hexdigest()}'
+
+
+def test_blob_cache(tmp_path):
+    cache = oci.cache.BlobCache(
+        cache_dir=tmp_path,
+        memory_max_blob_octets=4,
+    )
+
+    small = b'abc'
+    large = b'abcdefgh'
+
+    assert cache.open(digest(small)) is None
+
+    cache.put(digest(small), small)
+    cache.put(digest(large), large)
+
+    assert cache.open(digest(small)).read() == small
+    assert cache.open(digest(large)).read() == large
+
+    # small blobs are also kept in memory
+    os.unlink(tmp_path / digest(small).removeprefix('sha256:'))
+    assert cache.open(digest(small)).read() == small
+
+    with pytest.raises(ValueError):
+        cache.put(digest(small), b'other')
+
+    # only sha256-digests are supported
+    assert not cache.cacheable('sha512:abc', octets_count=3)
+    cache.put('md5:abc', small)
+    assert cache.open('md5:abc') is None
+
+
+def test_blob_cache_eviction(tmp_path):
+    cache = oci.cache.BlobCache(
+        cache_dir=tmp_path,
+        max_size_octets=20,
+        memory_max_size_octets=0,
+    )
+
+    blobs = [bytes([i]) * 8 for i in range(2)]
+
+    for idx, blob in enumerate(blobs):
+        cache.put(digest(blob), blob)
+        path = tmp_path / digest(blob).removeprefix('sha256:')
+        os.utime(path, (idx, idx)) # make mtime deterministic
+
+    # add another blob -> exceeds max-size -> least-recently-used blob must be evicted
+    cache.put(digest(b'x' * 8), b'x' * 8)
+
+    assert cache.open(digest(blobs[0])) is None
+    assert cache.open(digest(blobs[1])).read() == blobs[1]
+    assert cache.open(digest(b'x' * 8)).read() == b'x' * 8
+
+
+def test_manifest_cache():
+    cache = oci.cache.ManifestCache(tag_ttl_seconds=60)
+    manifest = b'{"schemaVersion": 2}'
+    accept = 'application/vnd.oci.image.manifest.v1+json'
+
+    assert cache.get('example.org/img:1', accept=accept) is None
+
+    cache.put(
+        'example.org/img:1',
+        accept=accept,
+        octets=manifest,
+        content_type=accept,
+    )
+
+    cached = cache.get('example.org/img:1', accept=accept)
+    assert cached.octets == manifest
+    assert cached.digest == digest(manifest)
+
+    # tag-resolutions are specific to accept-header
+    assert cache.get('example.org/img:1', accept='other') is None
+
+    # manifests resolved by digest are cached regardless of tag
+    assert cache.get(f'example.org/img@{digest(manifest)}', accept=accept).octets == manifest
+    # .. but only if acceptable
+    assert cache.get(f'example.org/img@{digest(manifest)}', accept='other') is None
+    # .. and specific to repository
+    assert cache.get(f'example.org/other@{digest(manifest)}', accept=accept) is None
+
+    cache.invalidate('example.org/img:1')
+    assert cache.get('example.org/img:1', accept=accept) is None
+    assert cache.get(f'example.org/img@{digest(manifest)}', accept=accept)
+
+    cache.put('example.org/img:1', accept=accept, octets=manifest, content_type=accept)
+    cache.invalidate(f'example.org/img@{digest(manifest)}')
+    assert cache.get('example.org/img:1', accept=accept) is None
+
+    assert cache.hits == 3
+    assert cache.misses == 6
+
+
+def test_manifest_cache_tag_expiry():
+    cache = oci.cache.ManifestCache(tag_ttl_seconds=-1)
+    manifest = b'{}'
+
+    cache.put('example.org/img:1', accept=None, octets=manifest, content_type='a/b')
+
+    assert cache.get('example.org/img:1', accept=None) is None
+    assert cache.get(f'example.org/img@{digest(manifest)}', accept=None).octets == manifest
+
+
+def test_file_token_store(tmp_path):
+    path = os.path.join(tmp_path, 'tokens', 'tokens.json')
+    store = oci.cache.FileTokenStore(path=path)
+
+    assert store.get('key') is None
+
+    store.put('key', {'token': 'abc'}, expiry=time.time() + 60)
+    store.put('expired', {'token': 'def'}, expiry=time.time() - 1)
+    assert store.get('key') == {'token': 'abc'}
+    assert store.get('expired') is None
+
+    # tokens are shared w/ other stores (e.g. of other processes) using same file
+    other_store = oci.cache.FileTokenStore(path=path)
+    assert other_store.get('key') == {'token': 'abc'}
+
+    other_store.put('other-key', {'token': 'ghi'}, expiry=time.time() + 60)
+    assert store.get('other-key') == {'token': 'ghi'}
+
+    assert os.stat(path).st_mode & 0o077 == 0
+
+    # secret is created once, and shared w/ other stores
+    secret = store.secret()
+    assert len(secret) == 32
+    assert other_store.secret() == secret
+    assert oci.cache.FileTokenStore(path=path).secret() == secret
+    assert secret not in open(path, 'rb').read()
+    assert os.stat(store.secret_path).st_mode & 0o077 == 0
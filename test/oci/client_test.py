@@ -1,4 +1,10 @@
 import base64
+import datetime
+import hashlib
+import unittest.mock
+
+import pytest
+import requests
 
 
 import oci.client as co
@@ -15,3 +21,160 @@ def test_append_b64_padding_if_missing():
     encode_and_decode(b'ab')
     encode_and_decode(b'abc')
     encode_and_decode(b'abcd')
+
+
+def test_mount_scope_and_token_query():
+    scope = co._mount_scope(
+        image_reference='example.org/tgt/img:1',
+        source_image_reference='example.org/src/img:1',
+    )
+
+    assert scope == 'repository:tgt/img:push,pull repository:src/img:pull'
+    assert co._token_query(scope=scope, service='svc') == \
+        'scope=repository%3Atgt%2Fimg%3Apush%2Cpull&scope=repository%3Asrc%2Fimg%3Apull&service=svc'
+
+    assert co._scope_privileges(scope=scope) is co.oa.Privileges.READWRITE
+    assert co._scope_privileges(scope='repository:pusher:pull') is co.oa.Privileges.READONLY
+
+
+def test_mount_blob_url():
+    routes = co.OciRoutes()
+
+    assert routes.mount_blob_url(
+        image_reference='example.org/tgt/img:1',
+        digest='sha256:abc',
+        source_image_reference='example.org/src/img:1',
+    ) == 'https://example.org/v2/tgt/img/blobs/uploads/?mount=sha256%3Aabc&from=src%2Fimg'
+
+
+def test_token_cache(tmp_path):
+    cache = co.OauthTokenCache(refresh_before_expiry_seconds=60)
+    image_reference = 'example.org/repo/img:1'
+    scope = 'repository:repo/img:pull'
+    credentials = co.oa.OciBasicAuthCredentials(
+        username='user',
+        password='pass',
+    )
+    credentials_id = cache.credentials_id(credentials)
+
+    token = co.OauthToken(token='abc', scope=scope, expires_in=300)
+    cache.set_token(image_reference=image_reference, token=token, credentials_id=credentials_id)
+
+    assert cache.token(image_reference, scope, credentials_id) is token
+    # tokens must not be shared between different credentials
+    assert cache.token(image_reference, scope) is None
+    assert cache.token('example.org/other/img:1', 'repository:other/img:pull') is None
+
+    # token is not yet due to be refreshed
+    assert not cache.refresh_due(image_reference, scope, credentials_id)
+
+    expiring_token = co.OauthToken(
+        token='def',
+        scope=scope,
+        expires_in=300,
+        issued_at=(
+            datetime.datetime.now(tz=datetime.timezone.utc) - datetime.timedelta(seconds=250)
+        ).isoformat(),
+    )
+    cache.set_token(image_reference=image_reference, token=expiring_token)
+    assert cache.refresh_due(image_reference, scope)
+    assert not cache.refresh_due(image_reference, scope) # refresh already in progress
+    cache.refresh_done(image_reference, scope)
+    assert cache.refresh_due(image_reference, scope)
+
+    # expired tokens are evicted
+    expired_token = co.OauthToken(
+        token='ghi',
+        scope='repository:repo/img:push',
+        expires_in=30,
+    )
+    cache._put(('example.org', expired_token.scope, None), expired_token) # set_token would reject
+    assert cache.token(image_reference, expired_token.scope) is None
+    assert ('example.org', expired_token.scope, None) not in cache.tokens
+
+    # tokens are shared through store
+    path = tmp_path / 'tokens.json'
+    cache = co.OauthTokenCache(store=co.oci.cache.FileTokenStore(path=path))
+    credentials_id = cache.credentials_id(credentials)
+    cache.set_token(image_reference=image_reference, token=token, credentials_id=credentials_id)
+
+    # secrets must not be persisted (not even hashed w/o key)
+    password_hash = hashlib.sha256(b'pass').hexdigest()
+    assert 'pass' not in credentials_id
+    assert password_hash not in path.read_text()
+
+    other_cache = co.OauthTokenCache(store=co.oci.cache.FileTokenStore(path=path))
+    shared_token = other_cache.token(image_reference, scope, credentials_id)
+    assert shared_token == token
+    assert other_cache.token(image_reference, scope, credentials_id) is shared_token
+
+
+def test_credentials_id(tmp_path):
+    def credentials(password: str):
+        return co.oa.OciBasicAuthCredentials(username='_json_key', password=password)
+
+    cache = co.OauthTokenCache()
+
+    # tokens must not be shared between credentials w/ same username
+    assert cache.credentials_id(credentials('a')) != cache.credentials_id(credentials('b'))
+    assert cache.credentials_id(credentials('a')) == cache.credentials_id(credentials('a'))
+    assert cache.credentials_id(None) is None
+
+    # ids of persisted tokens are derived using the store's secret, and thus stable across
+    # processes (but differ from ids of tokens which are not persisted)
+    path = tmp_path / 'tokens.json'
+    credentials_id = co.OauthTokenCache(
+        store=co.oci.cache.FileTokenStore(path=path),
+    ).credentials_id(credentials('a'))
+
+    assert credentials_id == co.OauthTokenCache(
+        store=co.oci.cache.FileTokenStore(path=path),
+    ).credentials_id(credentials('a'))
+    assert credentials_id != cache.credentials_id(credentials('a'))
+
+
+@pytest.mark.parametrize('status_code,expected_upload_mode', (
+    (405, co.BlobUploadMode.STREAMING_PUT),
+    (501, co.BlobUploadMode.STREAMING_PUT),
+    (401, None),
+    (429, None),
+    (503, None),
+))
+def test_blob_upload_mode_detection(status_code, expected_upload_mode):
+    client = co.Client(credentials_lookup=unittest.mock.Mock())
+    image_reference = co.om.OciImageReference('example.org/img:1')
+    methods = []
+
+    def request(url, method='GET', raise_for_status=True, **kwargs):
+        methods.append(method)
+
+        res = requests.Response()
+        res.url = url
+        res.headers['Location'] = '/v2/img/blobs/uploads/session'
+        res.status_code = status_code if method == 'PATCH' else 202
+        if raise_for_status:
+            res.raise_for_status()
+        return res
+
+    client._request = request
+
+    def upload():
+        return client._put_blob_streaming(
+            image_reference=image_reference,
+            digest='sha256:abc',
+            octets_count=4,
+            data_iterator=iter((b'abcd',)),
+            chunk_size=2,
+            mimetype='application/octet-stream',
+        )
+
+    if expected_upload_mode:
+        upload()
+        assert methods == ['POST', 'PATCH', 'DELETE', 'POST', 'PUT']
+    else:
+        # transient errors, or missing permissions must not change upload-mode
+        with pytest.raises(requests.exceptions.HTTPError):
+            upload()
+        assert methods == ['POST', 'PATCH', 'DELETE']
+
+    assert client.blob_upload_modes.get(image_reference.netloc) is expected_upload_mode
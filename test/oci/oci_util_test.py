@@ -13,3 +13,26 @@ def test_normalise_image_reference():
     # insert 'library' if no "owner" is given
     reference = 'alpine:1.2.3'
     assert ou.normalise_image_reference(reference) == 'registry-1.docker.io/library/' + reference
+
+
+def test_rechunk():
+    chunks = [b'ab', b'cde', b'', b'fghij', b'k']
+
+    assert list(ou.rechunk(chunks, chunk_size=3)) == [b'abc', b'def', b'ghi', b'jk']
+    assert list(ou.rechunk(chunks, chunk_size=11)) == [b'abcdefghijk']
+    assert list(ou.rechunk([], chunk_size=3)) == []
+
+
+def test_iterable_reader():
+    reader = ou.IterableReader(
+        chunks=[b'ab', b'cde', b'fghij', b'k'],
+        octets_count=11,
+    )
+
+    assert len(reader) == 11
+    assert reader.read(4) == b'abcd'
+    assert reader.tell() == 4
+    assert reader.read(1) == b'e'
+    assert reader.read() == b'fghijk'
+    assert reader.read(3) == b''
+    assert reader.tell() == 11
@@ -0,0 +1,112 @@
+import concurrent.futures
+import json
+import threading
+import time
+import unittest.mock
+
+import oci
+import oci.model as om
+import oci.transfer as ot
+
+
+def test_blob_transfer_pool_registry_limits():
+    running = {'count': 0, 'max': 0}
+    lock = threading.Lock()
+
+    def transfer():
+        with lock:
+            running['count'] += 1
+            running['max'] = max(running['max'], running['count'])
+        time.sleep(0.02)
+        with lock:
+            running['count'] -= 1
+        return 42
+
+    with ot.BlobTransferPool(
+        max_workers=8,
+        max_workers_per_registry=2,
+    ) as pool:
+        futures = [
+            pool.submit(
+                transfer,
+                src_image_reference='src.example.org/foo:1',
+                tgt_image_reference='tgt.example.org/foo:1',
+            ) for _ in range(8)
+        ]
+        assert [f.result() for f in futures] == [42] * 8
+
+    assert running['max'] <= 2
+
+
+def test_octets_budget():
+    budget = ot._OctetsBudget(max_octets=10)
+
+    assert budget.acquire(6) == 6
+    assert budget.octets_in_flight == 6
+
+    acquired = threading.Event()
+
+    def acquire():
+        budget.acquire(6)
+        acquired.set()
+
+    threading.Thread(target=acquire).start()
+    assert not acquired.wait(timeout=0.05)
+
+    budget.release(6)
+    assert acquired.wait(timeout=1)
+
+    budget.release(6)
+    # oversized requests must be admitted if nothing else is in-flight
+    assert budget.acquire(100) == 100
+
+
+def test_limits_apply_across_concurrent_replications(monkeypatch):
+    monkeypatch.setattr(ot, '_default_blob_transfer_pool', ot.BlobTransferPool(
+        max_workers=16,
+        max_workers_per_registry=2,
+        max_octets_in_flight=15,
+    ))
+    in_flight = {'count': 0, 'octets': 0, 'max_count': 0, 'max_octets': 0}
+    lock = threading.Lock()
+
+    manifest = {
+        'schemaVersion': 2,
+        'mediaType': om.OCI_MANIFEST_SCHEMA_V2_MIME,
+        'config': {'digest': 'sha256:cfg', 'mediaType': 'application/json', 'size': 5},
+        'layers': [
+            {'digest': f'sha256:layer-{idx}', 'mediaType': 'application/tar', 'size': 5}
+            for idx in range(3)
+        ],
+    }
+
+    def put_blob(octets_count, **kwargs):
+        with lock:
+            in_flight['count'] += 1
+            in_flight['octets'] += octets_count
+            in_flight['max_count'] = max(in_flight['max_count'], in_flight['count'])
+            in_flight['max_octets'] = max(in_flight['max_octets'], in_flight['octets'])
+        time.sleep(0.01)
+        with lock:
+            in_flight['count'] -= 1
+            in_flight['octets'] -= octets_count
+
+    oci_client = unittest.mock.Mock()
+    oci_client.manifest_raw.return_value = unittest.mock.Mock(text=json.dumps(manifest))
+    oci_client.head_blob.return_value = unittest.mock.Mock(ok=False)
+    oci_client.mount_blob.return_value = False
+    oci_client.put_blob.side_effect = put_blob
+
+    def replicate(idx: int):
+        return oci.replicate_artifact(
+            src_image_reference=f'src.example.org/image-{idx}:1.0',
+            tgt_image_reference=f'tgt.example.org/image-{idx}:1.0',
+            oci_client=oci_client,
+        )
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        tuple(executor.map(replicate, range(4)))
+
+    assert oci_client.put_blob.call_count == 16
+    assert in_flight['max_count'] <= 2
+    assert in_flight['max_octets'] <= 15
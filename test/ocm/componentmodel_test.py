@@ -4,6 +4,7 @@ import typing
 import unittest
 
 import jsonschema.exceptions
+import pytest
 import yaml
 
 import ocm
@@ -74,6 +75,65 @@ def test_component():
     assert component.current_ocm_repo.baseUrl == 'current-ctx-url'
 
 
+def test_resource_identities():
+    def resource(name, version, **extra_identity):
+        return ocm.Resource(
+            name=name,
+            version=version,
+            type=ocm.ArtefactType.OCI_IMAGE,
+            access=None,
+            extraIdentity=extra_identity,
+        )
+
+    resources = [
+        resource('a', '1.0.0'),
+        resource('a', '2.0.0'),
+        resource('b', '1.0.0'),
+        resource('c', '1.0.0', platform='linux'),
+        resource('c', '1.0.0', platform='darwin'),
+    ]
+    component = ocm.Component(
+        name='component-name',
+        version='1.2.3',
+        repositoryContexts=[],
+        provider=None,
+        sources=(),
+        componentReferences=(),
+        resources=resources,
+        labels=(),
+    )
+
+    index = component.resource_identities()
+    assert component.resource_identities() is index
+
+    for r in resources:
+        assert index.identity(r) == r.identity(resources)
+    assert [identity for identity, _ in index] == [r.identity(resources) for r in resources]
+
+    # artefacts which are not peers (e.g. modified copies)
+    copies = [dataclasses.replace(r) for r in resources]
+    for r, copy in zip(resources, copies):
+        assert index.identity(copy) == copy.identity(resources)
+        assert index.identity(r, as_peer=False) == r.identity(copies)
+
+    assert index.identity(resource('b', '1.0.0')) == ocm.ArtifactIdentity(
+        name='b',
+        version='1.0.0',
+    )
+    assert index.identity(resource('d', '1.0.0')) == ocm.ResourceIdentity(name='d')
+
+    # index must be rebuilt if resources are replaced
+    component.resources = resources[2:]
+    assert (index := component.resource_identities()).is_current(component.resources)
+    assert index.identity(resources[2]) == ocm.ResourceIdentity(name='b')
+
+    with pytest.raises(ValueError):
+        ocm.ArtifactIdentityIndex(peers=[
+            resources[0],
+            ocm.Source(name='a', access={'type': 'x'}),
+        ])
+
+
 class TestVersionValidation(unittest.TestCase):
 
     def _create_test_component_dict(
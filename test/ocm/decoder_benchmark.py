@@ -0,0 +1,53 @@
+'''
+micro-benchmark comparing `dacite.from_dict` and `ocm.decoder` for decoding component-descriptors
+
+not collected by pytest; run from repository-root:
+
+    PYTHONPATH=. python test/ocm/decoder_benchmark.py [iterations]
+'''
+
+import os
+import sys
+import timeit
+
+import dacite
+import yaml
+
+import ocm
+
+own_dir = os.path.dirname(__file__)
+
+
+def main(iterations: int=2000):
+    with open(os.path.join(own_dir, 'component_descriptor_v2.yaml')) as f:
+        raw = yaml.safe_load(f)
+
+    dacite_config = ocm._component_descriptor_dacite_config()
+    decoder = ocm._component_descriptor_decoder()
+
+    def decode_w_dacite():
+        dacite.from_dict(
+            data_class=ocm.ComponentDescriptor,
+            data=raw,
+            config=dacite_config,
+        )
+
+    def decode_w_decoder():
+        decoder.decode(
+            data_class=ocm.ComponentDescriptor,
+            data=raw,
+        )
+
+    decode_w_decoder() # compile decoders outside of measurement
+
+    dacite_seconds = min(timeit.repeat(decode_w_dacite, number=iterations, repeat=3))
+    decoder_seconds = min(timeit.repeat(decode_w_decoder, number=iterations, repeat=3))
+
+    print(f'{iterations=}')
+    print(f'dacite:  {dacite_seconds / iterations * 1e6:8.1f} us/descriptor')
+    print(f'decoder: {decoder_seconds / iterations * 1e6:8.1f} us/descriptor')
+    print(f'speedup: {dacite_seconds / decoder_seconds:8.1f}x')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:2]))
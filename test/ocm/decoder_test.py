@@ -0,0 +1,123 @@
+import dataclasses
+import os
+import typing
+
+import dacite
+import pytest
+import yaml
+
+import ocm
+import ocm.decoder
+import ocm.gardener
+
+own_dir = os.path.dirname(__file__)
+
+
+def dacite_decode(data_class, data):
+    return dacite.from_dict(
+        data_class=data_class,
+        data=data,
+        config=ocm._component_descriptor_dacite_config(),
+    )
+
+
+def decode(data_class, data):
+    return ocm._component_descriptor_decoder().decode(
+        data_class=data_class,
+        data=data,
+    )
+
+
+@pytest.mark.parametrize('filename', (
+    'component_descriptor_v2.yaml',
+    'component_descriptor_v2_custom.yaml',
+))
+def test_equivalence_to_dacite(filename):
+    with open(os.path.join(own_dir, filename)) as f:
+        raw = yaml.safe_load(f)
+
+    expected = dacite_decode(ocm.ComponentDescriptor, raw)
+    decoded = decode(ocm.ComponentDescriptor, raw)
+
+    assert decoded == expected
+    assert dataclasses.asdict(decoded) == dataclasses.asdict(expected)
+
+    for decoded_resource, expected_resource in zip(
+        decoded.component.resources,
+        expected.component.resources,
+    ):
+        assert type(decoded_resource.type) is type(expected_resource.type)
+        assert type(decoded_resource.access) is type(expected_resource.access)
+
+    # decoding must be repeatable (decoders are compiled upon first usage)
+    assert decode(ocm.ComponentDescriptor, raw) == expected
+
+
+def test_errors_equivalent_to_dacite():
+    with open(os.path.join(own_dir, 'component_descriptor_v2.yaml')) as f:
+        raw = yaml.safe_load(f)
+
+    def errors(raw):
+        with pytest.raises(dacite.DaciteError) as expected:
+            dacite_decode(ocm.ComponentDescriptor, raw)
+        with pytest.raises(dacite.DaciteError) as actual:
+            decode(ocm.ComponentDescriptor, raw)
+
+        return actual.value, expected.value
+
+    missing_name = yaml.safe_load(yaml.safe_dump(raw))
+    del missing_name['component']['name']
+    actual, expected = errors(missing_name)
+    assert type(actual) is type(expected) is dacite.MissingValueError
+    assert str(actual) == str(expected)
+
+    wrong_type = yaml.safe_load(yaml.safe_dump(raw))
+    wrong_type['component']['resources'][0]['name'] = 42
+    actual, expected = errors(wrong_type)
+    assert type(actual) is type(expected) is dacite.WrongTypeError
+    assert str(actual) == str(expected)
+
+
+def test_default_decoder():
+    raw = {
+        'component_reference': {
+            'name': 'acme.org/component',
+            'version': '1.2.3',
+        },
+        'purpose': ['test'],
+    }
+
+    extra_cref = ocm.decoder.default_decoder.decode(
+        data_class=ocm.gardener.ExtraComponentReference,
+        data=raw,
+    )
+
+    assert extra_cref == dacite.from_dict(
+        data_class=ocm.gardener.ExtraComponentReference,
+        data=raw,
+    )
+
+
+@dataclasses.dataclass
+class Node:
+    name: str
+    children: list['Node'] = dataclasses.field(default_factory=list)
+    value: int | str | None = None
+    extra: dict[str, typing.Any] | None = None
+
+
+def test_recursive_types_and_unions():
+    decoder = ocm.decoder.DataclassDecoder()
+    raw = {
+        'name': 'root',
+        'value': 'v',
+        'children': [
+            {'name': 'a', 'value': 1, 'children': [{'name': 'a.a'}]},
+            {'name': 'b', 'extra': {'k': [1, 2]}},
+        ],
+    }
+
+    assert decoder.decode(Node, raw) == dacite.from_dict(Node, raw)
+
+    with pytest.raises(dacite.UnionMatchError):
+        decoder.decode(Node, {'name': 'x', 'value': 1.5})
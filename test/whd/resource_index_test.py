@@ -0,0 +1,91 @@
+import concourse.client.model
+import concourse.client.routes
+
+import whd.resource_index
+
+ResourceType = concourse.client.model.ResourceType
+
+
+class ConcourseApiStub:
+    def __init__(self, pipelines: dict[str, dict]):
+        self.routes = concourse.client.routes.ConcourseApiRoutesBase(
+            base_url='https://concourse.example.org',
+            team='some-team',
+        )
+        self.pipelines = pipelines # {name: raw pipeline-config}
+        self.last_updated = {name: 1 for name in pipelines}
+        self.retrieved_pipeline_cfgs = []
+
+    def list_pipelines(self):
+        return [
+            concourse.client.model.Pipeline({'name': name, 'last_updated': self.last_updated[name]})
+            for name in self.pipelines
+        ]
+
+    def pipeline_cfg(self, pipeline_name: str):
+        self.retrieved_pipeline_cfgs.append(pipeline_name)
+        return concourse.client.model.PipelineConfig(
+            {'config': self.pipelines[pipeline_name]},
+            concourse_api=self,
+            name=pipeline_name,
+        )
+
+
+def pipeline(*repository_paths: str):
+    return {
+        'resources': [
+            {
+                'name': repository_path,
+                'type': 'git',
+                'source': {
+                    'uri': f'https://github.example.org/{repository_path}',
+                    'branch': 'master',
+                },
+            } for repository_path in repository_paths
+        ] + [
+            {
+                'name': 'every-day',
+                'type': 'time',
+                'source': {},
+            },
+        ],
+    }
+
+
+def test_resource_index():
+    concourse_api = ConcourseApiStub(pipelines={
+        'p1': pipeline('org/repo1', 'org/repo2'),
+        'p2': pipeline('org/repo2'),
+    })
+    index = whd.resource_index.ConcourseResourceIndex()
+
+    def resources(repository_path: str):
+        return index.resources(
+            concourse_api=concourse_api,
+            resource_type=ResourceType.GIT,
+            hostname='github.example.org',
+            repository_path=repository_path,
+        )
+
+    assert not index.is_indexed(concourse_api)
+    assert resources('org/repo1') is None
+
+    index.refresh(concourse_api)
+
+    assert [r.pipeline_name() for r in resources('org/repo1')] == ['p1']
+    assert sorted(r.pipeline_name() for r in resources('org/repo2')) == ['p1', 'p2']
+    assert resources('org/absent') == []
+
+    # unmodified pipelines must not be retrieved again
+    concourse_api.retrieved_pipeline_cfgs.clear()
+    concourse_api.pipelines['p2'] = pipeline('org/repo3')
+    concourse_api.last_updated['p2'] = 2
+    concourse_api.pipelines['p3'] = pipeline('org/repo3')
+    concourse_api.last_updated['p3'] = 1
+    del concourse_api.pipelines['p1']
+
+    index.refresh(concourse_api)
+
+    assert sorted(concourse_api.retrieved_pipeline_cfgs) == ['p2', 'p3']
+    assert resources('org/repo1') == []
+    assert sorted(r.pipeline_name() for r in resources('org/repo3')) == ['p2', 'p3']
@@ -0,0 +1,94 @@
+import threading
+
+import pytest
+
+import whd.work_queue as wq
+
+
+def blocked_queue(**kwargs) -> tuple[wq.WorkQueue, threading.Event]:
+    '''
+    returns a work-queue w/ a single worker, which is blocked until returned event is set
+    '''
+    queue = wq.WorkQueue(worker_count=1, **kwargs)
+    started = threading.Event()
+    unblock = threading.Event()
+
+    def block():
+        started.set()
+        unblock.wait()
+
+    queue.submit(block)
+    assert started.wait(timeout=1)
+
+    return queue, unblock
+
+
+def test_priorities_and_coalescing():
+    queue, unblock = blocked_queue()
+    processed = []
+
+    def process(value):
+        processed.append(value)
+
+    queue.submit(process, priority=wq.Priority.LOW, value='low')
+    queue.submit(process, priority=wq.Priority.NORMAL, key='k', value='first')
+    queue.submit(process, priority=wq.Priority.NORMAL, key='k', value='second')
+    queue.submit(
+        process,
+        priority=wq.Priority.HIGH,
+        key='merged',
+        merge=lambda pending, new: {'value': pending['value'] + new['value']},
+        value='a',
+    )
+    queue.submit(
+        process,
+        priority=wq.Priority.HIGH,
+        key='merged',
+        merge=lambda pending, new: {'value': pending['value'] + new['value']},
+        value='b',
+    )
+
+    metrics = queue.metrics()
+    assert metrics['queue_depth'] == 3
+    assert metrics['coalesced'] == 2
+    assert metrics['queue_depth_by_priority'] == {'high': 1, 'normal': 1, 'low': 1}
+
+    unblock.set()
+    assert queue.join(timeout=1)
+
+    assert processed == ['ab', 'second', 'low']
+    assert queue.metrics()['processed'] == 4
+
+
+def test_backpressure():
+    queue, unblock = blocked_queue(
+        max_size=1,
+        backpressure_policy=wq.BackpressurePolicy.REJECT,
+    )
+    queue.submit(lambda: None)
+
+    with pytest.raises(wq.QueueFullError):
+        queue.submit(lambda: None)
+    assert queue.metrics()['rejected'] == 1
+    unblock.set()
+
+    processed = []
+
+    def process(value):
+        processed.append(value)
+
+    queue, unblock = blocked_queue(
+        max_size=1,
+        backpressure_policy=wq.BackpressurePolicy.DROP_OLDEST,
+    )
+    queue.submit(process, priority=wq.Priority.LOW, value='dropped')
+    queue.submit(process, priority=wq.Priority.NORMAL, value='kept')
+
+    # pending items of higher priority must not be dropped
+    with pytest.raises(wq.QueueFullError):
+        queue.submit(process, priority=wq.Priority.LOW, value='rejected')
+
+    unblock.set()
+    assert queue.join(timeout=1)
+    assert processed == ['kept']
+    assert queue.metrics()['dropped'] == 1
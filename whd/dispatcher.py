@@ -4,7 +4,6 @@
 
 
 import logging
-import threading
 import typing
 
 import requests
@@ -20,7 +19,9 @@ import concourse.replicator
 import model
 import whd.model
 import whd.pull_request
+import whd.resource_index
 import whd.util
+import whd.work_queue
 
 from github3.exceptions import NotFoundError
 
@@ -59,6 +60,20 @@ class GithubWebhookDispatcher:
         self.cfg_factory: model.ConfigFactory = cfg_factory
         self.cfg_set = cfg_set
         self.whd_cfg = whd_cfg
+        self.resource_index = whd.resource_index.ConcourseResourceIndex()
+        self.work_queue = whd.work_queue.WorkQueue(
+            worker_count=whd_cfg.worker_count(),
+            max_size=whd_cfg.queue_max_size(),
+            backpressure_policy=whd_cfg.queue_backpressure_policy(),
+            block_timeout_seconds=whd_cfg.queue_block_timeout_seconds(),
+        )
+
+        if (refresh_interval := whd_cfg.resource_index_refresh_interval_seconds()):
+            self.resource_index.start_refreshing(
+                concourse_clients=self.concourse_clients,
+                interval_seconds=refresh_interval,
+            )
+
         logger.info(f'github-whd initialised for cfg-set: {cfg_set.name()}')
 
     def concourse_clients(
@@ -82,20 +97,22 @@ class GithubWebhookDispatcher:
             logger.info(f'ignored create event with type {ref_type}')
             return
 
-        thread = threading.Thread(
-            target=self._update_pipeline_definition,
-            kwargs={
-                'event': create_event,
-            }
+        self.work_queue.submit(
+            self._update_pipeline_definition,
+            priority=whd.work_queue.Priority.LOW,
+            key=('create', create_event.repository().repository_url(), create_event.ref()),
+            event=create_event,
         )
-        thread.start()
 
     def dispatch_push_event(
         self,
         push_event,
     ):
-        def process_push_event(event):
-            if self._pipeline_definition_changed(event):
+        def process_push_event(
+            event,
+            pipeline_definition_changed: bool,
+        ):
+            if pipeline_definition_changed:
                 try:
                     self._update_pipeline_definition(event=event)
                 except ValueError as e:
@@ -115,13 +132,25 @@ class GithubWebhookDispatcher:
                 logger.debug('triggering resource-check')
                 whd.util.trigger_resource_check(concourse_api=concourse_api, resources=resources)
 
-        thread = threading.Thread(
-            target=process_push_event,
-            kwargs={
-                'event': push_event,
+        def merge(pending_kwargs: dict, kwargs: dict) -> dict:
+            # only process latest push, but do not miss changes to pipeline-definitions of
+            # coalesced pushes
+            return {
+                'event': kwargs['event'],
+                'pipeline_definition_changed': (
+                    pending_kwargs['pipeline_definition_changed']
+                    or kwargs['pipeline_definition_changed']
+                ),
             }
+
+        self.work_queue.submit(
+            process_push_event,
+            priority=whd.work_queue.Priority.HIGH,
+            key=('push', push_event.repository().repository_url(), push_event.ref()),
+            merge=merge,
+            event=push_event,
+            pipeline_definition_changed=self._pipeline_definition_changed(push_event),
         )
-        thread.start()
 
     def _update_pipeline_definition(
         self,
@@ -153,6 +182,15 @@ class GithubWebhookDispatcher:
             # retry
             _do_update()
 
+        # pick-up modified pipelines (and thus resources) early
+        for concourse_api in self.concourse_clients():
+            if not self.resource_index.is_indexed(concourse_api):
+                continue
+            try:
+                self.resource_index.refresh(concourse_api=concourse_api)
+            except Exception as e:
+                logger.warning(f'failed to refresh resource-index for {concourse_api}: {e}')
+
     def _pipeline_definition_changed(self, push_event):
         if '.ci/pipeline_definitions' in push_event.modified_paths():
             return True
@@ -282,17 +320,22 @@ class GithubWebhookDispatcher:
             logger.info(f'ignoring pull-request action {pr_event.action()}')
             return False
 
-        thread = threading.Thread(
-            target=whd.pull_request.process_pr_event,
-            kwargs={
-                'concourse_clients': self.concourse_clients(),
-                'cfg_factory': self.cfg_factory,
-                'whd_cfg': self.whd_cfg,
-                'cfg_set': self.cfg_set,
-                'pr_event': pr_event,
-            }
+        self.work_queue.submit(
+            whd.pull_request.process_pr_event,
+            priority=whd.work_queue.Priority.NORMAL,
+            key=(
+                'pull_request',
+                pr_event.repository().repository_url(),
+                pr_event.number(),
+                pr_event.action(),
+            ),
+            concourse_clients=self.concourse_clients(),
+            cfg_factory=self.cfg_factory,
+            whd_cfg=self.whd_cfg,
+            cfg_set=self.cfg_set,
+            pr_event=pr_event,
+            resource_index=self.resource_index,
         )
-        thread.start()
 
         return True
 
@@ -308,16 +351,24 @@ class GithubWebhookDispatcher:
         else:
             raise NotImplementedError
 
-        resources_gen = concourse_api.pipeline_resources(
-            concourse_api.pipelines(),
+        repository = event.repository()
+
+        if (resources_gen := self.resource_index.resources(
+            concourse_api=concourse_api,
             resource_type=resource_type,
-        )
+            hostname=repository.github_host(),
+            repository_path=repository.repository_path(),
+        )) is None:
+            # index not (yet) populated for concourse-team -> fallback to retrieving all resources
+            resources_gen = concourse_api.pipeline_resources(
+                concourse_api.pipelines(),
+                resource_type=resource_type,
+            )
 
         for resource in resources_gen:
             resource: concourse.client.model.PipelineConfigResource
 
             ghs = resource.github_source()
-            repository = event.repository()
             if not ghs.hostname() == repository.github_host():
                 continue
             if not ghs.repo_path().lstrip('/') == repository.repository_path():
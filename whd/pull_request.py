@@ -35,6 +35,7 @@ from .model import (
     PullRequestAction,
     PullRequestEvent,
 )
+import whd.resource_index
 import whd.util
 
 
@@ -48,6 +49,7 @@ def process_pr_event(
     cfg_set: model.ConfigurationSet,
     whd_cfg: model.webhook_dispatcher.WebhookDispatcherConfig,
     pr_event: PullRequestEvent,
+    resource_index: whd.resource_index.ConcourseResourceIndex | None=None,
 ):
     if not (github_helper := github_api_for_pr_event(pr_event, cfg_set)):
         logger.error(
@@ -75,6 +77,7 @@ def process_pr_event(
             matching_resources(
                 concourse_api=concourse_api,
                 event=pr_event,
+                resource_index=resource_index,
             )
         )
 
@@ -138,18 +141,25 @@ def process_pr_event(
 def matching_resources(
     concourse_api: concourse.client.api.ConcourseApiBase,
     event: PullRequestEvent,
+    resource_index: whd.resource_index.ConcourseResourceIndex | None=None,
 ) -> typing.Generator[concourse.client.model.PipelineConfigResource, None, None]:
+    repository = event.repository()
 
-    resources_gen = concourse_api.pipeline_resources(
-        concourse_api.pipelines(),
+    if not resource_index or (resources_gen := resource_index.resources(
+        concourse_api=concourse_api,
         resource_type=ResourceType.PULL_REQUEST,
-    )
+        hostname=repository.github_host(),
+        repository_path=repository.repository_path(),
+    )) is None:
+        resources_gen = concourse_api.pipeline_resources(
+            concourse_api.pipelines(),
+            resource_type=ResourceType.PULL_REQUEST,
+        )
 
     for resource in resources_gen:
         resource: concourse.client.model.PipelineConfigResource
 
         ghs = resource.github_source()
-        repository = event.repository()
         if not ghs.hostname() == repository.github_host():
             continue
         if not ghs.repo_path().lstrip('/') == repository.repository_path():
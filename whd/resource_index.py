@@ -0,0 +1,203 @@
+# SPDX-FileCopyrightText: 2024 SAP SE or an SAP affiliate company and Gardener contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+'''
+in-memory reverse-index from github-repositories to concourse-resources (of type git or
+pull-request) referencing them
+
+Determining the resources affected by a github-event would otherwise require retrieving the
+configuration of each pipeline of each concourse-team (for each event).
+'''
+
+import collections.abc
+import dataclasses
+import logging
+import threading
+import time
+import typing
+
+import requests
+
+import concourse.client.api
+import concourse.client.model
+
+from concourse.client.model import ResourceType
+
+
+logger = logging.getLogger(__name__)
+
+indexed_resource_types = (ResourceType.GIT, ResourceType.PULL_REQUEST)
+
+TeamKey = tuple[str, str] # (concourse-base-url, team-name)
+ResourceKey = tuple[ResourceType, str, str] # (resource-type, github-hostname, repository-path)
+
+
+def _team_key(
+    concourse_api: concourse.client.api.ConcourseApiBase,
+) -> TeamKey:
+    return concourse_api.routes.base_url, concourse_api.routes.team
+
+
+def _resource_key(
+    resource: concourse.client.model.PipelineConfigResource,
+) -> ResourceKey | None:
+    try:
+        resource_type = ResourceType(resource.type)
+    except ValueError:
+        return None
+
+    if resource_type not in indexed_resource_types:
+        return None
+
+    github_source = resource.github_source()
+    return resource_type, github_source.hostname(), github_source.repo_path().lstrip('/')
+
+
+@dataclasses.dataclass
+class _IndexedPipeline:
+    last_updated: int | None
+    resources: list[concourse.client.model.PipelineConfigResource]
+
+
+class ConcourseResourceIndex:
+    def __init__(self):
+        '''
+        maps (resource-type, github-hostname, repository-path) to concourse-resources, per
+        concourse-team.
+
+        The index for a concourse-team is populated upon first `refresh`. Subsequent refreshes
+        are incremental: only configurations of pipelines that were added or modified since the
+        last refresh are retrieved (modifications are detected using the pipelines'
+        `last_updated` timestamp; if concourse does not report it, all pipelines are retrieved).
+        '''
+        self._lock = threading.Lock()
+        self._pipelines: dict[TeamKey, dict[str, _IndexedPipeline]] = {}
+        self._resources: dict[TeamKey, dict[ResourceKey, list]] = {}
+
+    def is_indexed(
+        self,
+        concourse_api: concourse.client.api.ConcourseApiBase,
+    ) -> bool:
+        with self._lock:
+            return _team_key(concourse_api) in self._resources
+
+    def resources(
+        self,
+        concourse_api: concourse.client.api.ConcourseApiBase,
+        resource_type: ResourceType,
+        hostname: str,
+        repository_path: str,
+    ) -> list[concourse.client.model.PipelineConfigResource] | None:
+        '''
+        returns the resources of the given type referencing the given github-repository, or
+        None if the given concourse-team was not indexed yet
+        '''
+        with self._lock:
+            if (team_resources := self._resources.get(_team_key(concourse_api))) is None:
+                return None
+
+            return list(team_resources.get(
+                (resource_type, hostname, repository_path.lstrip('/')),
+                (),
+            ))
+
+    def _retrieve_pipeline(
+        self,
+        concourse_api: concourse.client.api.ConcourseApiBase,
+        pipeline: concourse.client.model.Pipeline,
+    ) -> _IndexedPipeline | None:
+        try:
+            pipeline_cfg = concourse_api.pipeline_cfg(pipeline.name())
+        except requests.exceptions.HTTPError as e:
+            if e.response.status_code != 404:
+                raise
+            return None # pipeline was removed concurrently
+        except ValueError:
+            # raised if pipeline does not contain any resources
+            return _IndexedPipeline(last_updated=pipeline.last_updated(), resources=[])
+
+        return _IndexedPipeline(
+            last_updated=pipeline.last_updated(),
+            resources=[
+                resource for resource in pipeline_cfg.resources
+                if _resource_key(resource)
+            ],
+        )
+
+    def refresh(
+        self,
+        concourse_api: concourse.client.api.ConcourseApiBase,
+        pipeline_names: collections.abc.Iterable[str]=(),
+    ):
+        '''
+        (incrementally) updates the index for the given concourse-team
+
+        @param pipeline_names: pipelines to retrieve in any case (e.g. known to be modified)
+        '''
+        team_key = _team_key(concourse_api)
+        pipeline_names = set(pipeline_names)
+
+        with self._lock:
+            indexed_pipelines = dict(self._pipelines.get(team_key, {}))
+
+        pipelines = {}
+        for pipeline in concourse_api.list_pipelines():
+            name = pipeline.name()
+            if (
+                (indexed_pipeline := indexed_pipelines.get(name))
+                and name not in pipeline_names
+                and indexed_pipeline.last_updated is not None
+                and indexed_pipeline.last_updated == pipeline.last_updated()
+            ):
+                pipelines[name] = indexed_pipeline
+                continue
+
+            if (indexed_pipeline := self._retrieve_pipeline(
+                concourse_api=concourse_api,
+                pipeline=pipeline,
+            )):
+                pipelines[name] = indexed_pipeline
+
+        team_resources = {}
+        for indexed_pipeline in pipelines.values():
+            for resource in indexed_pipeline.resources:
+                team_resources.setdefault(_resource_key(resource), []).append(resource)
+
+        with self._lock:
+            self._pipelines[team_key] = pipelines
+            self._resources[team_key] = team_resources
+
+        logger.debug(f'indexed {len(pipelines)} pipeline(s) for {team_key=}')
+
+    def start_refreshing(
+        self,
+        concourse_clients: typing.Callable[
+            [],
+            collections.abc.Iterable[concourse.client.api.ConcourseApiBase],
+        ],
+        interval_seconds: int,
+    ) -> threading.Thread:
+        '''
+        starts a daemon-thread, (incrementally) refreshing the index for all concourse-teams
+        returned by `concourse_clients`, w/ the given interval (first refresh will populate the
+        index).
+        '''
+        def refresh_periodically():
+            while True:
+                for concourse_api in concourse_clients():
+                    try:
+                        self.refresh(concourse_api=concourse_api)
+                    except Exception as e:
+                        logger.warning(f'failed to refresh resource-index for {concourse_api}: {e}')
+
+                time.sleep(interval_seconds)
+
+        thread = threading.Thread(
+            target=refresh_periodically,
+            name='whd-resource-index',
+            daemon=True,
+        )
+        thread.start()
+
+        return thread
@@ -7,7 +7,10 @@ import traceback
 
 import falcon # pylint: disable=E0401
 
-from .webhook import GithubWebhook
+from .webhook import (
+    GithubWebhook,
+    WorkQueueMetrics,
+)
 from model.webhook_dispatcher import WebhookDispatcherConfig
 
 
@@ -29,13 +32,13 @@ def webhook_dispatcher_app(
         middleware=[],
     )
 
-    app.add_route('/github-webhook',
-        GithubWebhook(
-            cfg_factory=cfg_factory,
-            whd_cfg=whd_cfg,
-            cfg_set=cfg_set,
-        ),
+    github_webhook = GithubWebhook(
+        cfg_factory=cfg_factory,
+        whd_cfg=whd_cfg,
+        cfg_set=cfg_set,
     )
+    app.add_route('/github-webhook', github_webhook)
+    app.add_route('/metrics/queue', WorkQueueMetrics(dispatcher=github_webhook.dispatcher))
     app.add_error_handler(
         exception=Exception,
         handler=handle_exception,
@@ -5,6 +5,9 @@
 
 import logging
 
+import falcon # pylint: disable=E0401
+
+import whd.work_queue
 from model.webhook_dispatcher import WebhookDispatcherConfig
 from .dispatcher import GithubWebhookDispatcher
 from .model import CreateEvent, PushEvent, PullRequestEvent
@@ -27,6 +30,13 @@ class GithubWebhook:
         )
 
     def on_post(self, req, resp):
+        try:
+            self._on_post(req=req, resp=resp)
+        except whd.work_queue.QueueFullError as e:
+            logger.warning(f'rejected event: {e}')
+            raise falcon.HTTPServiceUnavailable(description='too many pending events') # noqa
+
+    def _on_post(self, req, resp):
         event = req.get_header('X-GitHub-Event', required=True)
         delivery = req.get_header('X-GitHub-Delivery', required=True)
         logger_string = f'received event (delivery-id: {delivery}) of type "{event}"'
@@ -64,3 +74,14 @@ class GithubWebhook:
             msg = f'event {event} ignored'
             logger.info(msg)
             return
+
+
+class WorkQueueMetrics:
+    def __init__(
+        self,
+        dispatcher: GithubWebhookDispatcher,
+    ):
+        self.dispatcher = dispatcher
+
+    def on_get(self, req, resp):
+        resp.media = self.dispatcher.work_queue.metrics()
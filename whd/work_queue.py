@@ -0,0 +1,266 @@
+# SPDX-FileCopyrightText: 2024 SAP SE or an SAP affiliate company and Gardener contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+'''
+bounded, prioritised work-queue processed by a fixed amount of worker-threads
+
+Used by the webhook-dispatcher to process github-events, so that bursts of events (e.g. many
+pushes in a short period of time) neither result in an unbounded amount of threads, nor in
+redundant processing (pending work-items w/ same key are coalesced).
+'''
+
+import collections
+import collections.abc
+import dataclasses
+import enum
+import heapq
+import itertools
+import logging
+import statistics
+import threading
+import time
+
+
+logger = logging.getLogger(__name__)
+
+
+class Priority(enum.IntEnum):
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+class BackpressurePolicy(enum.StrEnum):
+    BLOCK = 'block' # block submitter (up to timeout), then reject
+    REJECT = 'reject' # reject new work-items
+    DROP_OLDEST = 'drop_oldest' # drop oldest pending work-item of lowest priority
+
+
+class QueueFullError(RuntimeError):
+    pass
+
+
+@dataclasses.dataclass
+class _WorkItem:
+    func: collections.abc.Callable
+    kwargs: dict
+    priority: Priority
+    key: collections.abc.Hashable | None
+    enqueued: float
+    done: bool = False # set once work-item was started or dropped
+
+
+class WorkQueue:
+    def __init__(
+        self,
+        worker_count: int=8,
+        max_size: int=256,
+        backpressure_policy: BackpressurePolicy=BackpressurePolicy.BLOCK,
+        block_timeout_seconds: float=10,
+        name: str='whd-worker',
+    ):
+        '''
+        :param int worker_count: amount of worker-threads
+        :param int max_size: max amount of pending (i.e. not yet started) work-items
+        :param BackpressurePolicy backpressure_policy: behaviour if queue is full
+        :param float block_timeout_seconds: max time to block submitter (for policy `BLOCK`)
+        '''
+        self.max_size = max_size
+        self.backpressure_policy = BackpressurePolicy(backpressure_policy)
+        self.block_timeout_seconds = block_timeout_seconds
+
+        self._cv = threading.Condition()
+        self._heap = [] # [(priority, seq, _WorkItem)]
+        self._seq = itertools.count()
+        self._pending = {} # {key: _WorkItem} (only for items w/ key)
+        self._size = 0 # amount of pending (neither started, nor dropped) items
+
+        self._counters = collections.Counter()
+        self._in_progress = 0
+        self._wait_seconds = collections.deque(maxlen=1024)
+        self._processing_seconds = collections.deque(maxlen=1024)
+
+        self._workers = [
+            threading.Thread(
+                target=self._work,
+                name=f'{name}-{idx}',
+                daemon=True,
+            ) for idx in range(worker_count)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def submit(
+        self,
+        func: collections.abc.Callable,
+        priority: Priority=Priority.NORMAL,
+        key: collections.abc.Hashable | None=None,
+        merge: collections.abc.Callable[[dict, dict], dict] | None=None,
+        **kwargs,
+    ):
+        '''
+        schedules `func(**kwargs)` for execution.
+
+        If a pending work-item w/ same `key` exists, it is coalesced w/ the submitted one (i.e.
+        the pending work-item's kwargs are replaced by the submitted ones, or, if `merge` is
+        passed, by the result of `merge(pending_kwargs, submitted_kwargs)`).
+
+        Raises `QueueFullError` if the work-item was rejected (see `BackpressurePolicy`).
+        '''
+        with self._cv:
+            if key is not None and (pending := self._pending.get(key)):
+                pending.kwargs = merge(pending.kwargs, kwargs) if merge else kwargs
+                if priority < pending.priority:
+                    # add another heap-entry (stale one will be skipped, as item will be done)
+                    pending.priority = priority
+                    heapq.heappush(self._heap, (priority, next(self._seq), pending))
+                    self._cv.notify_all()
+                self._counters['coalesced'] += 1
+                return
+
+            if self._size >= self.max_size:
+                self._apply_backpressure(priority=priority)
+
+            item = _WorkItem(
+                func=func,
+                kwargs=kwargs,
+                priority=priority,
+                key=key,
+                enqueued=time.monotonic(),
+            )
+            heapq.heappush(self._heap, (priority, next(self._seq), item))
+            if key is not None:
+                self._pending[key] = item
+            self._size += 1
+            self._counters['submitted'] += 1
+
+            self._cv.notify_all()
+
+    def _apply_backpressure(
+        self,
+        priority: Priority,
+    ):
+        # must be called w/ lock being held
+        if self.backpressure_policy is BackpressurePolicy.BLOCK:
+            if self._cv.wait_for(
+                lambda: self._size < self.max_size,
+                timeout=self.block_timeout_seconds,
+            ):
+                return
+        elif self.backpressure_policy is BackpressurePolicy.DROP_OLDEST:
+            candidates = [
+                item for item in self._pending_items()
+                if item.priority >= priority
+            ]
+            if candidates:
+                dropped = max(candidates, key=lambda item: (item.priority, -item.enqueued))
+                self._take(dropped)
+                self._counters['dropped'] += 1
+                logger.warning(f'queue is full - dropped {dropped.func.__name__} ({dropped.key=})')
+                return
+        elif self.backpressure_policy is not BackpressurePolicy.REJECT:
+            raise NotImplementedError(self.backpressure_policy)
+
+        self._counters['rejected'] += 1
+        raise QueueFullError(f'{self.max_size=} exceeded')
+
+    def _pending_items(self) -> list[_WorkItem]:
+        # must be called w/ lock being held; heap might contain multiple entries per item
+        return list({
+            id(item): item for _, _, item in self._heap
+            if not item.done
+        }.values())
+
+    def _take(
+        self,
+        item: _WorkItem,
+    ):
+        # must be called w/ lock being held; heap-entries are removed lazily
+        item.done = True
+        self._size -= 1
+        if item.key is not None and self._pending.get(item.key) is item:
+            del self._pending[item.key]
+
+    def _next_item(self) -> _WorkItem:
+        with self._cv:
+            while True:
+                self._cv.wait_for(lambda: self._heap)
+                _, _, item = heapq.heappop(self._heap)
+                if item.done:
+                    continue
+
+                self._take(item)
+                self._in_progress += 1
+                self._wait_seconds.append(time.monotonic() - item.enqueued)
+                self._cv.notify_all() # wake-up blocked submitters
+                return item
+
+    def _work(self):
+        while True:
+            item = self._next_item()
+            start = time.monotonic()
+            try:
+                item.func(**item.kwargs)
+                succeeded = True
+            except Exception:
+                logger.exception(f'error while processing {item.func.__name__} ({item.key=})')
+                succeeded = False
+
+            with self._cv:
+                self._in_progress -= 1
+                self._counters['processed' if succeeded else 'failed'] += 1
+                self._processing_seconds.append(time.monotonic() - start)
+                self._cv.notify_all()
+
+    def join(
+        self,
+        timeout: float | None=None,
+    ) -> bool:
+        '''
+        blocks until all submitted work-items were processed (or timeout expired). Returns
+        whether queue is drained.
+        '''
+        with self._cv:
+            return self._cv.wait_for(
+                lambda: self._size == 0 and self._in_progress == 0,
+                timeout=timeout,
+            )
+
+    def metrics(self) -> dict:
+        def summary(values: collections.abc.Sequence[float]) -> dict:
+            if not values:
+                return {'mean': None, 'max': None}
+            return {
+                'mean': statistics.fmean(values),
+                'max': max(values),
+            }
+
+        with self._cv:
+            pending_items = self._pending_items()
+            depth_by_priority = collections.Counter(
+                item.priority.name.lower() for item in pending_items
+            )
+            oldest = min((item.enqueued for item in pending_items), default=None)
+
+            return {
+                'queue_depth': self._size,
+                'queue_depth_by_priority': dict(depth_by_priority),
+                'max_size': self.max_size,
+                'in_progress': self._in_progress,
+                'workers': len(self._workers),
+                'oldest_pending_seconds': time.monotonic() - oldest if oldest else None,
+                'wait_seconds': summary(self._wait_seconds),
+                'processing_seconds': summary(self._processing_seconds),
+                **{
+                    counter: self._counters[counter]
+                    for counter in (
+                        'submitted',
+                        'coalesced',
+                        'processed',
+                        'failed',
+                        'rejected',
+                        'dropped',
+                    )
+                },
+            }